@@ -0,0 +1,80 @@
+# benchmarks/bench_decoders.py
+"""
+Compares the JSON decoder backends on overview/history payloads.
+
+For every installed backend it reports the time to decode the body alone and to
+decode and parse it into models (eager and lazy). Pass recorded responses as
+`endpoint=path.json` arguments; without arguments synthetic fixtures are used.
+
+    python benchmarks/bench_decoders.py
+    python benchmarks/bench_decoders.py itemoverview=BaseType.json currencyoverview=Currency.json
+"""
+
+import sys
+import os
+import timeit
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+src_path = os.path.join(project_root, "src")
+for path in (src_path, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fixtures
+from poe_ninja_client.client import _parse_endpoint_payload
+from poe_ninja_client.decoders import available_decoders, get_decoder
+
+
+def synthetic_payloads() -> list[tuple[str, str, bytes]]:
+    return [
+        (
+            "currency x100",
+            "currencyoverview",
+            fixtures.encode(fixtures.currency_overview(100)),
+        ),
+        ("items x1k", "itemoverview", fixtures.encode(fixtures.item_overview(1_000))),
+        ("items x20k", "itemoverview", fixtures.encode(fixtures.item_overview(20_000))),
+        ("history x365", "itemhistory", fixtures.encode(fixtures.history(365))),
+    ]
+
+
+def recorded_payloads(arguments: list[str]) -> list[tuple[str, str, bytes]]:
+    payloads: list[tuple[str, str, bytes]] = []
+    for argument in arguments:
+        endpoint, _, path = argument.partition("=")
+        with open(path, "rb") as f:
+            payloads.append((os.path.basename(path), endpoint, f.read()))
+    return payloads
+
+
+def best_ms(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1000
+
+
+def main(arguments: list[str]) -> None:
+    payloads = recorded_payloads(arguments) if arguments else synthetic_payloads()
+    backends = available_decoders()
+    print(
+        f"{'payload':<16}{'KiB':>8}  {'backend':<9}"
+        f"{'decode ms':>11}{'+parse ms':>11}{'+lazy ms':>10}"
+    )
+    for label, endpoint, body in payloads:
+        number = max(1, 2_000_000 // max(len(body), 1))
+        for backend in backends:
+            decode = get_decoder(backend)
+            decode_ms = best_ms(lambda: decode(body), number)
+            parse_ms = best_ms(
+                lambda: _parse_endpoint_payload(endpoint, decode(body)), number
+            )
+            lazy_ms = best_ms(
+                lambda: _parse_endpoint_payload(endpoint, decode(body), lazy=True),
+                number,
+            )
+            print(
+                f"{label:<16}{len(body) / 1024:>8.0f}  {backend:<9}"
+                f"{decode_ms:>11.2f}{parse_ms:>11.2f}{lazy_ms:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
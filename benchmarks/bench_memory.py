@@ -0,0 +1,232 @@
+# benchmarks/bench_memory.py
+"""
+Per-instance memory and construction cost of the model classes.
+
+Each slotted model is compared against an otherwise identical frozen dataclass
+with a per-instance __dict__ (the layout the models used before they were slotted).
+Sparklines are compared against the list-backed dataclass they used to be, parsing
+the same raw JSON both ways. Finally, the memory kept by repeated polls of one item
+overview is measured with and without a StringTable interning the repeated fields.
+
+    python benchmarks/bench_memory.py [instances] [polls]
+"""
+
+import dataclasses
+import json
+import random
+import sys
+import os
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+src_path = os.path.join(project_root, "src")
+for path in (src_path, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fixtures
+from poe_ninja_client.models import (
+    SparkLineData,
+    CurrencyTradeData,
+    CurrencyLine,
+    CurrencyDetail,
+    ItemSparkLine,
+    ItemLine,
+    PoeNinjaHistoryDataPoint,
+    StringTable,
+    _SparkLineBuffer,
+    parse_item_overview_response,
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ListSparkLine:
+    """The sparkline layout before points moved into a shared buffer."""
+
+    data: list[float] = dataclasses.field(default_factory=list)
+    totalChange: float = 0.0
+
+
+def unslotted_twin(cls: type) -> type:
+    """Rebuilds `cls` as a frozen dataclass without __slots__."""
+    fields = [
+        (
+            f.name,
+            f.type,
+            dataclasses.field(default=f.default, default_factory=f.default_factory),
+        )
+        for f in dataclasses.fields(cls)
+    ]
+    return dataclasses.make_dataclass(cls.__name__ + "Dict", fields, frozen=True)
+
+
+def sample_kwargs() -> dict[type, dict[str, Any]]:
+    spark = dict(data=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], totalChange=7.0)
+    trade = dict(
+        id=1,
+        league_id=2,
+        pay_currency_id=3,
+        get_currency_id=1,
+        sample_time_utc="2024-01-01T00:00:00Z",
+        count=10,
+        value=200.0,
+        data_point_count=1,
+        includes_secondary=False,
+        listing_count=50,
+    )
+    currency_line = dict(
+        currencyTypeName="Divine Orb",
+        pay=None,
+        receive=None,
+        paySparkLine=SparkLineData(**spark),
+        receiveSparkLine=SparkLineData(**spark),
+        chaosEquivalent=200.0,
+        lowConfidencePaySparkLine=SparkLineData(**spark),
+        lowConfidenceReceiveSparkLine=SparkLineData(**spark),
+        detailsId="divine-orb",
+    )
+    item_line = dict(
+        id=1000,
+        name="The Squire",
+        icon="https://web.poecdn.com/image.png",
+        levelRequired=60,
+        baseType="Elegant Round Shield",
+        itemClass=3,
+        sparkline=ItemSparkLine(**spark),
+        lowConfidenceSparkline=ItemSparkLine(**spark),
+        itemType="Shield",
+        chaosValue=1234.5,
+        divineValue=6.1,
+        count=20,
+        detailsId="the-squire",
+    )
+    return {
+        CurrencyTradeData: trade,
+        CurrencyLine: currency_line,
+        CurrencyDetail: dict(id=2, name="Divine Orb", icon=None, tradeId="divine"),
+        ItemLine: item_line,
+        PoeNinjaHistoryDataPoint: dict(daysAgo=3, value=201.5),
+    }
+
+
+def bytes_per_instance(factory: Callable[[], Any], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_overhead = sys.getsizeof(instances)
+    return (after - before - list_overhead) / count
+
+
+def construction_ns(factory: Callable[[], Any], count: int) -> float:
+    return min(timeit.repeat(factory, number=count, repeat=5)) / count * 1e9
+
+
+def raw_sparklines(count: int) -> list[dict[str, Any]]:
+    """Sparkline JSON as the decoder returns it: distinct float objects per point."""
+    rng = random.Random(7)
+    sparklines = [
+        {
+            "data": [round(rng.uniform(-20, 20), 2) for _ in range(7)],
+            "totalChange": round(rng.uniform(-50, 50), 2),
+        }
+        for _ in range(count)
+    ]
+    return json.loads(json.dumps(sparklines))
+
+
+def parse_list_sparklines(raw: list[dict[str, Any]]) -> list[ListSparkLine]:
+    return [
+        ListSparkLine(
+            data=[v if v is not None else 0.0 for v in sparkline.get("data", [])],
+            totalChange=sparkline.get("totalChange", 0.0),
+        )
+        for sparkline in raw
+    ]
+
+
+def parse_buffer_sparklines(raw: list[dict[str, Any]]) -> list[ItemSparkLine]:
+    buffer = _SparkLineBuffer(ItemSparkLine)
+    sparklines = [buffer.add(sparkline) for sparkline in raw]
+    buffer.finish()
+    return sparklines  # type: ignore[return-value]
+
+
+def sparkline_comparison(count: int) -> None:
+    print(f"\n{'sparklines':<26}{'list B':>9}{'buffer B':>9}{'saved':>8}{'list ns':>10}{'buffer ns':>10}")
+    raw = raw_sparklines(count)
+    row: list[float] = []
+    for parse in (parse_list_sparklines, parse_buffer_sparklines):
+        # Keep a fresh decode alive so floats shared with the JSON are not counted
+        # as freed; the models of a real response outlive its raw JSON.
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        sparklines = parse(raw_sparklines(count))
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        row.append((after - before - sys.getsizeof(sparklines)) / count)
+        del sparklines
+    timings = [
+        min(timeit.repeat(lambda: parse(raw), number=1, repeat=5)) / count * 1e9
+        for parse in (parse_list_sparklines, parse_buffer_sparklines)
+    ]
+    print(
+        f"{'7 points each':<26}{row[0]:>9.0f}{row[1]:>9.0f}{1 - row[1] / row[0]:>8.0%}"
+        f"{timings[0]:>10.0f}{timings[1]:>10.0f}"
+    )
+
+
+def retained_by_polls(body: bytes, polls: int, strings: StringTable | None) -> float:
+    """Bytes kept per poll when every parsed response of `polls` is held."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    responses = [
+        parse_item_overview_response(json.loads(body), strings=strings)
+        for _ in range(polls)
+    ]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del responses
+    return (after - before) / polls
+
+
+def polls_comparison(polls: int) -> None:
+    body = fixtures.encode(fixtures.item_overview(2000))
+    print(f"\n{'repeated polls':<26}{'plain KiB':>10}{'interned':>10}{'saved':>8}")
+    plain = retained_by_polls(body, polls, None)
+    interned = retained_by_polls(body, polls, StringTable())
+    print(
+        f"{f'2000 lines x {polls}':<26}{plain / 1024:>10.0f}{interned / 1024:>10.0f}"
+        f"{1 - interned / plain:>8.0%}"
+    )
+
+
+def main(count: int = 100_000, polls: int = 10) -> None:
+    print(
+        f"{'model':<26}{'dict B':>9}{'slots B':>9}{'saved':>8}"
+        f"{'dict ns':>10}{'slots ns':>10}"
+    )
+    for cls, kwargs in sample_kwargs().items():
+        twin = unslotted_twin(cls)
+        slotted_factory = lambda: cls(**kwargs)
+        dict_factory = lambda: twin(**kwargs)
+        dict_bytes = bytes_per_instance(dict_factory, count)
+        slot_bytes = bytes_per_instance(slotted_factory, count)
+        print(
+            f"{cls.__name__:<26}{dict_bytes:>9.0f}{slot_bytes:>9.0f}"
+            f"{1 - slot_bytes / dict_bytes:>8.0%}"
+            f"{construction_ns(dict_factory, count // 10):>10.0f}"
+            f"{construction_ns(slotted_factory, count // 10):>10.0f}"
+        )
+    sparkline_comparison(count)
+    polls_comparison(polls)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,253 @@
+# benchmarks/fixtures.py
+"""
+Deterministic poe.ninja-shaped payloads for offline benchmarks.
+
+The generators mirror the structure of real currencyoverview, itemoverview and
+history responses (field names, nesting, nulls in sparklines, repeated base types
+and icons) so parser and decoder costs are representative without network access.
+"""
+
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+# Responses saved by record_fixtures.py; used instead of the synthetic payloads
+# when present.
+RECORDED_DIR: str = os.path.join(os.path.dirname(__file__), "recorded")
+MANIFEST_NAME: str = "manifest.json"
+
+_CURRENCY_ANCHORS: dict[str, float] = {
+    "Divine Orb": 200.0,
+    "Exalted Orb": 15.0,
+    "Mirror of Kalandra": 50000.0,
+}
+
+
+def _sparkline(rng: random.Random) -> dict[str, Any]:
+    return {
+        "data": [
+            round(rng.uniform(-20, 20), 2) if rng.random() > 0.1 else None
+            for _ in range(7)
+        ],
+        "totalChange": round(rng.uniform(-50, 50), 2),
+    }
+
+
+def _trade_data(rng: random.Random, index: int, value: float) -> dict[str, Any]:
+    return {
+        "id": index,
+        "league_id": 1,
+        "pay_currency_id": index + 1,
+        "get_currency_id": 1,
+        "sample_time_utc": "2024-08-01T12:00:00Z",
+        "count": rng.randint(1, 200),
+        "value": value,
+        "data_point_count": 1,
+        "includes_secondary": False,
+        "listing_count": rng.randint(1, 900),
+    }
+
+
+def currency_overview(lines: int = 100, seed: int = 1) -> dict[str, Any]:
+    rng = random.Random(seed)
+    names = list(_CURRENCY_ANCHORS) + [
+        f"Currency {index}" for index in range(max(0, lines - len(_CURRENCY_ANCHORS)))
+    ]
+    payload_lines: list[dict[str, Any]] = []
+    details: list[dict[str, Any]] = [
+        {
+            "id": 1,
+            "icon": "https://web.poecdn.com/gen/image/chaos-orb.png",
+            "name": "Chaos Orb",
+            "tradeId": "chaos",
+        }
+    ]
+    for index, name in enumerate(names, start=1):
+        value = _CURRENCY_ANCHORS.get(name, round(rng.uniform(0.05, 150.0), 3))
+        details_id = name.lower().replace(" ", "-")
+        payload_lines.append(
+            {
+                "currencyTypeName": name,
+                "pay": _trade_data(rng, index, 1 / value),
+                "receive": _trade_data(rng, index, value),
+                "paySparkLine": _sparkline(rng),
+                "receiveSparkLine": _sparkline(rng),
+                "chaosEquivalent": value,
+                "lowConfidencePaySparkLine": _sparkline(rng),
+                "lowConfidenceReceiveSparkLine": _sparkline(rng),
+                "detailsId": details_id,
+            }
+        )
+        details.append(
+            {
+                "id": index + 1,
+                "icon": f"https://web.poecdn.com/gen/image/{details_id}.png",
+                "name": name,
+                "tradeId": details_id,
+            }
+        )
+    return {
+        "lines": payload_lines,
+        "currencyDetails": details,
+        "language": {"name": "en", "translations": {}},
+    }
+
+
+def item_overview(lines: int = 1000, seed: int = 2) -> dict[str, Any]:
+    rng = random.Random(seed)
+    base_types = [f"Base Type {index}" for index in range(60)]
+    variants = [None, None, "1 link", "5 links", "6 links", "20/20", "Corrupted"]
+    payload_lines: list[dict[str, Any]] = []
+    for index in range(lines):
+        base_type = base_types[index % len(base_types)]
+        variant = variants[index % len(variants)]
+        payload_lines.append(
+            {
+                "id": 10_000 + index,
+                "name": f"Item {index // 3}",
+                "icon": f"https://web.poecdn.com/gen/image/{base_type.replace(' ', '')}.png",
+                "mapTier": None,
+                "levelRequired": rng.choice([1, 28, 60, 68]),
+                "baseType": base_type,
+                "stackSize": None,
+                "variant": variant,
+                "artFilename": f"Art{index % 40}" if index % 4 == 0 else None,
+                "links": 6 if variant == "6 links" else None,
+                "itemClass": rng.choice([3, 4, 5]),
+                "sparkline": _sparkline(rng),
+                "lowConfidenceSparkline": _sparkline(rng),
+                "implicitModifiers": [
+                    {"text": "+(20-30) to maximum Life", "optional": False}
+                ],
+                "explicitModifiers": [
+                    {
+                        "text": f"+{rng.randint(10, 90)}% increased Armour",
+                        "optional": False,
+                    },
+                    {"text": "Adds 1 to 4 Lightning Damage", "optional": False},
+                ],
+                "flavourText": "The frail, the infirm, the weak...",
+                "corrupted": variant == "Corrupted",
+                "gemLevel": 20 if variant == "20/20" else None,
+                "gemQuality": 20 if variant == "20/20" else None,
+                "itemType": rng.choice(["Shield", "Body Armour", "Helmet", "Boots"]),
+                "chaosValue": round(rng.uniform(1, 5000), 2),
+                "exaltedValue": round(rng.uniform(0, 300), 2),
+                "divineValue": round(rng.uniform(0, 25), 2),
+                "count": rng.randint(1, 300),
+                "detailsId": f"item-{index}",
+                "tradeInfo": [],
+                "listingCount": rng.randint(1, 1200),
+            }
+        )
+    return {"lines": payload_lines, "language": {"name": "en", "translations": {}}}
+
+
+def history(days: int = 365, seed: int = 3) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "count": rng.randint(1, 100),
+            "value": round(rng.uniform(1, 500), 3),
+            "daysAgo": day,
+        }
+        for day in range(days)
+    ]
+
+
+def currency_history(days: int = 365, seed: int = 4) -> dict[str, Any]:
+    return {
+        "payCurrencyGraphData": history(days, seed),
+        "receiveCurrencyGraphData": history(days, seed + 1),
+    }
+
+
+def encode(payload: Any) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class Fixture:
+    """One response body and the request that produces it."""
+
+    name: str
+    endpoint: str
+    params: dict[str, str]
+    body: bytes = field(repr=False)
+    recorded: bool = False
+
+    @property
+    def lines(self) -> int:
+        """Number of overview lines or history points in the body."""
+        payload = json.loads(self.body)
+        if isinstance(payload, list):
+            return len(payload)
+        if "lines" in payload:
+            return len(payload["lines"])
+        return sum(len(points or ()) for points in payload.values())
+
+
+def synthetic_fixtures() -> list[Fixture]:
+    """Size-varied stand-ins for every endpoint the client calls."""
+    return [
+        Fixture(
+            "currency-small",
+            "currencyoverview",
+            {"type": "Fragment"},
+            encode(currency_overview(60)),
+        ),
+        Fixture(
+            "currency",
+            "currencyoverview",
+            {"type": "Currency"},
+            encode(currency_overview(200)),
+        ),
+        Fixture(
+            "items-medium",
+            "itemoverview",
+            {"type": "UniqueArmour"},
+            encode(item_overview(1_000)),
+        ),
+        Fixture(
+            "items-huge",
+            "itemoverview",
+            {"type": "BaseType"},
+            encode(item_overview(20_000)),
+        ),
+        Fixture(
+            "currency-history-long",
+            "currencyhistory",
+            {"type": "Currency", "currencyId": "2"},
+            encode(currency_history(1_000)),
+        ),
+        Fixture(
+            "item-history-long",
+            "itemhistory",
+            {"type": "BaseType", "itemId": "10000"},
+            encode(history(1_000)),
+        ),
+    ]
+
+
+def recorded_fixtures(directory: str = RECORDED_DIR) -> list[Fixture]:
+    """Loads the responses saved by record_fixtures.py, or [] if there are none."""
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return []
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    fixtures: list[Fixture] = []
+    for entry in manifest["fixtures"]:
+        with open(os.path.join(directory, entry["file"]), "rb") as f:
+            body = f.read()
+        fixtures.append(
+            Fixture(entry["name"], entry["endpoint"], entry["params"], body, True)
+        )
+    return fixtures
+
+
+def load_fixtures(directory: str = RECORDED_DIR) -> list[Fixture]:
+    """Recorded fixtures if any were saved, else the synthetic ones."""
+    return recorded_fixtures(directory) or synthetic_fixtures()
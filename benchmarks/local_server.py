@@ -0,0 +1,114 @@
+# benchmarks/local_server.py
+"""
+A local HTTP stand-in for poe.ninja that serves benchmark fixtures.
+
+Requests are matched on the endpoint and the `type` parameter (history requests on
+the endpoint alone); the league is ignored. Bodies carry an ETag and
+If-None-Match is answered with 304, so conditional revalidation can be measured.
+History requests for one of `unknown_ids` are answered with 404, standing in for
+ids poe.ninja does not know.
+
+    with LocalPoeNinja(fixtures.load_fixtures()) as server:
+        client = PoENinja("Standard")
+        client.BASE_URL = server.base_url
+"""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import Fixture
+
+
+def _route(endpoint: str, params: dict[str, str]) -> tuple[str, Optional[str]]:
+    if endpoint.endswith("history"):
+        return endpoint, None
+    return endpoint, params.get("type")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    routes: dict[tuple[str, Optional[str]], tuple[bytes, str]]
+    unknown_ids: frozenset[str]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, as poe.ninja does
+    server: _Server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        route = self.server.routes.get(_route(url.path.rsplit("/", 1)[-1], params))
+        history_id = params.get("currencyId", params.get("itemId"))
+        if route is None or history_id in self.server.unknown_ids:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body, etag = route
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalPoeNinja:
+    """Serves fixtures on 127.0.0.1 from a background thread."""
+
+    def __init__(
+        self,
+        fixtures: Iterable[Fixture],
+        port: int = 0,
+        unknown_ids: Iterable[int] = (),
+    ):
+        self._server = _Server(("127.0.0.1", port), _Handler)
+        self._server.unknown_ids = frozenset(str(item_id) for item_id in unknown_ids)
+        self._server.routes = {
+            _route(fixture.endpoint, fixture.params): (
+                fixture.body,
+                '"' + hashlib.sha1(fixture.body).hexdigest() + '"',
+            )
+            for fixture in fixtures
+        }
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/data"
+
+    def start(self) -> "LocalPoeNinja":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="local-poe-ninja", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalPoeNinja":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -0,0 +1,81 @@
+# benchmarks/record_fixtures.py
+"""
+Records real poe.ninja responses as benchmark fixtures.
+
+Saves one small and one large overview per endpoint plus a currency and an item
+history into benchmarks/recorded/ and writes a manifest. run_benchmarks.py and the
+local server use these files instead of the synthetic payloads once they exist.
+Re-run it at the start of a league to refresh the sizes.
+
+    python benchmarks/record_fixtures.py [league] [output directory]
+"""
+
+import json
+import os
+import sys
+from typing import Any
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+src_path = os.path.join(project_root, "src")
+for path in (src_path, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fixtures
+from poe_ninja_client import CurrencyType, ItemType, PoENinja
+
+
+def record(league: str, directory: str) -> list[dict[str, Any]]:
+    client = PoENinja(league, use_cache=False)
+    requests: list[tuple[str, str, dict[str, str]]] = [
+        ("currency-small", "currencyoverview", {"type": CurrencyType.FRAGMENT.value}),
+        ("currency", "currencyoverview", {"type": CurrencyType.CURRENCY.value}),
+        ("items-medium", "itemoverview", {"type": ItemType.UNIQUE_ARMOUR.value}),
+        ("items-huge", "itemoverview", {"type": ItemType.BASE_TYPE.value}),
+    ]
+    divine_id = client.get_currency_id_by_name("Divine Orb", CurrencyType.CURRENCY)
+    if divine_id is not None:
+        requests.append(
+            (
+                "currency-history-long",
+                "currencyhistory",
+                {"type": CurrencyType.CURRENCY.value, "currencyId": str(divine_id)},
+            )
+        )
+    armour = client.get_item_overview(ItemType.UNIQUE_ARMOUR)
+    if armour.lines:
+        requests.append(
+            (
+                "item-history-long",
+                "itemhistory",
+                {"type": ItemType.UNIQUE_ARMOUR.value, "itemId": str(armour.lines[0].id)},
+            )
+        )
+
+    os.makedirs(directory, exist_ok=True)
+    entries: list[dict[str, Any]] = []
+    with client:
+        for name, endpoint, params in requests:
+            response = client.session.get(
+                f"{client.BASE_URL}/{endpoint}",
+                params={"league": league, **params},
+                timeout=30,
+            )
+            response.raise_for_status()
+            file_name = f"{name}.json"
+            with open(os.path.join(directory, file_name), "wb") as f:
+                f.write(response.content)
+            entries.append(
+                {"name": name, "endpoint": endpoint, "params": params, "file": file_name}
+            )
+            print(f"{name:<24}{len(response.content) / 1024:>10.0f} KiB")
+    with open(os.path.join(directory, fixtures.MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump({"league": league, "fixtures": entries}, f, indent=2)
+    return entries
+
+
+if __name__ == "__main__":
+    record(
+        sys.argv[1] if len(sys.argv) > 1 else "Standard",
+        sys.argv[2] if len(sys.argv) > 2 else fixtures.RECORDED_DIR,
+    )
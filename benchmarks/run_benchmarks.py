@@ -0,0 +1,335 @@
+# benchmarks/run_benchmarks.py
+"""
+Offline benchmark suite with machine-readable results.
+
+For every fixture (recorded responses if record_fixtures.py has been run, synthetic
+ones otherwise) it measures:
+
+* parse: decode and parse throughput (lines/s), eager and lazy, with tracemalloc
+  peak/retained allocations and the peak RSS growth of a fresh process.
+* e2e: client latency against a local HTTP stand-in (local_server.py) for a full
+  download, a 304 revalidation, a memory cache hit and, for item overviews,
+  streaming with iter_item_overview.
+
+Results are written as JSON (to stdout, or to --output) together with the commit
+and interpreter they were measured on. Pass --compare to diff two result files.
+
+    python benchmarks/run_benchmarks.py --output results/$(git rev-parse --short HEAD).json
+    python benchmarks/run_benchmarks.py --compare results/base.json results/head.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+src_path = os.path.join(project_root, "src")
+for path in (src_path, os.path.dirname(__file__)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fixtures
+from fixtures import Fixture
+from local_server import LocalPoeNinja
+from poe_ninja_client import ItemType, PoENinja
+from poe_ninja_client.cache import make_cache_key
+from poe_ninja_client.client import _parse_endpoint_payload
+from poe_ninja_client.decoders import _AUTO_ORDER, available_decoders, get_decoder
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+SCHEMA_VERSION: int = 1
+LEAGUE: str = "Standard"
+
+# Metrics shown by --compare, and whether a larger value is better.
+COMPARED_METRICS: dict[str, bool] = {
+    "lines_per_s": True,
+    "lazy_lines_per_s": True,
+    "alloc_peak_bytes": False,
+    "retained_bytes": False,
+    "peak_rss_bytes": False,
+    "rss_growth_bytes": False,
+    "p50_ms": False,
+    "p95_ms": False,
+}
+
+
+def timed_runs(function: Callable[[], Any], repeat: int) -> list[float]:
+    """Runs `function` `repeat` times and returns the wall time of each run in seconds."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _maxrss_bytes() -> Optional[int]:
+    # Linux carries ru_maxrss over from the parent across fork+exec, so prefer the
+    # high-water mark of this address space.
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024  # KiB on Linux
+
+
+def _rss_worker(endpoint: str, path: str, decoder: str) -> tuple[int, int]:
+    # Runs in a fresh process so the high-water mark belongs to this parse alone.
+    # The body is read from a file: unpickling it from the parent would leave
+    # freed buffers behind that the parse could reuse.
+    decode = get_decoder(decoder)
+    with open(path, "rb") as f:
+        body = f.read()
+    before = _maxrss_bytes() or 0
+    result = _parse_endpoint_payload(endpoint, decode(body))
+    after = _maxrss_bytes() or 0
+    del result
+    return after, after - before
+
+
+def peak_rss(fixture: Fixture, decoder: str) -> tuple[Optional[int], Optional[int]]:
+    """Returns (peak RSS, peak RSS growth during the parse) of a fresh process."""
+    if resource is None:
+        return None, None
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        f.write(fixture.body)
+    try:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            return pool.apply(_rss_worker, (fixture.endpoint, f.name, decoder))
+    finally:
+        os.remove(f.name)
+
+
+def allocations(function: Callable[[], Any]) -> tuple[int, int]:
+    """Returns (peak, retained) bytes allocated by `function` under tracemalloc."""
+    tracemalloc.start()
+    try:
+        result = function()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def bench_parse(fixture: Fixture, decoder: str, repeat: int) -> dict[str, Any]:
+    decode = get_decoder(decoder)
+    body, endpoint, lines = fixture.body, fixture.endpoint, fixture.lines
+    decode_s = min(timed_runs(lambda: decode(body), repeat))
+    parse_s = min(
+        timed_runs(lambda: _parse_endpoint_payload(endpoint, decode(body)), repeat)
+    )
+    lazy_s = min(
+        timed_runs(
+            lambda: _parse_endpoint_payload(endpoint, decode(body), lazy=True), repeat
+        )
+    )
+    alloc_peak, retained = allocations(
+        lambda: _parse_endpoint_payload(endpoint, decode(body))
+    )
+    rss, rss_growth = peak_rss(fixture, decoder)
+    return {
+        "name": fixture.name,
+        "endpoint": endpoint,
+        "recorded": fixture.recorded,
+        "bytes": len(body),
+        "lines": lines,
+        "decode_ms": decode_s * 1000,
+        "parse_ms": parse_s * 1000,
+        "lazy_parse_ms": lazy_s * 1000,
+        "lines_per_s": lines / parse_s,
+        "lazy_lines_per_s": lines / lazy_s,
+        "alloc_peak_bytes": alloc_peak,
+        "retained_bytes": retained,
+        "peak_rss_bytes": rss,
+        "rss_growth_bytes": rss_growth,
+    }
+
+
+def latency_summary(timings: list[float]) -> dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+
+
+def bench_e2e(
+    fixture: Fixture, base_url: str, decoder: str, repeat: int
+) -> list[dict[str, Any]]:
+    params = {"league": LEAGUE, **fixture.params}
+    endpoint = fixture.endpoint
+    key = make_cache_key(endpoint, params)
+    results: list[dict[str, Any]] = []
+
+    def record(mode: str, timings: list[float]) -> None:
+        results.append(
+            {"name": fixture.name, "endpoint": endpoint, "mode": mode}
+            | latency_summary(timings)
+        )
+
+    with PoENinja(LEAGUE, use_cache=False, json_decoder=decoder) as client:
+        client.BASE_URL = base_url
+        client._fetch(endpoint, params)  # Open the connection
+        record("download", timed_runs(lambda: client._fetch(endpoint, params), repeat))
+
+    with PoENinja(LEAGUE, json_decoder=decoder) as client:
+        client.BASE_URL = base_url
+        client._fetch(endpoint, params)
+        record(
+            "revalidate",
+            timed_runs(
+                lambda: client._fetch_uncached(endpoint, params, key, revalidate=True),
+                repeat,
+            ),
+        )
+        record("cache_hit", timed_runs(lambda: client._fetch(endpoint, params), repeat))
+
+        if endpoint == "itemoverview":
+            item_type = ItemType(fixture.params["type"])
+            record(
+                "stream",
+                timed_runs(
+                    lambda: sum(1 for _ in client.iter_item_overview(item_type)), repeat
+                ),
+            )
+    return results
+
+
+def resolve_decoder(decoder: str) -> str:
+    """Names the backend that "auto" picks, so results say what was measured."""
+    if decoder != "auto":
+        return decoder
+    available = available_decoders()
+    return next(name for name in _AUTO_ORDER if name in available)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    decoder: str, repeat: int, names: Optional[list[str]], skip_e2e: bool
+) -> dict[str, Any]:
+    selected = [
+        fixture
+        for fixture in fixtures.load_fixtures()
+        if names is None or fixture.name in names
+    ]
+    results: dict[str, Any] = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "decoder": resolve_decoder(decoder),
+            "repeat": repeat,
+        },
+        "parse": [],
+        "e2e": [],
+    }
+    for fixture in selected:
+        print(f"parse {fixture.name}", file=sys.stderr)
+        results["parse"].append(bench_parse(fixture, decoder, repeat))
+    if not skip_e2e:
+        with LocalPoeNinja(selected) as server:
+            for fixture in selected:
+                print(f"e2e   {fixture.name}", file=sys.stderr)
+                results["e2e"].extend(
+                    bench_e2e(fixture, server.base_url, decoder, repeat)
+                )
+    return results
+
+
+def _index(results: dict[str, Any]) -> dict[tuple[str, str, str], dict[str, Any]]:
+    index: dict[tuple[str, str, str], dict[str, Any]] = {}
+    for row in results["parse"]:
+        index[("parse", row["name"], "")] = row
+    for row in results["e2e"]:
+        index[("e2e", row["name"], row["mode"])] = row
+    return index
+
+
+def compare(base_path: str, head_path: str) -> None:
+    """Prints the relative change of every shared metric between two result files."""
+    with open(base_path, encoding="utf-8") as f:
+        base = _index(json.load(f))
+    with open(head_path, encoding="utf-8") as f:
+        head = _index(json.load(f))
+    print(f"{'benchmark':<44}{'metric':<18}{'base':>14}{'head':>14}{'change':>9}")
+    for key in sorted(base.keys() & head.keys()):
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = base[key].get(metric), head[key].get(metric)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            worse = change < 0 if higher_is_better else change > 0
+            flag = " !" if worse and abs(change) >= 0.05 else ""
+            label = " ".join(part for part in key if part)
+            print(
+                f"{label:<44}{metric:<18}{old:>14.4g}{new:>14.4g}{change:>+9.1%}{flag}"
+            )
+
+
+def main(arguments: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Write JSON results here instead of stdout.")
+    parser.add_argument("--decoder", default="auto", help="JSON backend to use.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement.")
+    parser.add_argument(
+        "--fixture", action="append", dest="names", help="Only run these fixtures."
+    )
+    parser.add_argument("--skip-e2e", action="store_true", help="Only parse benchmarks.")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BASE", "HEAD"), help="Compare two result files."
+    )
+    options = parser.parse_args(arguments)
+    if options.compare:
+        compare(*options.compare)
+        return
+    results = run(options.decoder, options.repeat, options.names, options.skip_e2e)
+    text = json.dumps(results, indent=2)
+    if options.output:
+        os.makedirs(os.path.dirname(os.path.abspath(options.output)), exist_ok=True)
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,7 +1,26 @@
 # src/poe_ninja_client/__init__.py
 
 from .client import PoENinja
-from .exceptions import PoeNinjaError, PoeNinjaRequestError, PoeNinjaAPIError
+from .async_client import AsyncPoENinja
+from .pool import PoENinjaPool
+from .cache import ResponseCache, DEFAULT_TTLS
+from .disk_cache import DiskCache, DiskCacheEntry
+from .decoders import JsonDecoder, available_decoders, get_decoder
+from .ratelimit import RateLimiter, RetryPolicy
+from .refresher import BackgroundRefresher
+from .instrumentation import (
+    ClientStats,
+    EndpointStats,
+    OpenTelemetryHook,
+    RequestEvent,
+    RequestHook,
+)
+from .exceptions import (
+    PoeNinjaError,
+    PoeNinjaRequestError,
+    PoeNinjaAPIError,
+    RateLimitError,
+)
 from .enums import (
     CurrencyType,
     ItemType,
@@ -17,17 +36,48 @@ from .models import (
     ItemLine,
     ItemOverviewResponse,
     PoeNinjaHistoryDataPoint,
+    HistorySeries,
+    LazyLines,
+    ColumnarItemLines,
+    ItemColumns,
+    StringTable,
     CurrencyHistoryResponse,
     ItemHistoryResponse,  # Updated History models
     JsonObject,
 )
+from .snapshot import LeagueSnapshot
+from .diff import LineChange, SnapshotDiff, diff_snapshots
+from .archive import ArchiveRecord, ArchiveSeries, SnapshotArchive
+from .pricing import PriceBook
 
 __all__ = [
     "PoENinja",
+    "AsyncPoENinja",
+    "PoENinjaPool",
+    # Caching
+    "ResponseCache",
+    "DEFAULT_TTLS",
+    "DiskCache",
+    "DiskCacheEntry",
+    # JSON decoding
+    "JsonDecoder",
+    "available_decoders",
+    "get_decoder",
+    "BackgroundRefresher",
+    # Instrumentation
+    "ClientStats",
+    "EndpointStats",
+    "OpenTelemetryHook",
+    "RequestEvent",
+    "RequestHook",
+    # Rate limiting and retries
+    "RateLimiter",
+    "RetryPolicy",
     # Exceptions
     "PoeNinjaError",
     "PoeNinjaRequestError",
     "PoeNinjaAPIError",
+    "RateLimitError",
     # Enums
     "CurrencyType",
     "ItemType",
@@ -41,9 +91,22 @@ __all__ = [
     "ItemLine",
     "ItemOverviewResponse",
     "PoeNinjaHistoryDataPoint",
+    "HistorySeries",
+    "LazyLines",
+    "ColumnarItemLines",
+    "ItemColumns",
+    "StringTable",
     "CurrencyHistoryResponse",
     "ItemHistoryResponse",
     "JsonObject",
+    "LeagueSnapshot",
+    "LineChange",
+    "SnapshotDiff",
+    "diff_snapshots",
+    "SnapshotArchive",
+    "ArchiveRecord",
+    "ArchiveSeries",
+    "PriceBook",
 ]
 
 __version__ = "1.0.4"  # Version bump for API correction
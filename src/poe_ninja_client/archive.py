@@ -0,0 +1,613 @@
+# src/poe_ninja_client/archive.py
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import quote
+
+from .enums import CurrencyType, ItemType
+from .models import CurrencyOverviewResponse, ItemOverviewResponse, _line_values
+
+type ArchiveCategory = CurrencyType | ItemType
+type Timestamp = float | datetime
+
+# One sample per line and poll: unix timestamp (s), line id, chaos value, count,
+# listing count. Little-endian and unpadded, so files are portable between hosts.
+# Missing chaos values are stored as NaN and missing counts as -1.
+RECORD = struct.Struct("<qidii")
+
+# Compacted day files ("YYYY-MM-DD.col") hold the same samples sorted by (id,
+# timestamp) as columns: a header (magic, version, record count, id count), the
+# sorted ids (int64), each id's first row (int64, plus a final end offset), then the
+# timestamp (int64), chaos value (float64), count (int32) and listing count (int32)
+# columns. Every section starts 8-byte aligned so it can be cast in place.
+_COLUMNS_HEADER = struct.Struct("<4sIQQ")
+_COLUMNS_MAGIC = b"PNAC"
+_COLUMNS_VERSION = 1
+# Python 3.13+ can map a file without keeping a duplicate of its descriptor open,
+# so series held by callers do not use up descriptors.
+_MMAP_OPTIONS: dict[str, Any] = (
+    {"trackfd": False} if sys.version_info >= (3, 13) else {}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveRecord:
+    timestamp: int
+    id: int  # noqa: A003  ItemLine.id, or CurrencyDetail.id for currencies
+    chaos_value: Optional[float]
+    count: Optional[int]
+    listing_count: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveSeries:
+    """
+    The samples of one line within one archived day, as columns.
+
+    For compacted days the columns are memoryviews straight into the memory-mapped
+    file, so nothing is copied or deserialized until values are read (big-endian
+    hosts get byteswapped copies instead). Missing chaos values are NaN and missing
+    counts -1, as stored.
+    """
+
+    id: int  # noqa: A003
+    day: date
+    timestamps: memoryview  # int64 unix seconds
+    chaos_values: memoryview  # float64
+    counts: memoryview  # int32
+    listing_counts: memoryview  # int32
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_numpy(self) -> tuple[Any, Any, Any, Any]:
+        """Returns the four columns as NumPy arrays sharing the mapped memory."""
+        import numpy as np  # Optional dependency
+
+        return (
+            np.frombuffer(self.timestamps, dtype=np.int64),
+            np.frombuffer(self.chaos_values, dtype=np.float64),
+            np.frombuffer(self.counts, dtype=np.int32),
+            np.frombuffer(self.listing_counts, dtype=np.int32),
+        )
+
+
+def _unix_seconds(value: Timestamp) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+def _utc_day(seconds: float) -> date:
+    return datetime.fromtimestamp(seconds, timezone.utc).date()
+
+
+def _record(
+    timestamp: int, line_id: int, chaos_value: float, count: int, listing_count: int
+) -> ArchiveRecord:
+    return ArchiveRecord(
+        timestamp,
+        line_id,
+        None if math.isnan(chaos_value) else chaos_value,
+        None if count < 0 else count,
+        None if listing_count < 0 else listing_count,
+    )
+
+
+class _Columns:
+    """Column views of a memory-mapped compacted day file."""
+
+    __slots__ = (
+        "ids",
+        "offsets",
+        "timestamps",
+        "chaos_values",
+        "counts",
+        "listing_counts",
+    )
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ, **_MMAP_OPTIONS)
+        magic, version, records, id_count = _COLUMNS_HEADER.unpack_from(mapped)
+        if magic != _COLUMNS_MAGIC or version != _COLUMNS_VERSION:
+            raise ValueError(f"{path} is not a compacted archive file.")
+        # The views keep the mapping alive for as long as any of them is referenced.
+        view = memoryview(mapped)
+        position = _COLUMNS_HEADER.size
+
+        def column(code: str, length: int) -> memoryview:
+            nonlocal position
+            end = position + struct.calcsize(code) * length
+            section = view[position:end]
+            position = end
+            if sys.byteorder != "little":
+                # The file is little-endian; big-endian hosts get a swapped copy.
+                swapped = array(code)
+                swapped.frombytes(section)
+                swapped.byteswap()
+                return memoryview(swapped)
+            return section.cast(code)
+
+        self.ids = column("q", id_count)
+        self.offsets = column("q", id_count + 1)
+        self.timestamps = column("q", records)
+        self.chaos_values = column("d", records)
+        self.counts = column("i", records)
+        self.listing_counts = column("i", records)
+
+    def rows_of(self, line_id: int) -> tuple[int, int]:
+        """Returns the [start, end) rows of `line_id` by binary search on the ids."""
+        index = bisect_left(self.ids, line_id)
+        if index < len(self.ids) and self.ids[index] == line_id:
+            return self.offsets[index], self.offsets[index + 1]
+        return 0, 0
+
+    def window(
+        self, start: int, end: int, start_seconds: float, end_seconds: float
+    ) -> tuple[int, int]:
+        """Narrows rows [start, end) of one id to a time window."""
+        timestamps = self.timestamps
+        if start_seconds != -math.inf:
+            start = bisect_left(timestamps, start_seconds, start, end)
+        if end_seconds != math.inf:
+            end = bisect_left(timestamps, end_seconds, start, end)
+        return start, end
+
+
+def _write_columns(path: str, rows: tuple[array, array, array, array, array]) -> int:
+    """Writes rows (timestamps, ids, chaos values, counts, listing counts) to `path`."""
+    timestamps, line_ids, chaos_values, counts, listing_counts = rows
+    # Appends are chronological, so a stable sort on the id alone normally yields
+    # (id, timestamp) order; fall back to the full key if they were not.
+    chronological = all(a <= b for a, b in zip(timestamps, timestamps[1:]))
+    order = sorted(
+        range(len(line_ids)),
+        key=(
+            line_ids.__getitem__
+            if chronological
+            else lambda row: (line_ids[row], timestamps[row])
+        ),
+    )
+    ids, offsets = array("q"), array("q")
+    for position, row in enumerate(order):
+        if not ids or ids[-1] != line_ids[row]:
+            ids.append(line_ids[row])
+            offsets.append(position)
+    offsets.append(len(order))
+    columns = [
+        ids,
+        offsets,
+        array("q", (timestamps[row] for row in order)),
+        array("d", (chaos_values[row] for row in order)),
+        array("i", (counts[row] for row in order)),
+        array("i", (listing_counts[row] for row in order)),
+    ]
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(
+            _COLUMNS_HEADER.pack(_COLUMNS_MAGIC, _COLUMNS_VERSION, len(order), len(ids))
+        )
+        for column in columns:
+            if sys.byteorder != "little":
+                column.byteswap()
+            column.tofile(f)
+    os.replace(temporary, path)
+    return len(order)
+
+
+def _trade_counts(trade: Any) -> tuple[Optional[int], Optional[int]]:
+    # Lazily parsed lines hand out the raw dict, parsed ones a CurrencyTradeData.
+    if trade is None:
+        return None, None
+    if isinstance(trade, dict):
+        return trade.get("count"), trade.get("listing_count")
+    return trade.count, trade.listing_count
+
+
+def _overview_rows(
+    overview: CurrencyOverviewResponse | ItemOverviewResponse,
+) -> Iterator[tuple[int, Optional[float], Optional[int], Optional[int]]]:
+    """Yields (id, chaos value, count, listing count) without building lazy lines."""
+    lines = overview.lines
+    if isinstance(overview, ItemOverviewResponse):
+        yield from zip(
+            _line_values(lines, "id"),
+            _line_values(lines, "chaosValue"),
+            _line_values(lines, "count"),
+            _line_values(lines, "listingCount"),
+        )
+        return
+    for name, chaos_equivalent, receive in zip(
+        _line_values(lines, "currencyTypeName"),
+        _line_values(lines, "chaosEquivalent", 0.0),
+        _line_values(lines, "receive"),
+    ):
+        detail = overview.get_detail(name)
+        if detail is None:
+            continue
+        yield (detail.id, chaos_equivalent, *_trade_counts(receive))
+
+
+class SnapshotArchive:
+    """
+    Append-only archive of every polled overview, stored as fixed-width records.
+
+    Samples are kept in `root/<league>/<currency|item>/<category>/<YYYY-MM-DD>.bin`
+    (UTC days), RECORD.size bytes per line and poll, instead of raw JSON. Queries
+    memory-map one day file at a time, so only the days inside the requested time
+    window are read and the archive never has to fit in memory.
+
+    `compact()` rewrites finished days into sorted, columnar `.col` files with an
+    id index. `series()` then finds one line's rows by binary search and returns
+    them as zero-copy views of the mapped file, so only the pages holding that
+    line's samples are touched. At most `max_mapped` compacted files stay mapped
+    between reads; the least recently read ones are unmapped beyond that.
+
+    Appends from several threads of one process are serialized; only one process
+    should write to (or compact) a given archive directory.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], max_mapped: int = 32):
+        """
+        Args:
+            root (str | os.PathLike[str]): Directory the archive is stored in.
+            max_mapped (int): Compacted day files kept memory-mapped between reads.
+        """
+        if max_mapped < 1:
+            raise ValueError("max_mapped must be at least 1.")
+        self.root: str = os.fspath(root)
+        self.max_mapped: int = max_mapped
+        self._lock = threading.Lock()
+        # Mapped compacted files by path, with the mtime they were mapped at, least
+        # recently read first.
+        self._mapped: OrderedDict[str, tuple[int, _Columns]] = OrderedDict()
+        self._mapped_lock = threading.Lock()
+
+    def _category_dir(self, league: str, category: ArchiveCategory) -> str:
+        kind = "currency" if isinstance(category, CurrencyType) else "item"
+        # CurrencyType and ItemType share values such as "Oil", hence the kind level.
+        return os.path.join(self.root, quote(league, safe=" "), kind, category.value)
+
+    def day_path(self, league: str, category: ArchiveCategory, day: date) -> str:
+        """Path of the row file that appends for `day` go to."""
+        return os.path.join(
+            self._category_dir(league, category), f"{day.isoformat()}.bin"
+        )
+
+    def compacted_path(self, league: str, category: ArchiveCategory, day: date) -> str:
+        return os.path.join(
+            self._category_dir(league, category), f"{day.isoformat()}.col"
+        )
+
+    def days(self, league: str, category: ArchiveCategory) -> list[date]:
+        """Returns the UTC days that hold samples for `category`, oldest first."""
+        directory = self._category_dir(league, category)
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        days: set[date] = set()
+        for name in names:
+            if not name.endswith((".bin", ".col")):
+                continue
+            try:
+                days.add(date.fromisoformat(name[:-4]))
+            except ValueError:
+                continue  # Not a day file, e.g. a stray backup copy
+        return sorted(days)
+
+    # --- Writing ---
+    def append(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        overview: CurrencyOverviewResponse | ItemOverviewResponse,
+        timestamp: Optional[Timestamp] = None,
+    ) -> int:
+        """
+        Appends one sample per line of `overview`, taken at `timestamp` (now if
+        omitted). Currency lines are stored under their CurrencyDetail id.
+
+        Returns:
+            int: Number of records written.
+        """
+        seconds = _unix_seconds(timestamp) if timestamp is not None else time.time()
+        rows = list(_overview_rows(overview))
+        buffer = bytearray(RECORD.size * len(rows))
+        for index, (line_id, chaos_value, count, listing_count) in enumerate(rows):
+            RECORD.pack_into(
+                buffer,
+                index * RECORD.size,
+                int(seconds),
+                line_id,
+                math.nan if chaos_value is None else chaos_value,
+                -1 if count is None else count,
+                -1 if listing_count is None else listing_count,
+            )
+        path = self.day_path(league, category, _utc_day(seconds))
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "ab") as f:
+                # A crash can leave a partial record behind; drop it so every record
+                # stays aligned.
+                size = f.tell()
+                if size % RECORD.size:
+                    f.truncate(size - size % RECORD.size)
+                f.write(buffer)
+        return len(rows)
+
+    def compact(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        day: Optional[date] = None,
+    ) -> int:
+        """
+        Rewrites the row file of `day` (by default: of every day before the current
+        UTC day) into a compacted columnar file, merging any samples that were
+        compacted before, and removes the row file.
+
+        Returns:
+            int: Number of records in the compacted files written.
+        """
+        if day is not None:
+            days = [day]
+        else:
+            today = _utc_day(time.time())
+            days = [d for d in self.days(league, category) if d < today]
+        written = 0
+        for compact_day in days:
+            row_path = self.day_path(league, category, compact_day)
+            if not os.path.exists(row_path):
+                continue
+            path = self.compacted_path(league, category, compact_day)
+            columns: tuple[array, array, array, array, array] = (
+                array("q"),
+                array("i"),
+                array("d"),
+                array("i"),
+                array("i"),
+            )
+            with self._lock:
+                for row in self._scan_raw(path, row_path):
+                    for column, value in zip(columns, row):
+                        column.append(value)
+                if columns[0]:
+                    written += _write_columns(path, columns)
+                with self._mapped_lock:
+                    self._mapped.pop(path, None)
+                os.remove(row_path)
+        return written
+
+    # --- Reading ---
+    def _columns(self, path: str) -> Optional[_Columns]:
+        try:
+            modified = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._mapped_lock:
+            cached = self._mapped.get(path)
+            if cached is not None and cached[0] == modified:
+                self._mapped.move_to_end(path)
+                return cached[1]
+        columns = _Columns(path)
+        with self._mapped_lock:
+            self._mapped[path] = (modified, columns)
+            self._mapped.move_to_end(path)
+            while len(self._mapped) > self.max_mapped:
+                # Dropping the last reference unmaps the file; series still held
+                # by callers keep their mapping alive.
+                self._mapped.popitem(last=False)
+        return columns
+
+    def _scan_raw(
+        self, compacted_path: Optional[str], row_path: str
+    ) -> Iterator[tuple[int, int, float, int, int]]:
+        """Yields raw (timestamp, id, chaos, count, listing count) tuples of a day."""
+        if compacted_path is not None:
+            columns = self._columns(compacted_path)
+            if columns is not None:
+                for index, line_id in enumerate(columns.ids):
+                    for row in range(columns.offsets[index], columns.offsets[index + 1]):
+                        yield (
+                            columns.timestamps[row],
+                            line_id,
+                            columns.chaos_values[row],
+                            columns.counts[row],
+                            columns.listing_counts[row],
+                        )
+        try:
+            f = open(row_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            size -= size % RECORD.size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)[:size]
+                try:
+                    yield from RECORD.iter_unpack(view)
+                finally:
+                    view.release()
+
+    def query(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        ids: Optional[int | Iterable[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ) -> Iterator[ArchiveRecord]:
+        """
+        Yields the samples of `category` with `start <= timestamp < end`, day by day.
+        Within a day, compacted samples come first, grouped by id, followed by the
+        samples appended since, in append order.
+
+        Args:
+            league (str): League the samples were archived under.
+            category (ArchiveCategory): Overview category.
+            ids (Optional[int | Iterable[int]]): Only yield these line ids.
+            start (Optional[Timestamp]): Inclusive lower bound (unix seconds or datetime).
+            end (Optional[Timestamp]): Exclusive upper bound.
+        """
+        start_seconds = _unix_seconds(start) if start is not None else -math.inf
+        end_seconds = _unix_seconds(end) if end is not None else math.inf
+        wanted: Optional[frozenset[int]] = None
+        if ids is not None:
+            wanted = frozenset((ids,) if isinstance(ids, int) else ids)
+        for day in self._days_between(league, category, start, end):
+            compacted_path = self.compacted_path(league, category, day)
+            if wanted is not None:
+                # Compacted days are looked up through the id index.
+                for line_id in sorted(wanted):
+                    for series in self._compacted_series(
+                        compacted_path, day, line_id, start_seconds, end_seconds
+                    ):
+                        for row in range(len(series)):
+                            yield _record(
+                                series.timestamps[row],
+                                line_id,
+                                series.chaos_values[row],
+                                series.counts[row],
+                                series.listing_counts[row],
+                            )
+                compacted_path = None
+            for row in self._scan_raw(
+                compacted_path, self.day_path(league, category, day)
+            ):
+                if not start_seconds <= row[0] < end_seconds:
+                    continue
+                if wanted is not None and row[1] not in wanted:
+                    continue
+                yield _record(*row)
+
+    def _days_between(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        start: Optional[Timestamp],
+        end: Optional[Timestamp],
+    ) -> list[date]:
+        first_day = _utc_day(_unix_seconds(start)) if start is not None else date.min
+        last_day = _utc_day(_unix_seconds(end)) if end is not None else date.max
+        return [d for d in self.days(league, category) if first_day <= d <= last_day]
+
+    def _compacted_series(
+        self,
+        path: str,
+        day: date,
+        line_id: int,
+        start_seconds: float,
+        end_seconds: float,
+    ) -> Iterator[ArchiveSeries]:
+        columns = self._columns(path)
+        if columns is None:
+            return
+        start, end = columns.window(
+            *columns.rows_of(line_id), start_seconds, end_seconds
+        )
+        if start < end:
+            yield ArchiveSeries(
+                line_id,
+                day,
+                columns.timestamps[start:end],
+                columns.chaos_values[start:end],
+                columns.counts[start:end],
+                columns.listing_counts[start:end],
+            )
+
+    def series(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        line_id: int,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ) -> list[ArchiveSeries]:
+        """
+        Returns the samples of one line with `start <= timestamp < end` as one
+        ArchiveSeries per day, oldest first.
+
+        Compacted days are served as zero-copy views into the mapped file after a
+        binary search over the id index and the timestamps. Days that have not been
+        compacted yet are scanned and copied into arrays.
+        """
+        start_seconds = _unix_seconds(start) if start is not None else -math.inf
+        end_seconds = _unix_seconds(end) if end is not None else math.inf
+        result: list[ArchiveSeries] = []
+        for day in self._days_between(league, category, start, end):
+            result.extend(
+                self._day_series(
+                    league, category, day, line_id, start_seconds, end_seconds
+                )
+            )
+        return result
+
+    def _day_series(
+        self,
+        league: str,
+        category: ArchiveCategory,
+        day: date,
+        line_id: int,
+        start_seconds: float,
+        end_seconds: float,
+    ) -> list[ArchiveSeries]:
+        result = list(
+            self._compacted_series(
+                self.compacted_path(league, category, day),
+                day,
+                line_id,
+                start_seconds,
+                end_seconds,
+            )
+        )
+        columns = (array("q"), array("d"), array("i"), array("i"))
+        for timestamp, row_id, chaos_value, count, listing_count in self._scan_raw(
+            None, self.day_path(league, category, day)
+        ):
+            if row_id == line_id and start_seconds <= timestamp < end_seconds:
+                for column, value in zip(
+                    columns, (timestamp, chaos_value, count, listing_count)
+                ):
+                    column.append(value)
+        if columns[0]:
+            result.append(ArchiveSeries(line_id, day, *map(memoryview, columns)))
+        return result
+
+    def latest(
+        self, league: str, category: ArchiveCategory, line_id: int
+    ) -> Optional[ArchiveRecord]:
+        """Returns the most recent sample of one line, scanning back day by day."""
+        for day in reversed(self.days(league, category)):
+            latest: Optional[tuple[int, ArchiveSeries, int]] = None
+            for series in self._day_series(
+                league, category, day, line_id, -math.inf, math.inf
+            ):
+                for row, timestamp in enumerate(series.timestamps):
+                    if latest is None or timestamp >= latest[0]:
+                        latest = (timestamp, series, row)
+            if latest is not None:
+                _, series, row = latest
+                return _record(
+                    series.timestamps[row],
+                    line_id,
+                    series.chaos_values[row],
+                    series.counts[row],
+                    series.listing_counts[row],
+                )
+        return None
@@ -0,0 +1,615 @@
+# src/poe_ninja_client/async_client.py
+
+import asyncio
+import copy
+import json
+import time
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    cast,
+)
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency: pip install poe-ninja-client[async]
+    aiohttp = None
+
+type JsonObject = dict[str, Any]
+type QueryParams = Optional[dict[str, Any]]
+
+from .cache import ResponseCache, make_cache_key
+from .client import (
+    _EXECUTOR_MIN_BYTES,
+    _STREAM_CHUNK_SIZE,
+    PoENinja,
+    _build_league_snapshot,
+    _conditional_headers,
+    _decode_and_parse,
+    _decode_json,
+    _item_lines,
+    _parse_in_worker,
+    _worker_result,
+)
+from .decoders import JsonDecoder, get_decoder
+from .exceptions import (
+    PoeNinjaAPIError,
+    PoeNinjaError,
+    PoeNinjaRequestError,
+    RateLimitError,
+)
+from .enums import CurrencyType, ItemType
+from .instrumentation import ClientStats, RequestHook, _emit, _Measurement
+from .models import (
+    CurrencyOverviewResponse,
+    ItemOverviewResponse,
+    CurrencyHistoryResponse,
+    ItemHistoryResponse,
+    CurrencyLine,
+    ItemLine,
+    StringTable,
+    _parse_item_line,
+)
+from .pricing import PriceBook
+from .ratelimit import RateLimiter, RetryPolicy, parse_retry_after
+from .snapshot import LeagueSnapshot
+from .streaming import JsonArrayStream
+
+
+async def _gather_results(coroutines: Iterable[Any]) -> list[Any]:
+    """
+    Awaits all coroutines concurrently. A PoeNinjaError is returned in place of the
+    failed coroutine's result instead of aborting the others.
+    """
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, PoeNinjaError):
+            raise result
+    return results
+
+
+class AsyncPoENinja:
+    """
+    asyncio counterpart of PoENinja, built on aiohttp.
+    Exposes the same methods as coroutines, reuses the models.parse_* functions and
+    keeps a keep-alive connection pool. At most `max_concurrency` requests are in
+    flight at once, so many overviews can be gathered in roughly one round-trip.
+    """
+
+    BASE_URL: str = PoENinja.BASE_URL
+
+    def __init__(
+        self,
+        league: str,
+        user_agent: str = "Python PoENinjaClient/1.0.4",
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        max_concurrency: int = 16,
+        keepalive_timeout: float = 30.0,
+        lazy_parsing: bool = False,
+        json_decoder: str | JsonDecoder = "auto",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Iterable[RequestHook] = (),
+        parse_executor: Optional[Executor] = None,
+        string_table: Optional[StringTable] = None,
+    ):
+        """
+        Initializes the AsyncPoENinja client for a specific league.
+
+        Args:
+            league (str): The Path of Exile league to query. This is mandatory.
+            user_agent (str): A User-Agent string for HTTP requests.
+            cache (Optional[ResponseCache]): Cache for parsed responses. A default
+                                             ResponseCache is created if omitted.
+            use_cache (bool): Set to False to always hit the network.
+            max_concurrency (int): Maximum number of requests in flight at once; also
+                                   the size of the connection pool.
+            keepalive_timeout (float): Seconds an idle pooled connection is kept open.
+            lazy_parsing (bool): Keep overview lines as raw JSON and build each
+                                 CurrencyLine/ItemLine only when it is accessed.
+            json_decoder (str | JsonDecoder): "json", "orjson", "msgspec", "auto" (the
+                                              fastest installed) or a callable taking
+                                              the response bytes.
+            rate_limiter (Optional[RateLimiter]): Token bucket shared by all requests
+                                                  of this client; may also be shared
+                                                  with other (sync or async) clients.
+            retry_policy (Optional[RetryPolicy]): Retries for 429/5xx responses and
+                                                  connection errors.
+            hooks (Iterable[RequestHook]): Called with a RequestEvent after every
+                                           client call; see PoENinja.add_hook().
+            parse_executor (Optional[Executor]): Executor (typically a
+                                                 ProcessPoolExecutor) that decodes and
+                                                 parses large response bodies, so they
+                                                 neither block the event loop nor hold
+                                                 the GIL. See PoENinja.
+            string_table (Optional[StringTable]): Intern table for the repeated string
+                                                  fields of item lines; see PoENinja.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncPoENinja requires aiohttp. Install it with: pip install poe-ninja-client[async]"
+            )
+        if not league:
+            raise ValueError(
+                "A league name must be provided for client initialization."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.league: str = league
+        self.user_agent: str = user_agent
+        self.max_concurrency: int = max_concurrency
+        self.keepalive_timeout: float = keepalive_timeout
+        self.lazy_parsing: bool = lazy_parsing
+        self.decode_json: JsonDecoder = (
+            get_decoder(json_decoder) if isinstance(json_decoder, str) else json_decoder
+        )
+        self.parse_executor: Optional[Executor] = parse_executor
+        self.string_table: StringTable = (
+            string_table if string_table is not None else StringTable()
+        )
+        self._worker_decoder: str | JsonDecoder = json_decoder
+        self.cache: Optional[ResponseCache] = None
+        if use_cache:
+            self.cache = cache if cache is not None else ResponseCache()
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Requests answered with 304 Not Modified vs. with a full body.
+        self.revalidated_count: int = 0
+        self.transferred_count: int = 0
+        self.rate_limiter: RateLimiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
+        )
+        self.retry_policy: RetryPolicy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.retry_count: int = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Requests are only timed while at least one hook is registered.
+        self.hooks: list[RequestHook] = list(hooks)
+        self._stats: Optional[ClientStats] = None
+        # Client whose session a for_league() view uses; None for the owner.
+        self._parent: Optional["AsyncPoENinja"] = None
+
+    def for_league(self, league: str) -> "AsyncPoENinja":
+        """
+        Returns a client for `league` that shares this client's aiohttp session,
+        concurrency limit, cache, rate limiter, hooks and ClientStats. See
+        PoENinja.for_league.
+        """
+        if not league:
+            raise ValueError("A league name must be provided for client initialization.")
+        view = copy.copy(self)
+        view.league = league
+        view.revalidated_count = view.transferred_count = view.retry_count = 0
+        view._parent = self._parent or self
+        view._session = None
+        return view
+
+    # --- Instrumentation ---
+    def add_hook(self, hook: RequestHook) -> None:
+        """Registers `hook`; see PoENinja.add_hook. Hooks are called on the event loop."""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self.hooks.remove(hook)
+        if hook is self.stats:
+            (self._parent or self)._stats = None
+
+    @property
+    def stats(self) -> Optional[ClientStats]:
+        """ClientStats started by enable_stats(); views share their parent's."""
+        return (self._parent or self)._stats
+
+    def enable_stats(self) -> ClientStats:
+        """Starts collecting per-endpoint ClientStats (once) and returns them."""
+        owner = self._parent or self
+        if owner._stats is None:
+            owner._stats = ClientStats()
+            self.add_hook(owner._stats)
+        return owner._stats
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._parent is not None:
+            return self._parent.session
+        # Created lazily so the session binds to the running event loop.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency, keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    async def _send(
+        self,
+        endpoint: str,
+        params: QueryParams = None,
+        headers: Optional[dict[str, str]] = None,
+        measurement: Optional[_Measurement] = None,
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        """
+        Returns (status code, body, response headers); raises for 4xx/5xx once the
+        retry policy gives up. See PoENinja._send.
+        """
+        result = await self._with_retries(
+            lambda: self._send_once(endpoint, params, headers), measurement
+        )
+        if measurement is not None:
+            measurement.status_code = result[0]
+            measurement.bytes = len(result[1])
+        return result
+
+    async def _with_retries[T](
+        self,
+        send_once: Callable[[], Awaitable[T]],
+        measurement: Optional[_Measurement] = None,
+    ) -> T:
+        """
+        Runs `send_once` through the rate limiter, retrying transient failures
+        (connection errors, timeouts, retryable statuses) as the retry policy allows.
+        """
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            try:
+                result = await send_once()
+            except PoeNinjaRequestError as e:
+                delay = self.retry_policy.delay_for(e, attempt)
+                if delay is None:
+                    if measurement is not None:
+                        measurement.network_seconds = time.perf_counter() - started
+                        measurement.status_code = e.status_code
+                    raise
+                attempt += 1
+                self.retry_count += 1
+                if measurement is not None:
+                    measurement.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            self.rate_limiter.record_success()
+            if measurement is not None:
+                measurement.network_seconds = time.perf_counter() - started
+            return result
+
+    async def _send_once(
+        self,
+        endpoint: str,
+        params: QueryParams = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        actual_params: dict[str, Any] = params if params is not None else {}
+        url: str = f"{self.BASE_URL}/{endpoint}"
+        async with self._semaphore:
+            try:
+                async with self.session.get(
+                    url, params=actual_params, headers=headers
+                ) as response:
+                    body: bytes = await response.read()
+                    status_code, reason = response.status, response.reason
+                    response_headers: Mapping[str, str] = response.headers
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise PoeNinjaRequestError(f"Request failed: {e!r}") from e
+        if status_code >= 400:
+            self._raise_for_status(status_code, reason, body, response_headers)
+        return status_code, body, response_headers
+
+    async def _open_stream_once(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> "aiohttp.ClientResponse":
+        """
+        Sends a GET and returns the response with its body unread. The response
+        holds a concurrency slot; the caller releases both once it is done.
+        """
+        await self._semaphore.acquire()
+        try:
+            response = await self.session.get(
+                f"{self.BASE_URL}/{endpoint}", params=params
+            )
+            if response.status < 400:
+                return response
+            try:
+                body = await response.read()
+            finally:
+                response.release()
+            self._raise_for_status(
+                response.status, response.reason, body, response.headers
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._semaphore.release()
+            raise PoeNinjaRequestError(f"Request failed: {e!r}") from e
+        except BaseException:
+            self._semaphore.release()
+            raise
+        raise AssertionError("unreachable")  # _raise_for_status always raises
+
+    def _raise_for_status(
+        self,
+        status_code: int,
+        reason: Optional[str],
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> None:
+        error_details: str | JsonObject
+        try:
+            error_details = json.loads(body)
+        except ValueError:
+            error_details = body.decode("utf-8", errors="replace")
+        message = f"HTTP error: {status_code} {reason}. Details: {error_details}"
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            self.rate_limiter.penalize(retry_after)
+            raise RateLimitError(message, retry_after=retry_after)
+        raise PoeNinjaRequestError(message, status_code=status_code)
+
+    async def _request(self, endpoint: str, params: QueryParams = None) -> Any:
+        _, body, _ = await self._send(endpoint, params)
+        return _decode_json(body, endpoint, self.decode_json)
+
+    async def _fetch(self, endpoint: str, params: dict[str, Any]) -> Any:
+        """
+        Returns the parsed model for `endpoint`, serving fresh entries from the
+        response cache and revalidating expired ones with a conditional request.
+        """
+        if not self.hooks:
+            return await self._load(endpoint, params, None)
+        measurement = _Measurement()
+        try:
+            result = await self._load(endpoint, params, measurement)
+        except PoeNinjaError as e:
+            _emit(self.hooks, measurement.event(endpoint, params, e))
+            raise
+        _emit(self.hooks, measurement.event(endpoint, params))
+        return result
+
+    async def _parse_body(
+        self, endpoint: str, body: bytes, measurement: Optional[_Measurement]
+    ) -> Any:
+        """Decodes and parses a body here, or in the parse executor if it is large."""
+        if self.parse_executor is None or len(body) < _EXECUTOR_MIN_BYTES:
+            return _decode_and_parse(
+                endpoint,
+                body,
+                endpoint,
+                self.decode_json,
+                self.lazy_parsing,
+                measurement,
+                self.string_table,
+            )
+        output = await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor,
+            _parse_in_worker,
+            endpoint,
+            body,
+            endpoint,
+            self._worker_decoder,
+            self.lazy_parsing,
+        )
+        return _worker_result(output, measurement, self.string_table)
+
+    async def _load(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        measurement: Optional[_Measurement],
+    ) -> Any:
+        if self.cache is None:
+            self.transferred_count += 1
+            _, body, _ = await self._send(endpoint, params, measurement=measurement)
+            return await self._parse_body(endpoint, body, measurement)
+        key = make_cache_key(endpoint, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if measurement is not None:
+                measurement.source = "cache"
+            return cached
+        stale = self.cache.get_entry(key)
+        status_code, body, headers = await self._send(
+            endpoint, params, headers=_conditional_headers(stale), measurement=measurement
+        )
+        if status_code == 304 and stale is not None:
+            self.revalidated_count += 1
+            if measurement is not None:
+                measurement.source = "revalidated"
+            self.cache.set(
+                endpoint, key, stale.value, stale.size, stale.etag, stale.last_modified
+            )
+            return stale.value
+        self.transferred_count += 1
+        result = await self._parse_body(endpoint, body, measurement)
+        self.cache.set(
+            endpoint,
+            key,
+            result,
+            len(body),
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+        )
+        return result
+
+    # --- Overview Endpoints ---
+    async def get_currency_overview(
+        self, currency_type: CurrencyType
+    ) -> CurrencyOverviewResponse:
+        params: dict[str, Any] = {"league": self.league, "type": currency_type.value}
+        return cast(
+            CurrencyOverviewResponse, await self._fetch("currencyoverview", params)
+        )
+
+    async def get_item_overview(self, item_type: ItemType) -> ItemOverviewResponse:
+        params: dict[str, Any] = {"league": self.league, "type": item_type.value}
+        return cast(ItemOverviewResponse, await self._fetch("itemoverview", params))
+
+    async def iter_item_overview(self, item_type: ItemType) -> AsyncIterator[ItemLine]:
+        """
+        Streams an item overview, yielding each ItemLine as it arrives.
+        See PoENinja.iter_item_overview.
+        """
+        params: dict[str, Any] = {"league": self.league, "type": item_type.value}
+        measurement = _Measurement("stream") if self.hooks else None
+        error: Optional[PoeNinjaError] = None
+        try:
+            response = await self._with_retries(
+                lambda: self._open_stream_once("itemoverview", params), measurement
+            )
+            if measurement is not None:
+                measurement.status_code = response.status
+            self.transferred_count += 1
+            stream = JsonArrayStream("lines")
+            try:
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    raw_lines = _item_lines(stream.feed(chunk))
+                    if measurement is not None:
+                        measurement.bytes += len(chunk)
+                        measurement.lines += len(raw_lines)
+                    for raw_line in raw_lines:
+                        yield _parse_item_line(raw_line, strings=self.string_table)
+                raw_lines = _item_lines(stream.close())
+                if measurement is not None:
+                    measurement.lines += len(raw_lines)
+                for raw_line in raw_lines:
+                    yield _parse_item_line(raw_line, strings=self.string_table)
+            except ValueError as e:
+                raise PoeNinjaAPIError(
+                    f"Failed to decode streamed JSON from {response.url}: {e}"
+                ) from e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise PoeNinjaRequestError(f"Request failed: {e!r}") from e
+            finally:
+                response.release()
+                self._semaphore.release()
+        except PoeNinjaError as e:
+            error = e
+            raise
+        finally:
+            if measurement is not None:
+                _emit(self.hooks, measurement.event("itemoverview", params, error))
+
+    async def get_league_snapshot(
+        self,
+        currency_types: Optional[Iterable[CurrencyType]] = None,
+        item_types: Optional[Iterable[ItemType]] = None,
+    ) -> LeagueSnapshot:
+        """
+        Fetches every currency and item overview of the league concurrently,
+        bounded by `max_concurrency`. See PoENinja.get_league_snapshot.
+        """
+        currency_types = list(CurrencyType if currency_types is None else currency_types)
+        item_types = list(ItemType if item_types is None else item_types)
+        results = await _gather_results(
+            [self.get_currency_overview(t) for t in currency_types]
+            + [self.get_item_overview(t) for t in item_types]
+        )
+        currency_results = dict(zip(currency_types, results[: len(currency_types)]))
+        item_results = dict(zip(item_types, results[len(currency_types) :]))
+        return _build_league_snapshot(self.league, currency_results, item_results)
+
+    async def get_price_book(
+        self,
+        currency_types: Optional[Iterable[CurrencyType]] = None,
+        item_types: Optional[Iterable[ItemType]] = None,
+    ) -> PriceBook:
+        """Fetches a league snapshot and builds a PriceBook from it."""
+        return PriceBook.from_snapshot(
+            await self.get_league_snapshot(currency_types, item_types)
+        )
+
+    # --- Find Specific Item/Currency (from overview data) ---
+    async def find_currency_line(
+        self, name: str, currency_type: CurrencyType
+    ) -> Optional[CurrencyLine]:
+        overview = await self.get_currency_overview(currency_type=currency_type)
+        return overview.get_line(name)
+
+    async def find_item_line(
+        self, name: str, item_type: ItemType
+    ) -> Optional[ItemLine]:
+        overview = await self.get_item_overview(item_type=item_type)
+        return overview.get_line(name)
+
+    # --- Helpers to get Numeric IDs for History ---
+    async def get_currency_id_by_name(
+        self, currency_name: str, overview_type: CurrencyType = CurrencyType.CURRENCY
+    ) -> Optional[int]:
+        overview_data = await self.get_currency_overview(currency_type=overview_type)
+        detail = overview_data.get_detail(currency_name)
+        return detail.id if detail is not None else None
+
+    async def get_item_id_by_name(
+        self, item_name: str, item_type: ItemType
+    ) -> Optional[int]:
+        overview_data = await self.get_item_overview(item_type=item_type)
+        line = overview_data.get_line(item_name)
+        return line.id if line is not None else None
+
+    # --- History Endpoints ---
+    async def get_currency_history(
+        self, currency_type_for_history: CurrencyType, currency_id: int
+    ) -> CurrencyHistoryResponse:
+        """See PoENinja.get_currency_history."""
+        params: dict[str, Any] = {
+            "league": self.league,
+            "type": currency_type_for_history.value,
+            "currencyId": str(currency_id),
+        }
+        return cast(
+            CurrencyHistoryResponse, await self._fetch("currencyhistory", params)
+        )
+
+    async def get_item_history(
+        self, item_type_for_history: ItemType, item_id: int
+    ) -> ItemHistoryResponse:
+        """See PoENinja.get_item_history."""
+        params: dict[str, Any] = {
+            "league": self.league,
+            "type": item_type_for_history.value,
+            "itemId": str(item_id),
+        }
+        return cast(ItemHistoryResponse, await self._fetch("itemhistory", params))
+
+    async def get_currency_histories(
+        self, currency_type_for_history: CurrencyType, currency_ids: Iterable[int]
+    ) -> dict[int, CurrencyHistoryResponse | PoeNinjaError]:
+        """See PoENinja.get_currency_histories; concurrency is bounded by `max_concurrency`."""
+        unique_ids = list(dict.fromkeys(currency_ids))
+        results = await _gather_results(
+            [self.get_currency_history(currency_type_for_history, i) for i in unique_ids]
+        )
+        return dict(zip(unique_ids, results))
+
+    async def get_item_histories(
+        self, item_type_for_history: ItemType, item_ids: Iterable[int]
+    ) -> dict[int, ItemHistoryResponse | PoeNinjaError]:
+        """See PoENinja.get_item_histories; concurrency is bounded by `max_concurrency`."""
+        unique_ids = list(dict.fromkeys(item_ids))
+        results = await _gather_results(
+            [self.get_item_history(item_type_for_history, i) for i in unique_ids]
+        )
+        return dict(zip(unique_ids, results))
+
+    async def close(self) -> None:
+        """Closes the session; a no-op for views created by for_league()."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncPoENinja":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        await self.close()
@@ -0,0 +1,138 @@
+# src/poe_ninja_client/cache.py
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping, Optional
+
+# poe.ninja rebuilds overviews every few minutes; history points are daily.
+DEFAULT_TTLS: dict[str, float] = {
+    "currencyoverview": 300.0,
+    "itemoverview": 300.0,
+    "currencyhistory": 3600.0,
+    "itemhistory": 3600.0,
+}
+
+
+def make_cache_key(endpoint: str, params: Mapping[str, Any]) -> Hashable:
+    """Builds the (endpoint, league, type, currencyId/itemId) key for a request."""
+    return (endpoint, tuple(sorted(params.items())))
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.monotonic()
+
+
+class ResponseCache:
+    """
+    Thread-safe in-process cache for parsed API responses.
+
+    Entries expire after a per-endpoint TTL and are evicted in least-recently-used
+    order once either `max_entries` or `max_bytes` (measured on the raw response
+    body) is exceeded. Expired entries are kept until evicted so that their HTTP
+    validators can be used to revalidate them with a conditional request.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 300.0,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttls (Optional[Mapping[str, float]]): Per-endpoint TTLs in seconds, merged
+                                                  over DEFAULT_TTLS. A TTL of 0 disables
+                                                  caching for that endpoint.
+            default_ttl (float): TTL for endpoints not listed in `ttls`.
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (Optional[int]): Maximum total raw body size, or None for no limit.
+        """
+        self.ttls: dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl: float = default_ttl
+        self.max_entries: int = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._total_bytes: int = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value for `key`, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.fresh:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Returns the entry for `key` even if it has expired, without counting a hit."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(
+        self,
+        endpoint: str,
+        key: Hashable,
+        value: Any,
+        size: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        entry = CacheEntry(value, size, time.monotonic() + ttl, etag, last_modified)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._total_bytes += size
+            self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._total_bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
@@ -1,14 +1,35 @@
 # src/poe_ninja_client/client.py
 
+import copy
+import json
+import os
 import requests
-from typing import Any, Optional, cast
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, Optional, cast
 
 type JsonObject = dict[str, Any]
 type JsonList = list[JsonObject]
 type QueryParams = Optional[dict[str, Any]]
 
-from .exceptions import PoeNinjaAPIError, PoeNinjaRequestError
+from .cache import CacheEntry, ResponseCache, make_cache_key
+from .decoders import JsonDecoder, get_decoder
+from .disk_cache import DiskCache, DiskCacheEntry
+from .exceptions import (
+    PoeNinjaAPIError,
+    PoeNinjaError,
+    PoeNinjaRequestError,
+    RateLimitError,
+)
 from .enums import CurrencyType, ItemType  # GraphId removed as it's not used
+from .instrumentation import (
+    ClientStats,
+    RequestHook,
+    _count_lines,
+    _emit,
+    _Measurement,
+)
 from .models import (
     CurrencyOverviewResponse,
     parse_currency_overview_response,
@@ -21,7 +42,203 @@ from .models import (
     CurrencyLine,
     ItemLine,
     CurrencyDetail,
+    ColumnarItemLines,
+    ItemColumns,
+    StringTable,
+    _parse_item_line,
 )
+from .pricing import PriceBook
+from .ratelimit import RateLimiter, RetryPolicy, parse_retry_after
+from .refresher import BackgroundRefresher, ChangeHook
+from .singleflight import SingleFlight
+from .snapshot import LeagueSnapshot
+from .streaming import JsonArrayStream
+
+# endpoint -> (expected JSON container, description used in errors, parser)
+_ENDPOINTS: dict[str, tuple[type, str, Callable[[Any], Any]]] = {
+    "currencyoverview": (
+        dict,
+        "JSON object for currency overview",
+        parse_currency_overview_response,
+    ),
+    "itemoverview": (dict, "JSON object for item overview", parse_item_overview_response),
+    "currencyhistory": (
+        dict,
+        "JSON object for currency history data",
+        parse_currency_history_response,
+    ),
+    "itemhistory": (list, "JSON list for item history data", parse_item_history_response),
+}
+
+
+def _decode_json(body: bytes, source: str, decoder: JsonDecoder = json.loads) -> Any:
+    try:
+        return decoder(body)
+    except ValueError as e:
+        content = body[:200].decode("utf-8", errors="replace")
+        raise PoeNinjaAPIError(
+            f"Failed to decode JSON from {source}. Content: {content}..."
+        ) from e
+
+
+def _conditional_headers(
+    known: Optional[CacheEntry | DiskCacheEntry],
+) -> Optional[dict[str, str]]:
+    if known is None:
+        return None
+    headers: dict[str, str] = {}
+    if known.etag:
+        headers["If-None-Match"] = known.etag
+    if known.last_modified:
+        headers["If-Modified-Since"] = known.last_modified
+    return headers or None
+
+
+_OVERVIEW_ENDPOINTS: frozenset[str] = frozenset({"currencyoverview", "itemoverview"})
+
+# Bytes read from the socket per step when streaming an overview.
+_STREAM_CHUNK_SIZE: int = 64 * 1024
+
+
+def _parse_endpoint_payload(
+    endpoint: str,
+    raw_data: Any,
+    lazy: bool = False,
+    strings: Optional[StringTable] = None,
+) -> Any:
+    expected_type, description, parser = _ENDPOINTS[endpoint]
+    if not isinstance(raw_data, expected_type):
+        raise PoeNinjaAPIError(f"Expected {description}, got {type(raw_data)}")
+    if endpoint == "itemoverview":
+        return parser(raw_data, lazy=lazy, strings=strings)
+    if lazy and endpoint in _OVERVIEW_ENDPOINTS:
+        return parser(raw_data, lazy=True)
+    return parser(raw_data)
+
+
+def _decode_and_parse(
+    endpoint: str,
+    body: bytes,
+    source: str,
+    decoder: JsonDecoder,
+    lazy: bool,
+    measurement: Optional[_Measurement],
+    strings: Optional[StringTable] = None,
+) -> Any:
+    """Decodes and parses a response body, timing both steps when measured."""
+    if measurement is None:
+        return _parse_endpoint_payload(
+            endpoint, _decode_json(body, source, decoder), lazy=lazy, strings=strings
+        )
+    started = time.perf_counter()
+    raw_data = _decode_json(body, source, decoder)
+    decoded = time.perf_counter()
+    result = _parse_endpoint_payload(endpoint, raw_data, lazy=lazy, strings=strings)
+    measurement.decode_seconds = decoded - started
+    measurement.parse_seconds = time.perf_counter() - decoded
+    measurement.lines = _count_lines(result)
+    return result
+
+
+# Bodies smaller than this are parsed in the calling thread even when a parse
+# executor is set: shipping them to a worker costs more than parsing them.
+_EXECUTOR_MIN_BYTES: int = 256 * 1024
+
+
+def _item_lines(raw_lines: list[Any]) -> list[JsonObject]:
+    """Drops streamed elements that are not line objects, as the parsers do."""
+    return [raw_line for raw_line in raw_lines if isinstance(raw_line, dict)]
+
+
+def _parse_in_worker(
+    endpoint: str,
+    body: bytes,
+    source: str,
+    decoder: str | JsonDecoder,
+    lazy: bool,
+) -> tuple[Any, float, float]:
+    """
+    Decodes and parses a response body in a parse executor's worker and returns
+    (result, decode seconds, parse seconds). Item overviews come back as
+    ItemColumns, which pickle far smaller and faster than ItemLine objects, unless
+    a value does not fit the columns.
+    """
+    decode = get_decoder(decoder) if isinstance(decoder, str) else decoder
+    started = time.perf_counter()
+    raw_data = _decode_json(body, source, decode)
+    decoded = time.perf_counter()
+    result: Any = None
+    if endpoint == "itemoverview" and isinstance(raw_data, dict):
+        try:
+            result = ItemColumns.from_raw(
+                line for line in raw_data.get("lines", []) if isinstance(line, dict)
+            )
+        except (OverflowError, ValueError):
+            pass  # An integer outside int64; ItemLine objects hold it fine
+    if result is None:
+        result = _parse_endpoint_payload(endpoint, raw_data, lazy=lazy)
+    return result, decoded - started, time.perf_counter() - decoded
+
+
+def _worker_result(
+    output: tuple[Any, float, float],
+    measurement: Optional[_Measurement],
+    strings: Optional[StringTable] = None,
+) -> Any:
+    """
+    Turns the output of _parse_in_worker into the client's response model. Workers
+    cannot reach the client's StringTable, so item columns are interned here.
+    """
+    result, decode_seconds, parse_seconds = output
+    if isinstance(result, ItemColumns):
+        if strings is not None:
+            result.intern_strings(strings)
+        result = ItemOverviewResponse(lines=ColumnarItemLines(result))
+    if measurement is not None:
+        measurement.decode_seconds = decode_seconds
+        measurement.parse_seconds = parse_seconds
+        measurement.lines = _count_lines(result)
+    return result
+
+
+def _run_concurrently[K: Hashable, T](
+    tasks: Mapping[K, Callable[[], T]], max_workers: int
+) -> dict[K, T | PoeNinjaError]:
+    """
+    Runs every task on a thread pool and returns key -> result. A task that raises
+    PoeNinjaError has the exception stored as its result instead of aborting the rest.
+    """
+
+    def run(task: Callable[[], T]) -> T | PoeNinjaError:
+        try:
+            return task()
+        except PoeNinjaError as e:
+            return e
+
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as pool:
+        futures = {key: pool.submit(run, task) for key, task in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _build_league_snapshot(
+    league: str,
+    currency_results: Mapping[CurrencyType, CurrencyOverviewResponse | PoeNinjaError],
+    item_results: Mapping[ItemType, ItemOverviewResponse | PoeNinjaError],
+) -> LeagueSnapshot:
+    snapshot = LeagueSnapshot(league=league)
+    for currency_type, currency_result in currency_results.items():
+        if isinstance(currency_result, PoeNinjaError):
+            snapshot.currency_errors[currency_type] = currency_result
+        else:
+            snapshot.currency[currency_type] = currency_result
+    for item_type, item_result in item_results.items():
+        if isinstance(item_result, PoeNinjaError):
+            snapshot.item_errors[item_type] = item_result
+        else:
+            snapshot.items[item_type] = item_result
+    return snapshot
 
 
 class PoENinja:
@@ -34,7 +251,20 @@ class PoENinja:
     BASE_URL: str = "https://poe.ninja/api/data"
 
     def __init__(
-        self, league: str, user_agent: str = "Python PoENinjaClient/1.0.4"
+        self,
+        league: str,
+        user_agent: str = "Python PoENinjaClient/1.0.4",
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        pool_maxsize: int = 16,
+        cache_path: Optional[str | os.PathLike[str]] = None,
+        lazy_parsing: bool = False,
+        json_decoder: str | JsonDecoder = "auto",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Iterable[RequestHook] = (),
+        parse_executor: Optional[Executor] = None,
+        string_table: Optional[StringTable] = None,
     ):  # Version bump
         """
         Initializes the PoENinja client for a specific league.
@@ -42,6 +272,42 @@ class PoENinja:
         Args:
             league (str): The Path of Exile league to query. This is mandatory.
             user_agent (str): A User-Agent string for HTTP requests.
+            cache (Optional[ResponseCache]): Cache for parsed responses. A default
+                                             ResponseCache is created if omitted.
+            use_cache (bool): Set to False to always hit the network.
+            pool_maxsize (int): Connections kept alive to poe.ninja; should be at
+                                least the worker count used for bulk fetches.
+            cache_path (Optional[str | os.PathLike[str]]): SQLite file for a persistent
+                                                          DiskCache of raw responses, so
+                                                          restarts are served locally
+                                                          while data is fresh.
+            lazy_parsing (bool): Keep overview lines as raw JSON and build each
+                                 CurrencyLine/ItemLine only when it is accessed.
+            json_decoder (str | JsonDecoder): "json", "orjson", "msgspec", "auto" (the
+                                              fastest installed) or a callable taking
+                                              the response bytes.
+            rate_limiter (Optional[RateLimiter]): Token bucket shared by all requests
+                                                  of this client (pass the same one to
+                                                  several clients to share a budget).
+                                                  Defaults to no fixed rate, but
+                                                  Retry-After pauses are honored.
+            retry_policy (Optional[RetryPolicy]): Retries for 429/5xx responses and
+                                                  connection errors. Defaults to
+                                                  RetryPolicy(); RetryPolicy(max_retries=0)
+                                                  disables retries.
+            hooks (Iterable[RequestHook]): Called with a RequestEvent after every
+                                           client call; see add_hook().
+            parse_executor (Optional[Executor]): Executor (typically a
+                                                 ProcessPoolExecutor) that decodes and
+                                                 parses large response bodies off the
+                                                 calling thread. Item overview lines
+                                                 come back as ColumnarItemLines. The
+                                                 client does not shut it down.
+            string_table (Optional[StringTable]): Intern table for the repeated string
+                                                  fields of item lines, kept across
+                                                  polls. A new one is created if
+                                                  omitted; pass one to share it
+                                                  between clients.
         """
         if not league:
             raise ValueError(
@@ -50,13 +316,152 @@ class PoENinja:
         self.league: str = league
         self.session: requests.Session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.cache: Optional[ResponseCache] = None
+        if use_cache:
+            self.cache = cache if cache is not None else ResponseCache()
+        self.disk_cache: Optional[DiskCache] = (
+            DiskCache(cache_path) if cache_path is not None else None
+        )
+        self.lazy_parsing: bool = lazy_parsing
+        self.decode_json: JsonDecoder = (
+            get_decoder(json_decoder) if isinstance(json_decoder, str) else json_decoder
+        )
+        self.parse_executor: Optional[Executor] = parse_executor
+        self.string_table: StringTable = (
+            string_table if string_table is not None else StringTable()
+        )
+        # Sent to parse workers; backend names are resolved there.
+        self._worker_decoder: str | JsonDecoder = json_decoder
+        # Requests answered with 304 Not Modified vs. with a full body.
+        self.revalidated_count: int = 0
+        self.transferred_count: int = 0
+        self.single_flight: SingleFlight = SingleFlight()
+        self.rate_limiter: RateLimiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
+        )
+        self.retry_policy: RetryPolicy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.retry_count: int = 0
+        self._refresher: Optional[BackgroundRefresher] = None
+        # Requests are only timed while at least one hook is registered.
+        self.hooks: list[RequestHook] = list(hooks)
+        self._stats: Optional[ClientStats] = None
+        # False for views created by for_league(), which must not close the
+        # session and disk cache they share.
+        self._owns_resources: bool = True
+        # Client a for_league() view was created from; None for the owner.
+        self._parent: Optional["PoENinja"] = None
 
-    def _request(self, endpoint: str, params: QueryParams = None) -> Any:
+    def for_league(self, league: str) -> "PoENinja":
+        """
+        Returns a client for `league` that shares this client's HTTP connection
+        pool, response and disk caches, rate limiter, retry policy, request
+        coalescing, hooks, ClientStats and background refresher. Creating one is a
+        shallow copy; closing it leaves the shared resources open. Counters such as
+        `transferred_count` are kept per view. The view serves from whatever
+        refresher this client runs, including one started after the view was created.
+        """
+        if not league:
+            raise ValueError("A league name must be provided for client initialization.")
+        view = copy.copy(self)
+        view.league = league
+        view.revalidated_count = view.transferred_count = view.retry_count = 0
+        view._owns_resources = False
+        view._parent = self._parent or self
+        view._refresher = None
+        return view
+
+    @property
+    def refresher(self) -> Optional[BackgroundRefresher]:
+        """The running BackgroundRefresher; views fall back to their parent's."""
+        if self._refresher is None and self._parent is not None:
+            return self._parent.refresher
+        return self._refresher
+
+    @refresher.setter
+    def refresher(self, refresher: Optional[BackgroundRefresher]) -> None:
+        self._refresher = refresher
+
+    # --- Instrumentation ---
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Registers `hook` to be called with a RequestEvent after every overview or
+        history call, from the calling thread. Hooks should return quickly;
+        exceptions they raise are logged and otherwise ignored.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self.hooks.remove(hook)
+        if hook is self.stats:
+            (self._parent or self)._stats = None
+
+    @property
+    def stats(self) -> Optional[ClientStats]:
+        """ClientStats started by enable_stats(); views share their parent's."""
+        return (self._parent or self)._stats
+
+    def enable_stats(self) -> ClientStats:
+        """Starts collecting per-endpoint ClientStats (once) and returns them."""
+        owner = self._parent or self
+        if owner._stats is None:
+            owner._stats = ClientStats()
+            self.add_hook(owner._stats)
+        return owner._stats
+
+    def _send(
+        self,
+        endpoint: str,
+        params: QueryParams = None,
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
+        measurement: Optional[_Measurement] = None,
+    ) -> requests.Response:
+        """
+        Sends a GET through the rate limiter, retrying transient failures as the
+        retry policy allows. With `stream` the body is left unread.
+        """
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self._send_once(endpoint, params, headers, stream)
+            except PoeNinjaRequestError as e:
+                delay = self.retry_policy.delay_for(e, attempt)
+                if delay is None:
+                    if measurement is not None:
+                        measurement.network_seconds = time.perf_counter() - started
+                        measurement.status_code = e.status_code
+                    raise
+                attempt += 1
+                self.retry_count += 1
+                if measurement is not None:
+                    measurement.retries += 1
+                time.sleep(delay)
+                continue
+            self.rate_limiter.record_success()
+            if measurement is not None:
+                measurement.network_seconds = time.perf_counter() - started
+                measurement.status_code = response.status_code
+            return response
+
+    def _send_once(
+        self,
+        endpoint: str,
+        params: QueryParams = None,
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
         actual_params: dict[str, Any] = params if params is not None else {}
         url: str = f"{self.BASE_URL}/{endpoint}"
         try:
             response: requests.Response = self.session.get(
-                url, params=actual_params, timeout=15
+                url, params=actual_params, headers=headers, timeout=15, stream=stream
             )
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
@@ -69,77 +474,365 @@ class PoENinja:
                 status_code, reason = e.response.status_code, e.response.reason
             else:
                 status_code, reason = None, "Unknown reason"
-            raise PoeNinjaRequestError(
-                f"HTTP error: {status_code} {reason}. Details: {error_details}",
-                status_code=status_code,
-            ) from e
+            message = f"HTTP error: {status_code} {reason}. Details: {error_details}"
+            if status_code == 429:
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                self.rate_limiter.penalize(retry_after)
+                raise RateLimitError(message, retry_after=retry_after) from e
+            raise PoeNinjaRequestError(message, status_code=status_code) from e
         except requests.exceptions.RequestException as e:
             raise PoeNinjaRequestError(f"Request failed: {e}") from e
+        return response
+
+    def _parse_body(
+        self,
+        endpoint: str,
+        body: bytes,
+        source: str,
+        measurement: Optional[_Measurement],
+    ) -> Any:
+        """Decodes and parses a body here, or in the parse executor if it is large."""
+        if self.parse_executor is None or len(body) < _EXECUTOR_MIN_BYTES:
+            return _decode_and_parse(
+                endpoint,
+                body,
+                source,
+                self.decode_json,
+                self.lazy_parsing,
+                measurement,
+                self.string_table,
+            )
+        output = self.parse_executor.submit(
+            _parse_in_worker,
+            endpoint,
+            body,
+            source,
+            self._worker_decoder,
+            self.lazy_parsing,
+        ).result()
+        return _worker_result(output, measurement, self.string_table)
+
+    def _request(self, endpoint: str, params: QueryParams = None) -> Any:
+        response = self._send(endpoint, params)
+        return _decode_json(response.content, response.url, self.decode_json)
+
+    def _load(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        stale: Optional[CacheEntry],
+        revalidate: bool = False,
+        measurement: Optional[_Measurement] = None,
+    ) -> tuple[Any, int, Optional[str], Optional[str]]:
+        """
+        Returns (parsed model, raw body size, ETag, Last-Modified) from the disk cache
+        if it holds a fresh body, and from poe.ninja otherwise. With `revalidate` the
+        disk copy is always checked against poe.ninja.
+
+        When an older copy is known (an expired `stale` entry or a disk cache row) the
+        request carries If-None-Match / If-Modified-Since. On 304 Not Modified a stale
+        in-memory model is returned as is, without running the JSON decoder or parsers.
+        """
+        disk_entry: Optional[DiskCacheEntry] = None
+        if self.disk_cache is not None:
+            disk_entry = self.disk_cache.get(endpoint, params)
+            if disk_entry is not None and disk_entry.fresh and not revalidate:
+                if measurement is not None:
+                    measurement.source = "disk"
+                return (
+                    self._parse_body(endpoint, disk_entry.body, endpoint, measurement),
+                    len(disk_entry.body),
+                    disk_entry.etag,
+                    disk_entry.last_modified,
+                )
+        known: Optional[CacheEntry | DiskCacheEntry] = disk_entry
+        if stale is not None and (stale.etag or stale.last_modified):
+            known = stale
+        response = self._send(
+            endpoint, params, headers=_conditional_headers(known), measurement=measurement
+        )
+        if response.status_code == 304 and known is not None:
+            self.revalidated_count += 1
+            if measurement is not None:
+                measurement.source = "revalidated"
+            if disk_entry is not None and (disk_entry.etag, disk_entry.last_modified) == (
+                known.etag,
+                known.last_modified,
+            ):
+                cast(DiskCache, self.disk_cache).touch(endpoint, params)
+            if isinstance(known, CacheEntry):
+                return known.value, known.size, known.etag, known.last_modified
+            return (
+                self._parse_body(endpoint, known.body, endpoint, measurement),
+                len(known.body),
+                known.etag,
+                known.last_modified,
+            )
+        self.transferred_count += 1
+        body = response.content
+        if measurement is not None:
+            measurement.bytes = len(body)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.disk_cache is not None:
+            self.disk_cache.put(
+                endpoint, params, body, etag=etag, last_modified=last_modified
+            )
+        return (
+            self._parse_body(endpoint, body, response.url, measurement),
+            len(body),
+            etag,
+            last_modified,
+        )
+
+    def _fetch(self, endpoint: str, params: dict[str, Any]) -> Any:
+        """
+        Returns the parsed model for `endpoint`, serving it from the response cache
+        when a fresh entry exists so repeated lookups skip both HTTP and parsing.
+        Concurrent cache misses for the same request share one in-flight download.
+        """
+        key = make_cache_key(endpoint, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.hooks:
+                    _emit(self.hooks, _Measurement("cache").event(endpoint, params))
+                return cached
+        if self.refresher is not None:
+            # Stale-while-revalidate: the refresher keeps this key up to date, so
+            # hand out its last good copy rather than waiting for the network.
+            refreshed = self.refresher.lookup(key)
+            if refreshed is not None:
+                if self.hooks:
+                    _emit(self.hooks, _Measurement("cache").event(endpoint, params))
+                return refreshed
+        if not self.hooks:
+            return self.single_flight.do(
+                key, lambda: self._fetch_uncached(endpoint, params, key)
+            )
+        # The leader reports its own event from _fetch_uncached; callers that
+        # waited for it report a "coalesced" one.
+        led = False
+
+        def lead() -> Any:
+            nonlocal led
+            led = True
+            return self._fetch_uncached(endpoint, params, key)
+
+        measurement = _Measurement("coalesced")
         try:
-            return response.json()
-        except requests.exceptions.JSONDecodeError as e:
-            raise PoeNinjaAPIError(
-                f"Failed to decode JSON from {url}. Content: {response.text[:200]}..."
-            ) from e
+            result = self.single_flight.do(key, lead)
+        except PoeNinjaError as e:
+            if not led:
+                _emit(self.hooks, measurement.event(endpoint, params, e))
+            raise
+        if not led:
+            _emit(self.hooks, measurement.event(endpoint, params))
+        return result
+
+    def _fetch_uncached(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        key: Hashable,
+        revalidate: bool = False,
+    ) -> Any:
+        measurement = _Measurement() if self.hooks else None
+        stale: Optional[CacheEntry] = None
+        if self.cache is not None:
+            stale = self.cache.get_entry(key)
+        try:
+            result, size, etag, last_modified = self._load(
+                endpoint, params, stale, revalidate, measurement
+            )
+        except PoeNinjaError as e:
+            if measurement is not None:
+                _emit(self.hooks, measurement.event(endpoint, params, e))
+            raise
+        if self.cache is not None:
+            self.cache.set(endpoint, key, result, size, etag, last_modified)
+        if measurement is not None:
+            _emit(self.hooks, measurement.event(endpoint, params))
+        return result
+
+    @property
+    def coalesced_count(self) -> int:
+        """Calls that were served by another thread's in-flight request."""
+        return self.single_flight.coalesced
+
+    def start_background_refresh(
+        self,
+        categories: Iterable[CurrencyType | ItemType] = (),
+        interval: Optional[float] = None,
+        refresh_ahead: float = 30.0,
+        max_workers: int = 4,
+        on_change: Optional[ChangeHook] = None,
+    ) -> BackgroundRefresher:
+        """
+        Starts a BackgroundRefresher that keeps `categories` of this league fresh.
+
+        While it runs, overview calls for registered categories return the last good
+        data immediately instead of waiting for poe.ninja when the cache has expired.
+        Further categories, also of other leagues, can be added with
+        `refresher.register(category, league)`. The refresher is stopped by close().
+
+        Args:
+            categories (Iterable[CurrencyType | ItemType]): Categories to register.
+            interval (Optional[float]): Fixed seconds between refreshes; by default
+                                        just before the cache TTL runs out.
+            refresh_ahead (float): Seconds before expiry at which to refresh.
+            max_workers (int): Number of refreshes that may run at once.
+            on_change (Optional[ChangeHook]): Called as (league, category, old, new)
+                                              when a category's data changes.
+
+        Returns:
+            BackgroundRefresher: The running refresher (also `client.refresher`).
+        """
+        if self.refresher is not None and self.refresher.client is self:
+            self.refresher.stop()
+        self.refresher = BackgroundRefresher(
+            self,
+            interval=interval,
+            refresh_ahead=refresh_ahead,
+            max_workers=max_workers,
+            on_change=on_change,
+        )
+        for category in categories:
+            self.refresher.register(category)
+        return self.refresher.start()
 
     # --- Overview Endpoints ---
     def get_currency_overview(
         self, currency_type: CurrencyType
     ) -> CurrencyOverviewResponse:
         params: dict[str, Any] = {"league": self.league, "type": currency_type.value}
-        raw_data: Any = self._request("currencyoverview", params=params)
-        if not isinstance(raw_data, dict):
-            raise PoeNinjaAPIError(
-                f"Expected JSON object for currency overview, got {type(raw_data)}"
-            )
-        return parse_currency_overview_response(cast(JsonObject, raw_data))
+        return cast(CurrencyOverviewResponse, self._fetch("currencyoverview", params))
 
     def get_item_overview(self, item_type: ItemType) -> ItemOverviewResponse:
         params: dict[str, Any] = {"league": self.league, "type": item_type.value}
-        raw_data: Any = self._request("itemoverview", params=params)
-        if not isinstance(raw_data, dict):
-            raise PoeNinjaAPIError(
-                f"Expected JSON object for item overview, got {type(raw_data)}"
+        return cast(ItemOverviewResponse, self._fetch("itemoverview", params))
+
+    def iter_item_overview(self, item_type: ItemType) -> Iterator[ItemLine]:
+        """
+        Streams an item overview, yielding each ItemLine as soon as it has been
+        received instead of buffering and decoding the whole response.
+
+        Peak memory stays flat regardless of the category's size, and consumers can
+        filter or stop early; breaking out of the loop closes the connection.
+        Streamed responses bypass the caches, and lines are decoded with the
+        standard library's incremental decoder.
+
+        Args:
+            item_type (ItemType): The category to stream.
+
+        Yields:
+            ItemLine: The overview's lines, in response order.
+        """
+        params: dict[str, Any] = {"league": self.league, "type": item_type.value}
+        measurement = _Measurement("stream") if self.hooks else None
+        error: Optional[PoeNinjaError] = None
+        try:
+            response = self._send(
+                "itemoverview", params, stream=True, measurement=measurement
             )
-        return parse_item_overview_response(cast(JsonObject, raw_data))
+            self.transferred_count += 1
+            stream = JsonArrayStream("lines")
+            with response:
+                try:
+                    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                        raw_lines = _item_lines(stream.feed(chunk))
+                        if measurement is not None:
+                            measurement.bytes += len(chunk)
+                            measurement.lines += len(raw_lines)
+                        for raw_line in raw_lines:
+                            yield _parse_item_line(raw_line, strings=self.string_table)
+                    raw_lines = _item_lines(stream.close())
+                    if measurement is not None:
+                        measurement.lines += len(raw_lines)
+                    for raw_line in raw_lines:
+                        yield _parse_item_line(raw_line, strings=self.string_table)
+                except ValueError as e:
+                    raise PoeNinjaAPIError(
+                        f"Failed to decode streamed JSON from {response.url}: {e}"
+                    ) from e
+                except requests.exceptions.RequestException as e:
+                    raise PoeNinjaRequestError(f"Request failed: {e}") from e
+        except PoeNinjaError as e:
+            error = e
+            raise
+        finally:
+            if measurement is not None:
+                _emit(self.hooks, measurement.event("itemoverview", params, error))
+
+    def get_league_snapshot(
+        self,
+        currency_types: Optional[Iterable[CurrencyType]] = None,
+        item_types: Optional[Iterable[ItemType]] = None,
+        max_workers: int = 16,
+    ) -> LeagueSnapshot:
+        """
+        Fetches every currency and item overview of the league concurrently.
+
+        Args:
+            currency_types (Optional[Iterable[CurrencyType]]): Categories to fetch;
+                                                               all of them if omitted.
+            item_types (Optional[Iterable[ItemType]]): Categories to fetch; all of them
+                                                       if omitted.
+            max_workers (int): Size of the thread pool used for the sweep.
+
+        Returns:
+            LeagueSnapshot: All fetched overviews. Categories that failed are recorded
+                            in `currency_errors` / `item_errors`.
+        """
+        currency_types = list(CurrencyType if currency_types is None else currency_types)
+        item_types = list(ItemType if item_types is None else item_types)
+        tasks: dict[tuple[str, CurrencyType | ItemType], Callable[[], Any]] = {}
+        for currency_type in currency_types:
+            tasks[("currency", currency_type)] = (
+                lambda t=currency_type: self.get_currency_overview(t)
+            )
+        for item_type in item_types:
+            tasks[("item", item_type)] = lambda t=item_type: self.get_item_overview(t)
+        results = _run_concurrently(tasks, max_workers)
+        return _build_league_snapshot(
+            self.league,
+            {t: results[("currency", t)] for t in currency_types},
+            {t: results[("item", t)] for t in item_types},
+        )
+
+    def get_price_book(
+        self,
+        currency_types: Optional[Iterable[CurrencyType]] = None,
+        item_types: Optional[Iterable[ItemType]] = None,
+    ) -> PriceBook:
+        """
+        Fetches a league snapshot and builds a PriceBook from it, for valuing many
+        currencies and items at once. Categories that failed are left out.
+        """
+        return PriceBook.from_snapshot(
+            self.get_league_snapshot(currency_types, item_types)
+        )
 
     # --- Find Specific Item/Currency (from overview data) ---
     def find_currency_line(
         self, name: str, currency_type: CurrencyType
     ) -> Optional[CurrencyLine]:
-        overview = self.get_currency_overview(currency_type=currency_type)
-        name_lower = name.lower()
-        for line in overview.lines:
-            if line.currencyTypeName.lower() == name_lower:
-                return line
-        return None
+        return self.get_currency_overview(currency_type=currency_type).get_line(name)
 
     def find_item_line(self, name: str, item_type: ItemType) -> Optional[ItemLine]:
-        overview = self.get_item_overview(item_type=item_type)
-        name_lower = name.lower()
-        for line in overview.lines:
-            if line.name.lower() == name_lower:
-                return line
-        return None
+        return self.get_item_overview(item_type=item_type).get_line(name)
 
     # --- Helpers to get Numeric IDs for History ---
     def get_currency_id_by_name(
         self, currency_name: str, overview_type: CurrencyType = CurrencyType.CURRENCY
     ) -> Optional[int]:
         overview_data = self.get_currency_overview(currency_type=overview_type)
-        name_lower = currency_name.lower()
-        for detail in overview_data.currencyDetails:
-            if detail.name.lower() == name_lower:
-                return detail.id
-        return None
+        detail = overview_data.get_detail(currency_name)
+        return detail.id if detail is not None else None
 
     def get_item_id_by_name(self, item_name: str, item_type: ItemType) -> Optional[int]:
-        overview_data = self.get_item_overview(item_type=item_type)
-        name_lower = item_name.lower()
-        for line in overview_data.lines:
-            if line.name.lower() == name_lower:
-                return line.id
-        return None
+        line = self.get_item_overview(item_type=item_type).get_line(item_name)
+        return line.id if line is not None else None
 
     # --- History Endpoints (Corrected) ---
     def get_currency_history(
@@ -163,12 +856,7 @@ class PoENinja:
             "type": currency_type_for_history.value,
             "currencyId": str(currency_id),
         }
-        raw_data: Any = self._request("currencyhistory", params=params)
-        if not isinstance(raw_data, dict):  # Expecting a dict now for currency history
-            raise PoeNinjaAPIError(
-                f"Expected JSON object for currency history data, got {type(raw_data)}"
-            )
-        return parse_currency_history_response(cast(JsonObject, raw_data))
+        return cast(CurrencyHistoryResponse, self._fetch("currencyhistory", params))
 
     def get_item_history(
         self, item_type_for_history: ItemType, item_id: int
@@ -191,17 +879,74 @@ class PoENinja:
             "type": item_type_for_history.value,
             "itemId": str(item_id),
         }
-        raw_data: Any = self._request("itemhistory", params=params)
-        if not isinstance(
-            raw_data, list
-        ):  # itemhistory still assumed to return a list directly
-            raise PoeNinjaAPIError(
-                f"Expected JSON list for item history data, got {type(raw_data)}"
-            )
-        return parse_item_history_response(cast(JsonList, raw_data))
+        return cast(ItemHistoryResponse, self._fetch("itemhistory", params))
+
+    def get_currency_histories(
+        self,
+        currency_type_for_history: CurrencyType,
+        currency_ids: Iterable[int],
+        max_workers: int = 16,
+    ) -> dict[int, CurrencyHistoryResponse | PoeNinjaError]:
+        """
+        Fetches the history of many currencies concurrently.
+
+        Args:
+            currency_type_for_history (CurrencyType): The general type of the currencies.
+            currency_ids (Iterable[int]): Numeric currency IDs; duplicates are fetched once.
+            max_workers (int): Maximum number of requests in flight at once.
+
+        Returns:
+            dict[int, CurrencyHistoryResponse | PoeNinjaError]: The history of each ID,
+                or the error raised while fetching it.
+        """
+        return _run_concurrently(
+            {
+                currency_id: (
+                    lambda i=currency_id: self.get_currency_history(
+                        currency_type_for_history, i
+                    )
+                )
+                for currency_id in dict.fromkeys(currency_ids)
+            },
+            max_workers,
+        )
+
+    def get_item_histories(
+        self,
+        item_type_for_history: ItemType,
+        item_ids: Iterable[int],
+        max_workers: int = 16,
+    ) -> dict[int, ItemHistoryResponse | PoeNinjaError]:
+        """
+        Fetches the history of many items concurrently.
+
+        Args:
+            item_type_for_history (ItemType): The general type of the items.
+            item_ids (Iterable[int]): Numeric item IDs; duplicates are fetched once.
+            max_workers (int): Maximum number of requests in flight at once.
+
+        Returns:
+            dict[int, ItemHistoryResponse | PoeNinjaError]: The history of each ID,
+                or the error raised while fetching it.
+        """
+        return _run_concurrently(
+            {
+                item_id: (
+                    lambda i=item_id: self.get_item_history(item_type_for_history, i)
+                )
+                for item_id in dict.fromkeys(item_ids)
+            },
+            max_workers,
+        )
 
     def close(self) -> None:
+        if self.refresher is not None and self.refresher.client is self:
+            self.refresher.stop()
+        if not self._owns_resources:
+            return
         self.session.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
 
     def __enter__(self) -> "PoENinja":
         return self
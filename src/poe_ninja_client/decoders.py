@@ -0,0 +1,69 @@
+# src/poe_ninja_client/decoders.py
+import json
+from typing import Any, Callable
+
+# A decoder turns a raw response body into Python objects and raises ValueError
+# on malformed input.
+type JsonDecoder = Callable[[bytes], Any]
+
+
+def _orjson_decoder() -> JsonDecoder:
+    import orjson  # Optional dependency
+
+    # orjson.JSONDecodeError already subclasses ValueError.
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    import msgspec  # Optional dependency
+
+    decode = msgspec.json.Decoder().decode
+
+    def decode_json(body: bytes) -> Any:
+        try:
+            return decode(body)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode_json
+
+
+_BACKENDS: dict[str, Callable[[], JsonDecoder]] = {
+    "json": lambda: json.loads,
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+}
+
+# Tried in order by the "auto" backend.
+_AUTO_ORDER: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+
+def available_decoders() -> list[str]:
+    """Returns the names of the decoder backends that can be used here."""
+    available: list[str] = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def get_decoder(backend: str = "auto") -> JsonDecoder:
+    """
+    Returns the JSON decoder for `backend`: "json" (stdlib), "orjson", "msgspec", or
+    "auto" for the fastest one installed. Raises ImportError if an explicitly named
+    backend is not installed and ValueError for unknown names.
+    """
+    if backend == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return _BACKENDS[name]()
+            except ImportError:
+                continue
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON decoder {backend!r}; expected one of {', '.join(['auto', *_BACKENDS])}."
+        )
+    return _BACKENDS[backend]()
@@ -0,0 +1,149 @@
+# src/poe_ninja_client/diff.py
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, overload
+
+from .models import (
+    CurrencyLine,
+    CurrencyOverviewResponse,
+    ItemLine,
+    ItemOverviewResponse,
+    _line_values,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LineChange[L]:
+    """A line whose chaos value moved between two overviews."""
+
+    key: int | str  # ItemLine.id or CurrencyLine.detailsId
+    old: L
+    new: L
+    old_value: Optional[float]
+    new_value: Optional[float]
+    abs_change: float
+    rel_change: Optional[float]  # None when the old value was 0 or missing
+
+
+@dataclass(frozen=True)
+class SnapshotDiff[L]:
+    """
+    Lines added, removed and changed between two overviews of the same category.
+
+    `changed` only lists lines whose value moved by at least the thresholds passed
+    to diff_snapshots(); lines keep the order of the newer overview.
+    """
+
+    added: list[L] = field(default_factory=list)
+    removed: list[L] = field(default_factory=list)
+    changed: list[LineChange[L]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def top_movers(self, n: int = 10) -> list[LineChange[L]]:
+        """Returns the `n` changes with the largest relative move (either sign)."""
+        return sorted(
+            self.changed,
+            key=lambda c: math.inf if c.rel_change is None else abs(c.rel_change),
+            reverse=True,
+        )[:n]
+
+
+@overload
+def diff_snapshots(
+    old: ItemOverviewResponse,
+    new: ItemOverviewResponse,
+    min_abs_change: float = 0.0,
+    min_rel_change: float = 0.0,
+) -> SnapshotDiff[ItemLine]: ...
+
+
+@overload
+def diff_snapshots(
+    old: CurrencyOverviewResponse,
+    new: CurrencyOverviewResponse,
+    min_abs_change: float = 0.0,
+    min_rel_change: float = 0.0,
+) -> SnapshotDiff[CurrencyLine]: ...
+
+
+def diff_snapshots(
+    old: ItemOverviewResponse | CurrencyOverviewResponse,
+    new: ItemOverviewResponse | CurrencyOverviewResponse,
+    min_abs_change: float = 0.0,
+    min_rel_change: float = 0.0,
+) -> SnapshotDiff[ItemLine] | SnapshotDiff[CurrencyLine]:
+    """
+    Compares two overviews of the same category in one hashed pass.
+
+    Item lines are matched on `id` and compared on `chaosValue`; currency lines are
+    matched on `detailsId` and compared on `chaosEquivalent`. Keys and values are
+    read without building lazily parsed lines; only lines that end up in the diff
+    are materialized.
+
+    Args:
+        old (ItemOverviewResponse | CurrencyOverviewResponse): Earlier overview.
+        new (ItemOverviewResponse | CurrencyOverviewResponse): Later overview.
+        min_abs_change (float): Smallest absolute move (in chaos) to report.
+        min_rel_change (float): Smallest relative move to report, e.g. 0.05 for 5%.
+                                A move away from 0 always counts as large enough.
+
+    Returns:
+        SnapshotDiff: Added, removed and changed lines.
+    """
+    if type(old) is not type(new):
+        raise TypeError(
+            f"Cannot diff {type(old).__name__} against {type(new).__name__}."
+        )
+    if isinstance(new, ItemOverviewResponse):
+        key_attribute, value_attribute = "id", "chaosValue"
+    else:
+        key_attribute, value_attribute = "detailsId", "chaosEquivalent"
+    old_lines: Sequence[ItemLine | CurrencyLine] = old.lines
+    new_lines: Sequence[ItemLine | CurrencyLine] = new.lines
+
+    # key -> (position, value) for the old overview; matched keys are popped so the
+    # leftovers are exactly the removed lines.
+    unmatched: dict[int | str, tuple[int, Optional[float]]] = {
+        key: (position, value)
+        for position, (key, value) in enumerate(
+            zip(
+                _line_values(old_lines, key_attribute),
+                _line_values(old_lines, value_attribute),
+            )
+        )
+    }
+    diff = SnapshotDiff()
+    for position, (key, new_value) in enumerate(
+        zip(
+            _line_values(new_lines, key_attribute),
+            _line_values(new_lines, value_attribute),
+        )
+    ):
+        match = unmatched.pop(key, None)
+        if match is None:
+            diff.added.append(new_lines[position])
+            continue
+        old_position, old_value = match
+        if new_value == old_value:
+            continue
+        abs_change = (new_value or 0.0) - (old_value or 0.0)
+        rel_change = abs_change / old_value if old_value else None
+        if abs(abs_change) < min_abs_change:
+            continue
+        if rel_change is not None and abs(rel_change) < min_rel_change:
+            continue
+        diff.changed.append(
+            LineChange(
+                key,
+                old_lines[old_position],
+                new_lines[position],
+                old_value,
+                new_value,
+                abs_change,
+                rel_change,
+            )
+        )
+    diff.removed.extend(old_lines[position] for position, _ in unmatched.values())
+    return diff
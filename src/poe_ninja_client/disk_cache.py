@@ -0,0 +1,220 @@
+# src/poe_ninja_client/disk_cache.py
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping, Optional
+from urllib.parse import urlencode
+
+from .cache import DEFAULT_TTLS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+
+@dataclass(frozen=True)
+class DiskCacheEntry:
+    body: bytes
+    fetched_at: float  # Unix timestamp of the last full download or revalidation
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of raw response bodies that survives process restarts.
+
+    Each row stores the body, its fetch time and the HTTP validators (ETag /
+    Last-Modified). The database runs in WAL mode with a busy timeout, so several
+    processes can share one file. Once the stored bodies exceed `max_bytes` the
+    least recently read rows are deleted.
+
+    Threads borrow connections from a pool of at most `pool_size`, so the number of
+    open connections stays bounded however many threads use the cache.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 300.0,
+        max_bytes: Optional[int] = 512 * 1024 * 1024,
+        timeout: float = 30.0,
+        pool_size: int = 4,
+    ):
+        """
+        Args:
+            path (str | os.PathLike[str]): SQLite database file; created if missing.
+            ttls (Optional[Mapping[str, float]]): Per-endpoint freshness in seconds,
+                                                  merged over DEFAULT_TTLS.
+            default_ttl (float): Freshness for endpoints not listed in `ttls`.
+            max_bytes (Optional[int]): Maximum total body size, or None for no limit.
+            timeout (float): Seconds to wait for a lock held by another process.
+            pool_size (int): Maximum number of open SQLite connections; further
+                             threads wait for one to be returned.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1.")
+        self.path: str = os.fspath(path)
+        self.ttls: dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl: float = default_ttl
+        self.max_bytes: Optional[int] = max_bytes
+        self.timeout: float = timeout
+        self.pool_size: int = pool_size
+        self._idle: list[sqlite3.Connection] = []
+        self._open: int = 0
+        self._available = threading.Condition()
+        self._closed: bool = False
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Mapping[str, Any]) -> str:
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a pooled connection for one transaction. A connection is used by one
+        thread at a time and returned to the pool afterwards. Raises
+        sqlite3.ProgrammingError once the cache is closed.
+        """
+        with self._available:
+            while not self._closed and not self._idle and self._open >= self.pool_size:
+                self._available.wait()
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed DiskCache.")
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                self._open += 1
+                conn = None
+        if conn is None:
+            try:
+                conn = self._connect()
+            except BaseException:
+                with self._available:
+                    self._open -= 1
+                    self._available.notify()
+                raise
+        try:
+            with conn:
+                yield conn
+        finally:
+            with self._available:
+                if self._closed:
+                    conn.close()
+                    self._open -= 1
+                else:
+                    self._idle.append(conn)
+                self._available.notify()
+
+    def get(self, endpoint: str, params: Mapping[str, Any]) -> Optional[DiskCacheEntry]:
+        """Returns the stored entry, fresh or not, or None if nothing is stored."""
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT body, fetched_at, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+        body, fetched_at, etag, last_modified = row
+        return DiskCacheEntry(
+            body=bytes(body),
+            fetched_at=fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+            fresh=now - fetched_at < self.ttl_for(endpoint),
+        )
+
+    def put(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        if self.max_bytes is not None and len(body) > self.max_bytes:
+            return
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, body, size, fetched_at, last_access, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now, now, etag, last_modified),
+            )
+            if self.max_bytes is not None:
+                self._evict(conn, self.max_bytes)
+
+    def touch(self, endpoint: str, params: Mapping[str, Any]) -> None:
+        """Marks a stored body as freshly fetched, e.g. after a successful revalidation."""
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE responses SET fetched_at = ?, last_access = ? WHERE key = ?",
+                (now, now, self.make_key(endpoint, params)),
+            )
+
+    @staticmethod
+    def _evict(conn: sqlite3.Connection, max_bytes: int) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        stale_keys: list[tuple[str]] = []
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Closes the idle connections; ones in use are closed when returned. The cache
+        cannot be used afterwards.
+        """
+        with self._available:
+            for conn in self._idle:
+                conn.close()
+            self._open -= len(self._idle)
+            self._idle.clear()
+            self._closed = True
+            self._available.notify_all()
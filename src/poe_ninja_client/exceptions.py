@@ -26,9 +26,19 @@ class PoeNinjaAPIError(PoeNinjaError):
     pass
 
 
-# You can add more specific exceptions as needed, for example:
-# class RateLimitError(PoeNinjaRequestError):
-#     pass
+class RateLimitError(PoeNinjaRequestError):
+    """
+    Exception raised when poe.ninja answers 429 Too Many Requests and the
+    retries are exhausted. `retry_after` holds the server's Retry-After in seconds.
+    """
 
+    def __init__(
+        self, message: str, status_code: int = 429, retry_after: float = None
+    ):
+        super().__init__(message, status_code=status_code)
+        self.retry_after = retry_after
+
+
+# You can add more specific exceptions as needed, for example:
 # class InvalidLeagueError(PoeNinjaAPIError):
 #     pass
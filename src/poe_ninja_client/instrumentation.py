@@ -0,0 +1,310 @@
+# src/poe_ninja_client/instrumentation.py
+import logging
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from .exceptions import PoeNinjaError
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # Optional dependency: pip install poe-ninja-client[otel]
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+# Where the data of a request came from:
+#   "cache"       fresh in-memory cache entry (or the background refresher's copy)
+#   "coalesced"   waited for an identical request that was already in flight
+#   "disk"        fresh DiskCache body, decoded and parsed without a request
+#   "revalidated" conditional request answered with 304 Not Modified
+#   "network"     full response body downloaded, decoded and parsed
+#   "stream"      body streamed line by line by iter_item_overview
+SOURCES: tuple[str, ...] = (
+    "cache",
+    "coalesced",
+    "disk",
+    "revalidated",
+    "network",
+    "stream",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """
+    Timing and size of one client call, passed to every request hook.
+
+    `network_seconds` covers the HTTP exchange including retries and rate-limit
+    waits; decode and parse times are measured separately. Streamed requests
+    decode and parse while downloading, so only their time to the response
+    headers is reported as network time.
+    """
+
+    endpoint: str
+    params: Mapping[str, Any]
+    source: str  # One of SOURCES
+    started_at: float  # time.time() when the call began
+    duration_seconds: float
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    bytes: int = 0
+    lines: int = 0
+    retries: int = 0
+    status_code: Optional[int] = None
+    error: Optional[PoeNinjaError] = None
+
+
+type RequestHook = Callable[[RequestEvent], None]
+
+
+class _Measurement:
+    # Mutable accumulator threaded through one request while hooks are enabled.
+    __slots__ = (
+        "source",
+        "started_at",
+        "started",
+        "network_seconds",
+        "decode_seconds",
+        "parse_seconds",
+        "bytes",
+        "lines",
+        "retries",
+        "status_code",
+    )
+
+    def __init__(self, source: str = "network") -> None:
+        self.source: str = source  # Updated by the client as the request proceeds
+        self.started_at: float = time.time()
+        self.started: float = time.perf_counter()
+        self.network_seconds: float = 0.0
+        self.decode_seconds: float = 0.0
+        self.parse_seconds: float = 0.0
+        self.bytes: int = 0
+        self.lines: int = 0
+        self.retries: int = 0
+        self.status_code: Optional[int] = None
+
+    def event(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        error: Optional[PoeNinjaError] = None,
+    ) -> RequestEvent:
+        return RequestEvent(
+            endpoint,
+            params,
+            self.source,
+            self.started_at,
+            time.perf_counter() - self.started,
+            self.network_seconds,
+            self.decode_seconds,
+            self.parse_seconds,
+            self.bytes,
+            self.lines,
+            self.retries,
+            self.status_code,
+            error,
+        )
+
+
+def _count_lines(result: Any) -> int:
+    """Number of overview lines or history points in a parsed response."""
+    for attribute in ("lines", "data_points"):
+        lines = getattr(result, attribute, None)
+        if lines is not None:
+            return len(lines)
+    return len(getattr(result, "receive_currency_graph_data", ())) + len(
+        getattr(result, "pay_currency_graph_data", ())
+    )
+
+
+def _emit(hooks: Iterable[RequestHook], event: RequestEvent) -> None:
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Request hook %r failed", hook)
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Totals for one endpoint, as collected by ClientStats."""
+
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    disk_hits: int = 0
+    revalidated: int = 0
+    transferred: int = 0
+    retries: int = 0
+    bytes: int = 0
+    lines: int = 0
+    duration_seconds: float = 0.0
+    network_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+    @property
+    def cache_misses(self) -> int:
+        return self.calls - self.cache_hits - self.coalesced
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+    def add(self, event: RequestEvent) -> None:
+        self.calls += 1
+        if event.error is not None:
+            self.errors += 1
+        source = event.source
+        if source == "cache":
+            self.cache_hits += 1
+        elif source == "coalesced":
+            self.coalesced += 1
+        elif source == "disk":
+            self.disk_hits += 1
+        elif source == "revalidated":
+            self.revalidated += 1
+        elif event.error is None:  # "network" / "stream"
+            self.transferred += 1
+        self.retries += event.retries
+        self.bytes += event.bytes
+        self.lines += event.lines
+        self.duration_seconds += event.duration_seconds
+        self.network_seconds += event.network_seconds
+        self.decode_seconds += event.decode_seconds
+        self.parse_seconds += event.parse_seconds
+
+
+_COUNTERS: tuple[tuple[str, str], ...] = (
+    ("calls", "Client calls"),
+    ("errors", "Calls that raised an error"),
+    ("cache_hits", "Calls served from the in-memory cache"),
+    ("coalesced", "Calls that shared an in-flight request"),
+    ("disk_hits", "Calls served from the disk cache"),
+    ("revalidated", "Requests answered with 304 Not Modified"),
+    ("transferred", "Requests that downloaded a full body"),
+    ("retries", "Retried HTTP requests"),
+    ("bytes", "Response body bytes received"),
+    ("lines", "Overview lines and history points parsed"),
+    ("duration_seconds", "Total time spent in client calls"),
+    ("network_seconds", "Time spent waiting for poe.ninja"),
+    ("decode_seconds", "Time spent decoding JSON"),
+    ("parse_seconds", "Time spent building models"),
+)
+
+
+class ClientStats:
+    """
+    Per-endpoint request metrics; a request hook that aggregates RequestEvents.
+
+    Register it with `client.add_hook(stats)` (or `client.enable_stats()`). All
+    counters are cumulative and safe to read from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self._endpoints[event.endpoint] = EndpointStats()
+            stats.add(event)
+
+    def endpoint(self, endpoint: str) -> EndpointStats:
+        """Returns a copy of the totals for `endpoint`."""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            return EndpointStats() if stats is None else _copy(stats)
+
+    def endpoints(self) -> dict[str, EndpointStats]:
+        """Returns a copy of the totals of every endpoint seen so far."""
+        with self._lock:
+            return {name: _copy(stats) for name, stats in self._endpoints.items()}
+
+    def total(self) -> EndpointStats:
+        """Returns the totals over all endpoints."""
+        total = EndpointStats()
+        for stats in self.endpoints().values():
+            for f in fields(EndpointStats):
+                setattr(total, f.name, getattr(total, f.name) + getattr(stats, f.name))
+        return total
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "poe_ninja_client") -> str:
+        """Renders the counters in the Prometheus text exposition format."""
+        endpoints = self.endpoints()
+        output: list[str] = []
+        for name, description in _COUNTERS:
+            metric = f"{prefix}_{name}_total"
+            output.append(f"# HELP {metric} {description}.")
+            output.append(f"# TYPE {metric} counter")
+            for endpoint, stats in sorted(endpoints.items()):
+                output.append(f'{metric}{{endpoint="{endpoint}"}} {getattr(stats, name)}')
+        return "\n".join(output) + "\n"
+
+
+def _copy(stats: EndpointStats) -> EndpointStats:
+    return EndpointStats(*(getattr(stats, f.name) for f in fields(EndpointStats)))
+
+
+class OpenTelemetryHook:
+    """
+    Request hook that records every RequestEvent as an OpenTelemetry span.
+
+    Spans are named "poe_ninja <endpoint>" and back-dated to the start of the call;
+    sizes, timings and the data source are set as attributes. Requires the
+    opentelemetry-api package (`pip install poe-ninja-client[otel]`).
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Args:
+            tracer (Any): Tracer to create spans with. Defaults to the global
+                          tracer provider's tracer for this package.
+        """
+        if otel_trace is None:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api. Install it with: pip install poe-ninja-client[otel]"
+            )
+        self.tracer = tracer if tracer is not None else otel_trace.get_tracer(__name__)
+
+    def __call__(self, event: RequestEvent) -> None:
+        start_ns = int(event.started_at * 1e9)
+        span = self.tracer.start_span(
+            f"poe_ninja {event.endpoint}",
+            kind=otel_trace.SpanKind.CLIENT,
+            start_time=start_ns,
+            attributes={
+                "poe_ninja.endpoint": event.endpoint,
+                "poe_ninja.source": event.source,
+                "poe_ninja.bytes": event.bytes,
+                "poe_ninja.lines": event.lines,
+                "poe_ninja.retries": event.retries,
+                "poe_ninja.network_ms": event.network_seconds * 1000,
+                "poe_ninja.decode_ms": event.decode_seconds * 1000,
+                "poe_ninja.parse_ms": event.parse_seconds * 1000,
+                **{
+                    f"poe_ninja.param.{key}": str(value)
+                    for key, value in event.params.items()
+                },
+                **(
+                    {"http.response.status_code": event.status_code}
+                    if event.status_code is not None
+                    else {}
+                ),
+            },
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start_ns + int(event.duration_seconds * 1e9))
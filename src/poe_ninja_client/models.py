@@ -1,20 +1,313 @@
 # src/poe_ninja_client/models.py
+import json
+import math
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Optional, List, cast
+from functools import cached_property, partial
+from itertools import islice
+from typing import Any, Optional, List, cast, overload
 
 # Type alias for raw JSON objects when structure is not fully defined or varies
 type JsonObject = dict[str, Any]
 type JsonList = list[JsonObject]
 
 
+class LazyLines[T](Sequence[T]):
+    """
+    Read-only list of overview lines kept as their raw JSON dicts. A line is parsed
+    the first time it is indexed or iterated, then reused.
+    """
+
+    __slots__ = ("raw", "_parse", "_lines")
+
+    def __init__(self, raw: list[JsonObject], parse: Callable[[JsonObject], T]):
+        self.raw: list[JsonObject] = raw
+        self._parse: Callable[[JsonObject], T] = parse
+        self._lines: list[Optional[T]] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+        line = self._lines[index]
+        if line is None:
+            line = self._parse(self.raw[index])
+            self._lines[index] = line
+        return line
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyLines({len(self.raw)} lines)"
+
+
+def _line_values(lines: Sequence[Any], attribute: str, default: Any = None) -> Iterator[Any]:
+    """
+    Yields `attribute` of every line. Lazy lines are read from their raw dicts so
+    building an index does not parse them.
+    """
+    if isinstance(lines, LazyLines):
+        return (raw.get(attribute, default) for raw in lines.raw)
+    if isinstance(lines, ColumnarItemLines):
+        return iter(lines.columns.values(attribute))
+    return (getattr(line, attribute) for line in lines)
+
+
+class StringTable:
+    """
+    Intern table for the repeated string fields of item lines (INTERNED_FIELDS).
+
+    Every overview repeats the same base types, item types, variants, icon URLs, art
+    file names and flavour texts, and every later poll of it repeats those plus the
+    names and details ids of its lines. Parsing through one table makes all lines
+    and all snapshots that hold an equal string share a single copy of it. Each
+    client keeps a table for its lifetime; pass the same one to several clients to
+    share it. Once the table holds `max_size` strings the oldest quarter of them is
+    dropped; strings already handed out stay valid, and ones still in use are
+    shared again from their next poll on.
+    """
+
+    __slots__ = ("max_size", "_strings", "_lock")
+
+    INTERNED_FIELDS: tuple[str, ...] = (
+        "name",
+        "detailsId",
+        "baseType",
+        "itemType",
+        "variant",
+        "icon",
+        "artFilename",
+        "flavourText",
+    )
+
+    def __init__(self, max_size: int = 1_000_000):
+        """
+        Args:
+            max_size (int): Distinct strings kept before the oldest are dropped.
+        """
+        self.max_size: int = max_size
+        # None is kept as an entry so that missing fields take the fast path.
+        self._strings: dict[Optional[str], Optional[str]] = {None: None}
+        # Clients share a table across threads; lookups need no lock, but inserts
+        # and eviction must not interleave.
+        self._lock = threading.Lock()
+
+    def intern(self, value: Any) -> Any:
+        """Returns the table's copy of `value`; anything but a str is returned as is."""
+        try:
+            return self._strings[value]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable
+            return value
+        if value.__class__ is not str:
+            return value
+        with self._lock:
+            # Another thread may have added it since the lookup above.
+            interned = self._strings.setdefault(value, value)
+            if len(self._strings) > self.max_size:
+                self._evict()
+        return interned
+
+    def __len__(self) -> int:
+        return len(self._strings) - 1
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and value in self._strings
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strings.clear()
+            self._strings[None] = None
+
+    def _evict(self) -> None:
+        # Called with the lock held. Dicts keep insertion order; the None entry
+        # always comes first.
+        strings = self._strings
+        count = max(1, (len(strings) - 1) // 4)
+        for value in list(islice(strings, 1, count + 1)):
+            strings.pop(value, None)
+
+
+def _first_positions[K](keys: Iterable[Optional[K]]) -> dict[K, int]:
+    """Maps each key to the position of its first occurrence; None is skipped."""
+    positions: dict[K, int] = {}
+    for position, key in enumerate(keys):
+        if key is not None and key not in positions:
+            positions[key] = position
+    return positions
+
+
+def _folded(value: Any) -> Optional[str]:
+    """Lower-cases an index key; anything but a str (e.g. a null name) is None."""
+    return value.lower() if isinstance(value, str) else None
+
+
+# --- Sparklines ---
+class _SparkLineBuffer:
+    """
+    The points of every sparkline of one response, as a single float64 array.
+
+    Parsers add sparklines while they collect the points in a list, then call
+    finish() once to convert them all in one step. Sparklines without points or
+    change are not stored; the interned EMPTY instance of their class is used.
+    """
+
+    __slots__ = ("kind", "values", "view", "_points")
+
+    def __init__(self, kind: type["_SparkLine"]):
+        self.kind: type[_SparkLine] = kind
+        self.values: array = array("d")
+        self.view: memoryview = memoryview(b"").cast("d")
+        self._points: list[Optional[float | int]] = []
+
+    def add(self, raw: JsonObject) -> "_SparkLine":
+        points = raw.get("data")
+        total = raw.get("totalChange", 0.0)
+        if not points and total == 0.0:
+            return self.kind.EMPTY
+        pending = self._points
+        sparkline = _new_object(self.kind)
+        sparkline._buffer = self
+        sparkline._start = len(pending)
+        if points:
+            pending.extend(points)
+            sparkline._length = len(points)  # Small ints are cached; offsets are not
+        else:
+            sparkline._length = 0
+        sparkline._total = total
+        return sparkline
+
+    def finish(self) -> None:
+        points = self._points
+        try:
+            values = array("d", points)
+        except TypeError:  # Null points
+            missing = self.kind._MISSING
+            values = array("d", [missing if value is None else value for value in points])
+        self._set_values(values)
+        self._points = []
+
+    def _set_values(self, values: array) -> None:
+        self.values = values
+        # Read-only, so a sparkline's data cannot change its neighbours' points.
+        self.view = memoryview(values).toreadonly()
+
+    def __getstate__(self) -> tuple[type["_SparkLine"], array]:
+        return self.kind, self.values
+
+    def __setstate__(self, state: tuple[type["_SparkLine"], array]) -> None:
+        self.kind = state[0]
+        self._points = []
+        self._set_values(state[1])
+
+
+_new_object = object.__new__
+
+
+class _SparkLine:
+    """
+    Seven-day price change of a line: `totalChange` and the daily `data` points.
+
+    The points are a slice of a float64 buffer that the parser shares between all
+    sparklines of a response, so a sparkline is one small object instead of a list
+    of boxed floats. `data` is a read-only memoryview of that slice (`.tolist()`
+    copies it out).
+    """
+
+    __slots__ = ("_buffer", "_start", "_length", "_total")
+
+    EMPTY: "_SparkLine"
+    # Stored for null points.
+    _MISSING: float = math.nan
+
+    def __init__(
+        self, data: Iterable[Optional[float | int]] = (), totalChange: float = 0.0
+    ):
+        buffer = _SparkLineBuffer(type(self))
+        buffer._points = list(data)
+        buffer.finish()
+        self._buffer = buffer
+        self._start = 0
+        self._length = len(buffer.values)
+        self._total = totalChange
+
+    @property
+    def data(self) -> memoryview:
+        start = self._start
+        return self._buffer.view[start : start + self._length]
+
+    @property
+    def totalChange(self) -> float:
+        return self._total
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _SparkLine):
+            return NotImplemented
+        if not (isinstance(other, type(self)) or isinstance(self, type(other))):
+            return NotImplemented
+        # Compared as bytes so that NaN points are equal to themselves.
+        return (
+            self.totalChange == other.totalChange
+            and self.data.tobytes() == other.data.tobytes()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(data={self.data.tolist()}, totalChange={self.totalChange!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self is type(self).EMPTY:
+            return getattr, (type(self), "EMPTY")
+        # The sparklines of a pickled response share one copy of their buffer.
+        return _sparkline_view, (self._buffer, self._start, self._length, self._total)
+
+
+def _sparkline_view(
+    buffer: _SparkLineBuffer, start: int, length: int, total: float
+) -> _SparkLine:
+    sparkline = _new_object(buffer.kind)
+    sparkline._buffer = buffer
+    sparkline._start = start
+    sparkline._length = length
+    sparkline._total = total
+    return sparkline
+
+
 # --- Currency Overview Models ---
-@dataclass(frozen=True)
-class SparkLineData:
-    data: list[float | int] = field(default_factory=list)
-    totalChange: float = 0.0
+# Line, sparkline and history point models are slotted: a full-league snapshot holds
+# tens of thousands of them and a per-instance __dict__ would dominate its memory.
+# Response models keep their __dict__ for the lazily built lookup indexes.
+class SparkLineData(_SparkLine):
+    """Sparkline of a CurrencyLine; null points are stored as NaN."""
 
+    __slots__ = ()
 
-@dataclass(frozen=True)
+    EMPTY: "SparkLineData"  # Shared by every line without sparkline data
+
+
+SparkLineData.EMPTY = SparkLineData()
+
+
+@dataclass(frozen=True, slots=True)
 class CurrencyTradeData:
     id: int  # noqa: A003
     league_id: int
@@ -28,7 +321,7 @@ class CurrencyTradeData:
     listing_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CurrencyLine:
     currencyTypeName: str
     pay: Optional[CurrencyTradeData]
@@ -41,7 +334,7 @@ class CurrencyLine:
     detailsId: str  # This is the string ID like "chaos-orb", "divine-orb"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CurrencyDetail:
     """Represents a currency item listed in the currencyDetails part of an overview."""
 
@@ -53,18 +346,66 @@ class CurrencyDetail:
 
 @dataclass(frozen=True)
 class CurrencyOverviewResponse:
-    lines: list[CurrencyLine]
+    """
+    Parsed currencyoverview response.
+    Lookups go through case-insensitive dict indexes built on first use; when several
+    entries share a key the first one in API order wins.
+    """
+
+    lines: Sequence[CurrencyLine]
     currencyDetails: list[CurrencyDetail]
 
+    @cached_property
+    def _lines_by_name(self) -> dict[str, int]:
+        return _first_positions(
+            map(_folded, _line_values(self.lines, "currencyTypeName", "Unknown"))
+        )
+
+    @cached_property
+    def _lines_by_details_id(self) -> dict[str, int]:
+        return _first_positions(map(_folded, _line_values(self.lines, "detailsId", "")))
+
+    @cached_property
+    def _details_by_name(self) -> dict[str, CurrencyDetail]:
+        return {
+            detail.name.lower(): detail
+            for detail in reversed(self.currencyDetails)
+            if isinstance(detail.name, str)
+        }
+
+    @cached_property
+    def _details_by_id(self) -> dict[int, CurrencyDetail]:
+        return {detail.id: detail for detail in reversed(self.currencyDetails)}
+
+    def get_line(self, name: str) -> Optional[CurrencyLine]:
+        position = self._lines_by_name.get(name.lower())
+        return self.lines[position] if position is not None else None
+
+    def get_line_by_details_id(self, details_id: str) -> Optional[CurrencyLine]:
+        position = self._lines_by_details_id.get(details_id.lower())
+        return self.lines[position] if position is not None else None
+
+    def get_detail(self, name: str) -> Optional[CurrencyDetail]:
+        return self._details_by_name.get(name.lower())
+
+    def get_detail_by_id(self, currency_id: int) -> Optional[CurrencyDetail]:
+        return self._details_by_id.get(currency_id)
+
 
 # --- Item Overview Models ---
-@dataclass(frozen=True)
-class ItemSparkLine:
-    data: list[Optional[float | int]] = field(default_factory=list)
-    totalChange: float = 0.0
+class ItemSparkLine(_SparkLine):
+    """Sparkline of an ItemLine; null points are stored as 0.0."""
 
+    __slots__ = ()
 
-@dataclass(frozen=True)
+    _MISSING = 0.0
+    EMPTY: "ItemSparkLine"  # Shared by every line with an empty sparkline
+
+
+ItemSparkLine.EMPTY = ItemSparkLine()
+
+
+@dataclass(frozen=True, slots=True)
 class ItemLine:
     id: int  # noqa: A003
     name: str
@@ -91,20 +432,180 @@ class ItemLine:
     divineValue: Optional[float] = None
     count: Optional[int] = None
     detailsId: Optional[str] = None  # This is the string ID used for itemhistory typeId
+    listingCount: Optional[int] = None
+
+
+type ItemVariantKey = tuple[
+    str, Optional[str], Optional[int], Optional[int], Optional[int]
+]
+
+
+def _item_variant_key(
+    name: str,
+    variant: Optional[str],
+    links: Optional[int],
+    gemLevel: Optional[int],
+    gemQuality: Optional[int],
+) -> ItemVariantKey:
+    return (
+        name.lower(),
+        _folded(variant),
+        links,
+        gemLevel,
+        gemQuality,
+    )
 
 
 @dataclass(frozen=True)
 class ItemOverviewResponse:
-    lines: list[ItemLine]
+    """
+    Parsed itemoverview response.
+    Lookups go through case-insensitive dict indexes built on first use; when several
+    lines share a key (e.g. gem or link variants of one name) the first one in API
+    order wins. Use `get_variant` to pick a specific variant.
+    """
+
+    lines: Sequence[ItemLine]
+
+    @cached_property
+    def _lines_by_name(self) -> dict[str, int]:
+        return _first_positions(
+            map(_folded, _line_values(self.lines, "name", "Unknown Item"))
+        )
+
+    @cached_property
+    def _lines_by_id(self) -> dict[int, int]:
+        return _first_positions(
+            item_id if isinstance(item_id, int) else None
+            for item_id in _line_values(self.lines, "id", 0)
+        )
+
+    @cached_property
+    def _lines_by_details_id(self) -> dict[str, int]:
+        return _first_positions(map(_folded, _line_values(self.lines, "detailsId")))
+
+    @cached_property
+    def _lines_by_variant(self) -> dict[ItemVariantKey, int]:
+        return _first_positions(
+            _item_variant_key(*key) if isinstance(key[0], str) else None
+            for key in zip(
+                _line_values(self.lines, "name", "Unknown Item"),
+                _line_values(self.lines, "variant"),
+                _line_values(self.lines, "links"),
+                _line_values(self.lines, "gemLevel"),
+                _line_values(self.lines, "gemQuality"),
+            )
+        )
+
+    def _line_at(self, position: Optional[int]) -> Optional[ItemLine]:
+        return self.lines[position] if position is not None else None
+
+    def get_line(self, name: str) -> Optional[ItemLine]:
+        return self._line_at(self._lines_by_name.get(name.lower()))
+
+    def get_line_by_id(self, item_id: int) -> Optional[ItemLine]:
+        return self._line_at(self._lines_by_id.get(item_id))
+
+    def get_line_by_details_id(self, details_id: str) -> Optional[ItemLine]:
+        return self._line_at(self._lines_by_details_id.get(details_id.lower()))
+
+    def get_variant(
+        self,
+        name: str,
+        variant: Optional[str] = None,
+        links: Optional[int] = None,
+        gemLevel: Optional[int] = None,
+        gemQuality: Optional[int] = None,
+    ) -> Optional[ItemLine]:
+        """Finds the line matching name, variant, links, gemLevel and gemQuality exactly."""
+        return self._line_at(
+            self._lines_by_variant.get(
+                _item_variant_key(name, variant, links, gemLevel, gemQuality)
+            )
+        )
 
 
 # --- History Endpoint Models (Refined for Currency History) ---
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoeNinjaHistoryDataPoint:
     daysAgo: int
     value: float
 
 
+class HistorySeries(Sequence[PoeNinjaHistoryDataPoint]):
+    """
+    A history graph stored as two contiguous columns: `days_ago` (int64) and
+    `values` (float64), both `array.array`s parsed straight from the JSON.
+
+    It behaves like a read-only list of PoeNinjaHistoryDataPoint; those objects are
+    only created the first time an element is accessed or iterated. Analytics can
+    use the columns directly, or `to_numpy()` for zero-copy NumPy views.
+    """
+
+    __slots__ = ("days_ago", "values", "_points")
+
+    def __init__(
+        self,
+        days_ago: Optional[array] = None,
+        values: Optional[array] = None,
+    ):
+        self.days_ago: array = days_ago if days_ago is not None else array("q")
+        self.values: array = values if values is not None else array("d")
+        self._points: Optional[list[PoeNinjaHistoryDataPoint]] = None
+
+    @property
+    def points(self) -> list[PoeNinjaHistoryDataPoint]:
+        if self._points is None:
+            self._points = [
+                PoeNinjaHistoryDataPoint(daysAgo=days_ago, value=value)
+                for days_ago, value in zip(self.days_ago, self.values)
+            ]
+        return self._points
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """Returns (days_ago, values) as NumPy arrays sharing this series' memory."""
+        import numpy as np  # Optional dependency
+
+        return (
+            np.frombuffer(self.days_ago, dtype=np.int64),
+            np.frombuffer(self.values, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> PoeNinjaHistoryDataPoint: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[PoeNinjaHistoryDataPoint]: ...
+    def __getitem__(
+        self, index: int | slice
+    ) -> PoeNinjaHistoryDataPoint | list[PoeNinjaHistoryDataPoint]:
+        return self.points[index]
+
+    def __iter__(self) -> Iterator[PoeNinjaHistoryDataPoint]:
+        return iter(self.points)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HistorySeries):
+            return self.days_ago == other.days_ago and self.values == other.values
+        if isinstance(other, Sequence):
+            return self.points == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"HistorySeries(days_ago={self.days_ago.tolist()}, values={self.values.tolist()})"
+
+    def __getstate__(self) -> tuple[array, array]:
+        return self.days_ago, self.values
+
+    def __setstate__(self, state: tuple[array, array]) -> None:
+        self.days_ago, self.values = state
+        self._points = None
+
+
 @dataclass(frozen=True)
 class CurrencyHistoryResponse:  # Specific to currencyhistory endpoint structure
     """
@@ -112,12 +613,8 @@ class CurrencyHistoryResponse:  # Specific to currencyhistory endpoint structure
     Contains 'pay' and 'receive' graph data.
     """
 
-    receive_currency_graph_data: list[PoeNinjaHistoryDataPoint] = field(
-        default_factory=list
-    )
-    pay_currency_graph_data: list[PoeNinjaHistoryDataPoint] = field(
-        default_factory=list
-    )
+    receive_currency_graph_data: HistorySeries = field(default_factory=HistorySeries)
+    pay_currency_graph_data: HistorySeries = field(default_factory=HistorySeries)
     # Other potential top-level fields from the response can be added here.
 
 
@@ -129,16 +626,16 @@ class ItemHistoryResponse:  # For itemhistory endpoint (assuming simple list for
     If it also returns a complex object, this model will need adjustment.
     """
 
-    data_points: list[PoeNinjaHistoryDataPoint] = field(default_factory=list)
+    data_points: HistorySeries = field(default_factory=HistorySeries)
 
 
 # --- Parser Helper Functions ---
-def _parse_sparkline_data(data: Optional[JsonObject]) -> SparkLineData:
+def _parse_sparkline_data(
+    data: Optional[JsonObject], buffer: _SparkLineBuffer
+) -> SparkLineData:
     if data is None:
-        return SparkLineData(data=[], totalChange=0.0)
-    return SparkLineData(
-        data=data.get("data", []), totalChange=data.get("totalChange", 0.0)
-    )
+        return SparkLineData.EMPTY
+    return cast(SparkLineData, buffer.add(data))
 
 
 def _parse_currency_trade_data(
@@ -160,19 +657,30 @@ def _parse_currency_trade_data(
     )
 
 
-def _parse_currency_line(data: JsonObject) -> CurrencyLine:
+def _parse_currency_line(
+    data: JsonObject, buffer: Optional[_SparkLineBuffer] = None
+) -> CurrencyLine:
+    """
+    Parses one line. Its sparklines are added to `buffer`, which the caller must
+    finish(); without one the line gets a buffer of its own.
+    """
+    if buffer is None:
+        buffer = _SparkLineBuffer(SparkLineData)
+        line = _parse_currency_line(data, buffer)
+        buffer.finish()
+        return line
     return CurrencyLine(
         currencyTypeName=data.get("currencyTypeName", "Unknown"),
         pay=_parse_currency_trade_data(data.get("pay")),
         receive=_parse_currency_trade_data(data.get("receive")),
-        paySparkLine=_parse_sparkline_data(data.get("paySparkLine")),
-        receiveSparkLine=_parse_sparkline_data(data.get("receiveSparkLine")),
+        paySparkLine=_parse_sparkline_data(data.get("paySparkLine"), buffer),
+        receiveSparkLine=_parse_sparkline_data(data.get("receiveSparkLine"), buffer),
         chaosEquivalent=data.get("chaosEquivalent", 0.0),
         lowConfidencePaySparkLine=_parse_sparkline_data(
-            data.get("lowConfidencePaySparkLine")
+            data.get("lowConfidencePaySparkLine"), buffer
         ),
         lowConfidenceReceiveSparkLine=_parse_sparkline_data(
-            data.get("lowConfidenceReceiveSparkLine")
+            data.get("lowConfidenceReceiveSparkLine"), buffer
         ),
         detailsId=data.get("detailsId", ""),
     )
@@ -187,11 +695,28 @@ def _parse_currency_detail(data: JsonObject) -> CurrencyDetail:
     )
 
 
-def parse_currency_overview_response(data: JsonObject) -> CurrencyOverviewResponse:
+def parse_currency_overview_response(
+    data: JsonObject, lazy: bool = False
+) -> CurrencyOverviewResponse:
+    """
+    Parses a currencyoverview response. With `lazy=True` the lines are kept as raw
+    dicts and each CurrencyLine is built on first access.
+    """
     lines_data = data.get("lines", [])
-    parsed_lines = [
-        _parse_currency_line(line) for line in lines_data if isinstance(line, dict)
-    ]
+    parsed_lines: Sequence[CurrencyLine]
+    if lazy:
+        parsed_lines = LazyLines(
+            [line for line in lines_data if isinstance(line, dict)],
+            _parse_currency_line,
+        )
+    else:
+        buffer = _SparkLineBuffer(SparkLineData)
+        parsed_lines = [
+            _parse_currency_line(line, buffer)
+            for line in lines_data
+            if isinstance(line, dict)
+        ]
+        buffer.finish()
 
     currency_details_raw = data.get("currencyDetails", [])
     parsed_currency_details = [
@@ -205,72 +730,386 @@ def parse_currency_overview_response(data: JsonObject) -> CurrencyOverviewRespon
     )
 
 
-def _parse_item_sparkline(data: Optional[JsonObject]) -> Optional[ItemSparkLine]:
+def _parse_item_sparkline(
+    data: Optional[JsonObject], buffer: _SparkLineBuffer
+) -> Optional[ItemSparkLine]:
     if data is None:
         return None
-    return ItemSparkLine(
-        data=[val if val is not None else 0.0 for val in data.get("data", [])],
-        totalChange=data.get("totalChange", 0.0),
-    )
+    return cast(ItemSparkLine, buffer.add(data))
+
+
+class _LazyItemSparkLine(ItemSparkLine):
+    """ItemSparkLine that copies its raw JSON points the first time `data` is read."""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: JsonObject):
+        self._raw = raw
+        self._total = raw.get("totalChange", 0.0)
+
+    @property
+    def data(self) -> memoryview:
+        try:
+            self._buffer
+        except AttributeError:
+            parsed = ItemSparkLine(self._raw.get("data") or (), self._total)
+            self._buffer, self._start, self._length = parsed._buffer, 0, parsed._length
+        return super().data
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        data = self.data  # Copies the raw points into a buffer to pickle
+        if not data and self._total == 0.0:
+            return getattr, (ItemSparkLine, "EMPTY")
+        return super().__reduce__()
 
 
-def _parse_item_line(data: JsonObject) -> ItemLine:
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _lazy_item_sparkline(
+    data: Optional[JsonObject], buffer: _SparkLineBuffer
+) -> Optional[ItemSparkLine]:
+    return _LazyItemSparkLine(data) if data is not None else None
+
+
+def _parse_item_line(
+    data: JsonObject,
+    parse_sparkline: Callable[
+        [Optional[JsonObject], _SparkLineBuffer], Optional[ItemSparkLine]
+    ] = _parse_item_sparkline,
+    buffer: Optional[_SparkLineBuffer] = None,
+    strings: Optional[StringTable] = None,
+) -> ItemLine:
+    """
+    Parses one line. Its sparklines are added to `buffer`, which the caller must
+    finish(); without one the line gets a buffer of its own. The repeated string
+    fields are interned in `strings` if given.
+    """
+    if buffer is None:
+        buffer = _SparkLineBuffer(ItemSparkLine)
+        line = _parse_item_line(data, parse_sparkline, buffer, strings)
+        buffer.finish()
+        return line
+    intern = strings.intern if strings is not None else _identity
     return ItemLine(
         id=data.get("id", 0),
-        name=data.get("name", "Unknown Item"),
-        icon=data.get("icon"),
+        name=intern(data.get("name", "Unknown Item")),
+        icon=intern(data.get("icon")),
         mapTier=data.get("mapTier"),
         levelRequired=data.get("levelRequired"),
-        baseType=data.get("baseType"),
+        baseType=intern(data.get("baseType")),
         stackSize=data.get("stackSize"),
-        variant=data.get("variant"),
+        variant=intern(data.get("variant")),
         prophecyText=data.get("prophecyText"),
-        artFilename=data.get("artFilename"),
+        artFilename=intern(data.get("artFilename")),
         links=data.get("links"),
         itemClass=data.get("itemClass"),
-        sparkline=_parse_item_sparkline(data.get("sparkline")),
-        lowConfidenceSparkline=_parse_item_sparkline(
-            data.get("lowConfidenceSparkline")
+        sparkline=parse_sparkline(data.get("sparkline"), buffer),
+        lowConfidenceSparkline=parse_sparkline(
+            data.get("lowConfidenceSparkline"), buffer
         ),
         implicitModifiers=data.get("implicitModifiers", []),
         explicitModifiers=data.get("explicitModifiers", []),
-        flavourText=data.get("flavourText"),
+        flavourText=intern(data.get("flavourText")),
         corrupted=data.get("corrupted"),
         gemLevel=data.get("gemLevel"),
         gemQuality=data.get("gemQuality"),
-        itemType=data.get("itemType"),
+        itemType=intern(data.get("itemType")),
         chaosValue=data.get("chaosValue"),
         divineValue=data.get("divineValue"),
         count=data.get("count"),
-        detailsId=data.get("detailsId"),
+        detailsId=intern(data.get("detailsId")),
+        listingCount=data.get("listingCount"),
     )
 
 
-def parse_item_overview_response(data: JsonObject) -> ItemOverviewResponse:
+def parse_item_overview_response(
+    data: JsonObject, lazy: bool = False, strings: Optional[StringTable] = None
+) -> ItemOverviewResponse:
+    """
+    Parses an itemoverview response. With `lazy=True` the lines are kept as raw dicts
+    and each ItemLine is built on first access; its sparklines are decoded only when
+    their `data` is read. With `strings` the repeated string fields of the lines are
+    interned in that table.
+    """
     lines_data = data.get("lines", [])
+    if lazy:
+        return ItemOverviewResponse(
+            lines=LazyLines(
+                [line for line in lines_data if isinstance(line, dict)],
+                partial(
+                    _parse_item_line,
+                    parse_sparkline=_lazy_item_sparkline,
+                    strings=strings,
+                ),
+            )
+        )
+    buffer = _SparkLineBuffer(ItemSparkLine)
     parsed_lines = [
-        _parse_item_line(line) for line in lines_data if isinstance(line, dict)
+        _parse_item_line(line, buffer=buffer, strings=strings)
+        for line in lines_data
+        if isinstance(line, dict)
     ]
+    buffer.finish()
     return ItemOverviewResponse(lines=parsed_lines)
 
 
-def _parse_history_data_point_list(
-    raw_data_list: Optional[JsonList],
-) -> list[PoeNinjaHistoryDataPoint]:
-    """Helper to parse a list of raw history data points."""
+# --- Columnar Item Lines ---
+# Stand-in for None in the integer columns; poe.ninja never sends this value.
+_MISSING_INT: int = -(2**63)
+
+_ITEM_INT_FIELDS: tuple[str, ...] = (
+    "id",
+    "mapTier",
+    "levelRequired",
+    "stackSize",
+    "links",
+    "itemClass",
+    "gemLevel",
+    "gemQuality",
+    "count",
+    "listingCount",
+)
+_ITEM_FLOAT_FIELDS: tuple[str, ...] = ("chaosValue", "divineValue")
+_ITEM_STR_FIELDS: tuple[str, ...] = (
+    "name",
+    "icon",
+    "baseType",
+    "variant",
+    "prophecyText",
+    "artFilename",
+    "flavourText",
+    "itemType",
+    "detailsId",
+)
+_ITEM_SPARKLINE_FIELDS: tuple[str, ...] = ("sparkline", "lowConfidenceSparkline")
+_ITEM_JSON_FIELDS: tuple[str, ...] = ("implicitModifiers", "explicitModifiers")
+# Defaults applied by _parse_item_line, so columns read like parsed lines.
+_ITEM_DEFAULTS: dict[str, Any] = {"id": 0, "name": "Unknown Item"}
+
+
+def _int_cell(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return _MISSING_INT
+    return int(value)
+
+
+def _float_cell(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return math.nan
+    return float(value)
+
+
+class ItemColumns:
+    """
+    The lines of an item overview stored column by column: numbers in `array`s,
+    strings in lists with repeated values shared, sparklines as one flat float64
+    buffer with offsets (the ItemSparkLines built from it are views of that buffer),
+    and modifier lists as JSON text.
+
+    This form pickles to a fraction of the size of a list of ItemLine objects and
+    unpickles without running any per-line Python code, which is what makes
+    parsing in worker processes worthwhile.
+    """
+
+    __slots__ = ("length", "ints", "floats", "strings", "corrupted", "sparklines", "json")
+
+    def __init__(self) -> None:
+        self.length: int = 0
+        self.ints: dict[str, array] = {name: array("q") for name in _ITEM_INT_FIELDS}
+        self.floats: dict[str, array] = {
+            name: array("d") for name in _ITEM_FLOAT_FIELDS
+        }
+        self.strings: dict[str, list[Optional[str]]] = {
+            name: [] for name in _ITEM_STR_FIELDS
+        }
+        self.corrupted: array = array("b")  # -1 for None
+        # name -> (offsets into points, points, totalChange); NaN total = no sparkline
+        self.sparklines: dict[str, tuple[array, _SparkLineBuffer, array]] = {
+            name: (array("q", [0]), _SparkLineBuffer(ItemSparkLine), array("d"))
+            for name in _ITEM_SPARKLINE_FIELDS
+        }
+        self.json: dict[str, list[str]] = {name: [] for name in _ITEM_JSON_FIELDS}
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_raw(cls, raw_lines: Iterable[JsonObject]) -> "ItemColumns":
+        """
+        Builds the columns from the raw JSON dicts of an itemoverview response.
+        Raises OverflowError (or ValueError for NaN) if an integer field does not
+        fit in int64; such responses have to be parsed into ItemLine objects.
+        """
+        columns = cls()
+        shared: dict[str, str] = {}  # One object per distinct string
+        for data in raw_lines:
+            columns.length += 1
+            for name, column in columns.ints.items():
+                column.append(_int_cell(data.get(name, _ITEM_DEFAULTS.get(name))))
+            for name, column in columns.floats.items():
+                column.append(_float_cell(data.get(name)))
+            for name, strings in columns.strings.items():
+                value = data.get(name, _ITEM_DEFAULTS.get(name))
+                if isinstance(value, str):
+                    value = shared.setdefault(value, value)
+                strings.append(value)
+            corrupted = data.get("corrupted")
+            columns.corrupted.append(-1 if corrupted is None else int(bool(corrupted)))
+            for name, (offsets, buffer, totals) in columns.sparklines.items():
+                sparkline = data.get(name)
+                points = buffer._points
+                if sparkline is None:
+                    totals.append(math.nan)
+                else:
+                    points.extend(sparkline.get("data") or ())
+                    # NaN marks a missing sparkline, so a null change is stored as 0.0.
+                    total = _float_cell(sparkline.get("totalChange", 0.0))
+                    totals.append(0.0 if math.isnan(total) else total)
+                offsets.append(len(points))
+            for name, texts in columns.json.items():
+                modifiers = data.get(name)
+                text = json.dumps(modifiers) if modifiers else ""
+                texts.append(shared.setdefault(text, text))
+        for _, buffer, _ in columns.sparklines.values():
+            buffer.finish()
+        return columns
+
+    def intern_strings(self, strings: StringTable) -> None:
+        """Replaces the values of the interned string fields with `strings`' copies."""
+        for name in StringTable.INTERNED_FIELDS:
+            column = self.strings[name]
+            column[:] = map(strings.intern, column)
+
+    def value(self, attribute: str, index: int) -> Any:
+        """Returns `attribute` of line `index` as ItemLine would hold it."""
+        if attribute in self.ints:
+            value = self.ints[attribute][index]
+            return None if value == _MISSING_INT else value
+        if attribute in self.floats:
+            value = self.floats[attribute][index]
+            return None if math.isnan(value) else value
+        if attribute in self.strings:
+            return self.strings[attribute][index]
+        if attribute == "corrupted":
+            flag = self.corrupted[index]
+            return None if flag < 0 else bool(flag)
+        if attribute in self.sparklines:
+            offsets, buffer, totals = self.sparklines[attribute]
+            total = totals[index]
+            if math.isnan(total):
+                return None
+            start, stop = offsets[index], offsets[index + 1]
+            if start == stop and total == 0.0:
+                return ItemSparkLine.EMPTY
+            return _sparkline_view(buffer, start, stop - start, total)
+        if attribute in self.json:
+            text = self.json[attribute][index]
+            return json.loads(text) if text else []
+        raise AttributeError(attribute)
+
+    def values(self, attribute: str) -> list[Any]:
+        """Returns `attribute` of every line, without building ItemLine objects."""
+        if attribute in self.ints:
+            return [
+                None if value == _MISSING_INT else value
+                for value in self.ints[attribute]
+            ]
+        if attribute in self.floats:
+            return [
+                None if math.isnan(value) else value
+                for value in self.floats[attribute]
+            ]
+        if attribute in self.strings:
+            return self.strings[attribute]
+        return [self.value(attribute, index) for index in range(self.length)]
+
+    def line(self, index: int) -> ItemLine:
+        return ItemLine(
+            **{name: self.value(name, index) for name in _ITEM_LINE_FIELDS}
+        )
+
+
+_ITEM_LINE_FIELDS: tuple[str, ...] = tuple(
+    item_field.name for item_field in ItemLine.__dataclass_fields__.values()
+)
+
+
+class ColumnarItemLines(Sequence[ItemLine]):
+    """
+    Read-only list of item lines backed by ItemColumns. A line is built the first
+    time it is indexed or iterated, then reused; lookups and indexes read the
+    columns directly.
+    """
+
+    __slots__ = ("columns", "_lines")
+
+    def __init__(self, columns: ItemColumns):
+        self.columns: ItemColumns = columns
+        self._lines: list[Optional[ItemLine]] = [None] * columns.length
+
+    def __len__(self) -> int:
+        return self.columns.length
+
+    @overload
+    def __getitem__(self, index: int) -> ItemLine: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[ItemLine]: ...
+    def __getitem__(self, index: int | slice) -> ItemLine | list[ItemLine]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.columns.length))]
+        line = self._lines[index]
+        if line is None:
+            line = self.columns.line(range(self.columns.length)[index])
+            self._lines[index] = line
+        return line
+
+    def __iter__(self) -> Iterator[ItemLine]:
+        for index in range(self.columns.length):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnarItemLines({self.columns.length} lines)"
+
+    def __getstate__(self) -> ItemColumns:
+        return self.columns
+
+    def __setstate__(self, columns: ItemColumns) -> None:
+        self.columns = columns
+        self._lines = [None] * columns.length
+
+
+def _parse_history_series(raw_data_list: Optional[JsonList]) -> HistorySeries:
+    """Helper to parse a list of raw history data points into columns."""
+    days_ago_column: array = array("q")
+    value_column: array = array("d")
     if raw_data_list is None:
-        return []
+        return HistorySeries(days_ago_column, value_column)
 
-    parsed_data_points: list[PoeNinjaHistoryDataPoint] = []
     for point_data in raw_data_list:
         if isinstance(point_data, dict):
             days_ago = point_data.get("daysAgo")
             value = point_data.get("value")
             if isinstance(days_ago, int) and isinstance(value, (float, int)):
-                parsed_data_points.append(
-                    PoeNinjaHistoryDataPoint(daysAgo=days_ago, value=float(value))
-                )
-    return parsed_data_points
+                try:
+                    value = float(value)
+                    days_ago_column.append(days_ago)
+                except OverflowError:
+                    continue  # Does not fit int64 / float64, like other bad points
+                value_column.append(value)
+    return HistorySeries(days_ago_column, value_column)
 
 
 def parse_currency_history_response(
@@ -284,10 +1123,8 @@ def parse_currency_history_response(
     receive_data = raw_response_object.get("receiveCurrencyGraphData")
     pay_data = raw_response_object.get("payCurrencyGraphData")
 
-    parsed_receive_data = _parse_history_data_point_list(
-        cast(Optional[JsonList], receive_data)
-    )
-    parsed_pay_data = _parse_history_data_point_list(cast(Optional[JsonList], pay_data))
+    parsed_receive_data = _parse_history_series(cast(Optional[JsonList], receive_data))
+    parsed_pay_data = _parse_history_series(cast(Optional[JsonList], pay_data))
 
     return CurrencyHistoryResponse(
         receive_currency_graph_data=parsed_receive_data,
@@ -300,5 +1137,5 @@ def parse_item_history_response(raw_history_data_list: JsonList) -> ItemHistoryR
     Parses the list of raw history data points from the itemhistory endpoint.
     Assuming itemhistory returns a simple list of data points.
     """
-    parsed_data_points = _parse_history_data_point_list(raw_history_data_list)
+    parsed_data_points = _parse_history_series(raw_history_data_list)
     return ItemHistoryResponse(data_points=parsed_data_points)
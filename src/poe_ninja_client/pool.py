@@ -0,0 +1,201 @@
+# src/poe_ninja_client/pool.py
+import os
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from .cache import ResponseCache
+from .client import PoENinja, _build_league_snapshot, _run_concurrently
+from .decoders import JsonDecoder
+from .enums import CurrencyType, ItemType
+from .instrumentation import ClientStats, RequestHook
+from .models import StringTable
+from .ratelimit import RateLimiter, RetryPolicy
+from .refresher import BackgroundRefresher, ChangeHook, RefreshCategory
+from .snapshot import LeagueSnapshot
+
+# Placeholder league of the pool's internal client, which never sends requests of
+# its own; views are created for every real league.
+_POOL_LEAGUE: str = "Standard"
+
+
+class PoENinjaPool:
+    """
+    League-agnostic owner of one HTTP connection pool, response cache, disk cache,
+    rate limiter and set of hooks, handing out cheap per-league PoENinja views.
+
+    `pool.league(name)` (or `pool[name]`) returns the same view for the same league
+    every time. Views behave like ordinary clients, but a request made through one
+    of them warms the cache for all of them and counts against the same rate
+    budget. Closing a view is a no-op for the shared resources; close the pool
+    instead.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "Python PoENinjaClient/1.0.4",
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        pool_maxsize: int = 32,
+        cache_path: Optional[str | os.PathLike[str]] = None,
+        lazy_parsing: bool = False,
+        json_decoder: str | JsonDecoder = "auto",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Iterable[RequestHook] = (),
+        parse_executor: Optional[Executor] = None,
+        string_table: Optional[StringTable] = None,
+    ):
+        """
+        Takes the arguments of PoENinja except the league; they apply to every
+        league of the pool.
+
+        Args:
+            pool_maxsize (int): Connections kept alive to poe.ninja, shared by all
+                                leagues; should be at least the worker count used
+                                for sweeps.
+        """
+        self._client = PoENinja(
+            _POOL_LEAGUE,
+            user_agent=user_agent,
+            cache=cache,
+            use_cache=use_cache,
+            pool_maxsize=pool_maxsize,
+            cache_path=cache_path,
+            lazy_parsing=lazy_parsing,
+            json_decoder=json_decoder,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            hooks=hooks,
+            parse_executor=parse_executor,
+            string_table=string_table,
+        )
+        self._views: dict[str, PoENinja] = {}
+        self._lock = threading.Lock()
+
+    def league(self, league: str) -> PoENinja:
+        """Returns the client view for `league`, creating it on first use."""
+        with self._lock:
+            view = self._views.get(league)
+            if view is None:
+                view = self._views[league] = self._client.for_league(league)
+            return view
+
+    def __getitem__(self, league: str) -> PoENinja:
+        return self.league(league)
+
+    @property
+    def leagues(self) -> list[str]:
+        """Leagues a view has been created for."""
+        with self._lock:
+            return list(self._views)
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._client.cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._client.rate_limiter
+
+    @property
+    def refresher(self) -> Optional[BackgroundRefresher]:
+        return self._client.refresher
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Registers `hook` for the requests of every league."""
+        self._client.add_hook(hook)
+
+    def enable_stats(self) -> ClientStats:
+        """Returns ClientStats covering the requests of every league."""
+        return self._client.enable_stats()
+
+    def start_background_refresh(
+        self,
+        categories: Mapping[str, Iterable[RefreshCategory]],
+        interval: Optional[float] = None,
+        refresh_ahead: float = 30.0,
+        max_workers: int = 4,
+        on_change: Optional[ChangeHook] = None,
+    ) -> BackgroundRefresher:
+        """
+        Starts one BackgroundRefresher for all leagues; every view, including ones
+        created later, serves the refreshed data. See
+        PoENinja.start_background_refresh. The pool has no league of its own, so
+        further categories must be registered with an explicit league:
+        `pool.refresher.register(category, league)`.
+
+        Args:
+            categories (Mapping[str, Iterable[RefreshCategory]]): League -> categories
+                                                                  to keep fresh.
+        """
+        refresher = self._client.start_background_refresh(
+            (),
+            interval=interval,
+            refresh_ahead=refresh_ahead,
+            max_workers=max_workers,
+            on_change=on_change,
+        )
+        refresher.default_league = None
+        for league, league_categories in categories.items():
+            for category in league_categories:
+                refresher.register(category, league)
+        return refresher
+
+    def get_league_snapshots(
+        self,
+        leagues: Iterable[str],
+        currency_types: Optional[Iterable[CurrencyType]] = None,
+        item_types: Optional[Iterable[ItemType]] = None,
+        max_workers: int = 32,
+    ) -> dict[str, LeagueSnapshot]:
+        """
+        Fetches the overviews of several leagues in one concurrent sweep.
+
+        All (league, category) requests go to a single thread pool, so a sweep of
+        five leagues takes about as long as the slowest request rather than five
+        single-league sweeps in a row.
+
+        Args:
+            leagues (Iterable[str]): Leagues to fetch.
+            currency_types (Optional[Iterable[CurrencyType]]): Categories to fetch;
+                                                               all of them if omitted.
+            item_types (Optional[Iterable[ItemType]]): Categories to fetch; all of them
+                                                       if omitted.
+            max_workers (int): Size of the thread pool used for the sweep.
+
+        Returns:
+            dict[str, LeagueSnapshot]: League -> snapshot, in the order given.
+        """
+        currency_types = list(CurrencyType if currency_types is None else currency_types)
+        item_types = list(ItemType if item_types is None else item_types)
+        views = {league: self.league(league) for league in leagues}
+        tasks: dict[tuple[str, str, CurrencyType | ItemType], Callable[[], Any]] = {}
+        for league, view in views.items():
+            for currency_type in currency_types:
+                tasks[(league, "currency", currency_type)] = (
+                    lambda v=view, t=currency_type: v.get_currency_overview(t)
+                )
+            for item_type in item_types:
+                tasks[(league, "item", item_type)] = (
+                    lambda v=view, t=item_type: v.get_item_overview(t)
+                )
+        results = _run_concurrently(tasks, max_workers)
+        return {
+            league: _build_league_snapshot(
+                league,
+                {t: results[(league, "currency", t)] for t in currency_types},
+                {t: results[(league, "item", t)] for t in item_types},
+            )
+            for league in views
+        }
+
+    def close(self) -> None:
+        """Stops the shared refresher and closes the connection pool and disk cache."""
+        self._client.close()
+
+    def __enter__(self) -> "PoENinjaPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
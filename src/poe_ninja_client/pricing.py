@@ -0,0 +1,213 @@
+# src/poe_ninja_client/pricing.py
+import math
+import sys
+from array import array
+from typing import Any, Iterable, Optional, Sequence
+
+from .models import _line_values
+from .snapshot import LeagueSnapshot
+
+CHAOS_ORB: str = "Chaos Orb"
+DIVINE_ORB: str = "Divine Orb"
+
+# Currencies that prices are commonly quoted in; conversions into these are
+# precomputed for every entry of a PriceBook.
+DEFAULT_ANCHORS: tuple[str, ...] = (
+    CHAOS_ORB,
+    DIVINE_ORB,
+    "Exalted Orb",
+    "Mirror of Kalandra",
+)
+
+
+class PriceBook:
+    """
+    Chaos values of every currency and item of a league, in one dense table.
+
+    Built once from a LeagueSnapshot, it answers price lookups and currency
+    conversions with a dict lookup and a multiplication instead of searching
+    overviews. Names and detailsIds are matched case-insensitively; when a name
+    appears more than once, currencies win over items and earlier categories over
+    later ones, as in LeagueSnapshot.find(). Unknown or unpriced entries are NaN in
+    the batch methods and None in the single-value ones.
+
+    The value of every entry in each anchor currency (Chaos, Divine, ...) is
+    computed when the book is built, so `values(names, to=DIVINE_ORB)` is a plain
+    gather from a precomputed column.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        chaos_values: Iterable[float],
+        details_ids: Optional[Sequence[Optional[str]]] = None,
+        anchors: Iterable[str] = DEFAULT_ANCHORS,
+    ):
+        """
+        Args:
+            names (Sequence[str]): Entry names, in priority order.
+            chaos_values (Iterable[float]): Chaos value of each entry (NaN if unknown).
+            details_ids (Optional[Sequence[Optional[str]]]): poe.ninja detailsId of
+                                                            each entry.
+            anchors (Iterable[str]): Currencies to precompute conversions into.
+        """
+        self.names: list[str] = list(names)
+        self.chaos_values: array = array("d", chaos_values)
+        if len(self.chaos_values) != len(self.names):
+            raise ValueError("names and chaos_values must have the same length.")
+        self._index: dict[str, int] = {}
+        for position, name in enumerate(self.names):
+            self._index.setdefault(name.lower(), position)
+        for position, details_id in enumerate(details_ids or ()):
+            if details_id:
+                self._index.setdefault(details_id.lower(), position)
+        # Anchor name -> value of every entry in that anchor.
+        self._anchor_columns: dict[str, array] = {}
+        for anchor in anchors:
+            anchor_value = self.chaos_value(anchor)
+            if anchor_value is None or anchor_value <= 0:
+                continue
+            self._anchor_columns[anchor.lower()] = array(
+                "d", (value / anchor_value for value in self.chaos_values)
+            )
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: LeagueSnapshot, anchors: Iterable[str] = DEFAULT_ANCHORS
+    ) -> "PriceBook":
+        """
+        Builds a PriceBook from every line of `snapshot`: currencies are valued at
+        their `chaosEquivalent`, items at their `chaosValue`. Chaos Orb is always
+        present at 1.0. Lazily parsed overviews are read without building lines.
+        """
+        names: list[str] = [CHAOS_ORB]
+        details_ids: list[Optional[str]] = ["chaos-orb"]
+        chaos_values: list[float] = [1.0]
+
+        def add(
+            lines: Any, name_field: str, value_field: str, default: Optional[float]
+        ) -> None:
+            for name, details_id, value in zip(
+                _line_values(lines, name_field),
+                _line_values(lines, "detailsId"),
+                _line_values(lines, value_field, default),
+            ):
+                # Lines without a name cannot be looked up; null prices are unknown.
+                if not isinstance(name, str):
+                    continue
+                names.append(name)
+                details_ids.append(details_id)
+                chaos_values.append(math.nan if value is None else value)
+
+        for currency_overview in snapshot.currency.values():
+            add(currency_overview.lines, "currencyTypeName", "chaosEquivalent", 0.0)
+        for item_overview in snapshot.items.values():
+            add(item_overview.lines, "name", "chaosValue", None)
+        return cls(names, chaos_values, details_ids, anchors)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._index
+
+    @property
+    def anchors(self) -> list[str]:
+        """Anchor currencies that conversions were precomputed for."""
+        return [
+            self.names[self._index[anchor]] for anchor in self._anchor_columns
+        ]
+
+    # --- Single lookups ---
+    def index_of(self, name: str) -> Optional[int]:
+        """Returns the table position of a name or detailsId, or None."""
+        return self._index.get(name.lower())
+
+    def chaos_value(self, name: str) -> Optional[float]:
+        position = self._index.get(name.lower())
+        if position is None:
+            return None
+        value = self.chaos_values[position]
+        return None if math.isnan(value) else value
+
+    def value(self, name: str, to: str = CHAOS_ORB) -> Optional[float]:
+        """Returns the price of one `name` expressed in currency `to`."""
+        chaos_value = self.chaos_value(name)
+        rate = self.chaos_value(to)
+        if chaos_value is None or not rate:
+            return None
+        return chaos_value / rate
+
+    def rate(self, from_: str, to: str) -> float:
+        """
+        Returns how many `to` one `from_` is worth.
+        Raises KeyError for unknown or unpriced currencies.
+        """
+        from_value = self.chaos_value(from_)
+        to_value = self.chaos_value(to)
+        if from_value is None:
+            raise KeyError(from_)
+        if not to_value:
+            raise KeyError(to)
+        return from_value / to_value
+
+    # --- Batch lookups ---
+    def convert(self, values: Any, from_: str = CHAOS_ORB, to: str = DIVINE_ORB) -> Any:
+        """
+        Converts amounts of `from_` into `to` with one multiplication each.
+
+        Args:
+            values (Any): A number, a sequence of numbers, or a NumPy array.
+            from_ (str): Currency the amounts are in.
+            to (str): Currency to express them in.
+
+        Returns:
+            Any: A float for a number, a NumPy array for a NumPy array, and an
+                 array('d') otherwise.
+        """
+        factor = self.rate(from_, to)
+        if isinstance(values, (int, float)):
+            return values * factor
+        numpy = sys.modules.get("numpy")  # Only present if the caller uses NumPy
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return values * factor
+        return array("d", [value * factor for value in values])
+
+    def indices(self, names: Iterable[str]) -> array:
+        """Returns the table position of each name or detailsId (-1 if unknown)."""
+        index = self._index
+        return array("q", [index.get(name.lower(), -1) for name in names])
+
+    def values(self, names: Iterable[str], to: str = CHAOS_ORB) -> array:
+        """
+        Returns the price of each name in currency `to` as an array('d'), NaN for
+        names that are unknown or unpriced. Uses the precomputed column when `to`
+        is an anchor. Raises KeyError if `to` is unknown or unpriced, as rate() does.
+        """
+        column = self._anchor_columns.get(to.lower())
+        factor = 1.0
+        if column is None:
+            column = self.chaos_values
+            factor = self.rate(CHAOS_ORB, to)
+        return array(
+            "d",
+            [
+                column[position] * factor if position >= 0 else math.nan
+                for position in self.indices(names)
+            ],
+        )
+
+    def total(self, names: Iterable[str], to: str = CHAOS_ORB) -> float:
+        """Sums the prices of `names` in currency `to`, skipping unknown ones."""
+        return math.fsum(v for v in self.values(names, to) if not math.isnan(v))
+
+    def to_numpy(self, to: str = CHAOS_ORB) -> Any:
+        """Returns the value of every entry in `to` as a NumPy array (no copy for anchors)."""
+        import numpy as np  # Optional dependency
+
+        column = self._anchor_columns.get(to.lower())
+        if column is not None:
+            return np.frombuffer(column, dtype=np.float64)
+        return np.frombuffer(self.chaos_values, dtype=np.float64) * self.rate(
+            CHAOS_ORB, to
+        )
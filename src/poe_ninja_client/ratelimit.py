@@ -0,0 +1,177 @@
+# src/poe_ninja_client/ratelimit.py
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .exceptions import PoeNinjaRequestError
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Ceiling for a rate learned from 429s when none was configured; far above what
+# poe.ninja allows, it only keeps the rate finite.
+_MAX_ADAPTIVE_RATE: float = 1000.0
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by every thread and asyncio task of a client.
+
+    `rate` requests per second are allowed on average, with bursts of up to `burst`
+    requests. Callers wait for a token instead of sending, so concurrent requests
+    are spread out rather than rejected by the server.
+
+    The rate adapts to the server: a 429 response multiplies it by
+    `backoff_factor` (down to `min_rate`) and pauses all callers for the
+    Retry-After period, and every successful request raises it again by a
+    fiftieth of the configured rate. Sustained throughput therefore settles just
+    under the server's limit. With `rate=None` requests are not throttled until the
+    first 429; the limiter then takes the number of requests that succeeded in the
+    preceding second as its rate and adapts from there. Without a configured rate
+    there is no ceiling: each success raises the rate by a fiftieth of its current
+    value, so even a rate seeded at `min_rate` recovers after a few hundred requests.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        backoff_factor: float = 0.5,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.max_rate: Optional[float] = rate
+        self.rate: Optional[float] = rate
+        self.burst: float = float(burst if burst is not None else max(1, int(rate or 1)))
+        self.min_rate: float = min(min_rate, rate) if rate is not None else min_rate
+        self.backoff_factor: float = backoff_factor
+        self.throttled: int = 0
+        self._tokens: float = self.burst
+        self._updated: float = time.monotonic()
+        # Nobody may send before this point in time (set from Retry-After).
+        self._paused_until: float = 0.0
+        self._backoff_until: float = 0.0
+        # Completion times while unthrottled, to seed the rate on the first 429.
+        self._recent: deque[float] = deque(maxlen=256)
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Takes a token and returns 0.0, or returns the seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.rate is None:
+                return 0.0
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        # The wait is recomputed after every sleep, so a penalty that arrives in
+        # the meantime applies to callers that are already waiting.
+        waited = False
+        while (delay := self._try_acquire()) > 0:
+            waited = True
+            time.sleep(delay)
+        if waited:
+            self.throttled += 1
+
+    async def acquire_async(self) -> None:
+        waited = False
+        while (delay := self._try_acquire()) > 0:
+            waited = True
+            await asyncio.sleep(delay)
+        if waited:
+            self.throttled += 1
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Slows down after a 429 and pauses everyone for `retry_after` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate is None:
+                succeeded = sum(1 for t in self._recent if t > now - 1.0)
+                # Only the current rate is seeded; max_rate stays None so that the
+                # rate can grow past what happened to succeed before the first 429.
+                self.rate = max(self.min_rate, float(succeeded))
+                self.burst = 1.0
+                self._updated = now
+                self._recent.clear()
+            # Requests that were already in flight tend to be rejected together;
+            # count them as one signal rather than collapsing the rate.
+            if now >= self._backoff_until:
+                self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+                self._backoff_until = now + max(retry_after or 0.0, 1.0)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.rate is None:
+                self._recent.append(time.monotonic())
+            elif self.max_rate is None:
+                self.rate = min(_MAX_ADAPTIVE_RATE, self.rate + self.rate / 50)
+            elif self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 50)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retries for idempotent GETs that failed with a transient error.
+
+    Connection errors, timeouts and the statuses in `retry_statuses` are retried up
+    to `max_retries` times. The delay is the server's Retry-After when given,
+    otherwise full-jitter exponential backoff: a random time between zero and
+    `backoff_base * 2**attempt`, capped at `backoff_max`. A Retry-After longer than
+    `max_retry_after` is not waited for and the error is raised instead.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 120.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def delay_for(self, error: PoeNinjaRequestError, attempt: int) -> Optional[float]:
+        """Returns the seconds to wait before retry number `attempt + 1`, or None."""
+        if attempt >= self.max_retries:
+            return None
+        if error.status_code is not None and error.status_code not in self.retry_statuses:
+            return None
+        retry_after: Optional[float] = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
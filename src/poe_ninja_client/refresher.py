@@ -0,0 +1,251 @@
+# src/poe_ninja_client/refresher.py
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from .cache import DEFAULT_TTLS, make_cache_key
+from .enums import CurrencyType, ItemType
+from .exceptions import PoeNinjaError
+
+if TYPE_CHECKING:
+    from .client import PoENinja
+
+logger = logging.getLogger(__name__)
+
+type RefreshCategory = CurrencyType | ItemType
+# Called as on_change(league, category, old overview, new overview).
+type ChangeHook = Callable[[str, RefreshCategory, Any, Any], None]
+
+
+@dataclass(slots=True)
+class _Registration:
+    league: str
+    category: RefreshCategory
+    endpoint: str
+    params: dict[str, Any]
+    key: Hashable
+    value: Any = None
+    error: Optional[PoeNinjaError] = None
+    refreshed_at: Optional[float] = None
+    due: float = field(default_factory=time.monotonic)
+    running: bool = False
+
+
+class BackgroundRefresher:
+    """
+    Keeps registered overview categories fresh from a background thread.
+
+    Each registered (league, category) pair is fetched once right away and then
+    again `refresh_ahead` seconds before its cache entry expires (or every
+    `interval` seconds, if given), on a pool of `max_workers` threads. Refreshes
+    revalidate with a conditional request and write the result into the client's
+    cache, so readers hit a fresh entry instead of waiting for poe.ninja.
+
+    `get()` never touches the network: it returns the last successfully fetched
+    overview, even while a refresh is failing. A failed refresh is retried after
+    `error_retry` seconds. `on_change` is called from a worker thread whenever a
+    refresh returns data that differs from the previous result.
+    """
+
+    def __init__(
+        self,
+        client: "PoENinja",
+        interval: Optional[float] = None,
+        refresh_ahead: float = 30.0,
+        max_workers: int = 4,
+        error_retry: float = 30.0,
+        on_change: Optional[ChangeHook] = None,
+    ):
+        """
+        Args:
+            client (PoENinja): Client whose session, rate limiter and caches are used.
+            interval (Optional[float]): Fixed seconds between refreshes. By default
+                                        each category is refreshed `refresh_ahead`
+                                        seconds before its cache TTL runs out.
+            refresh_ahead (float): Seconds before expiry at which to refresh.
+            max_workers (int): Number of refreshes that may run at once.
+            error_retry (float): Seconds to wait before retrying a failed refresh.
+            on_change (Optional[ChangeHook]): Called as (league, category, old, new)
+                                              when a category's data changes.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.client: "PoENinja" = client
+        self.interval: Optional[float] = interval
+        self.refresh_ahead: float = refresh_ahead
+        self.max_workers: int = max_workers
+        self.error_retry: float = error_retry
+        self.on_change: Optional[ChangeHook] = on_change
+        # League of registrations that do not name one; None requires a league.
+        self.default_league: Optional[str] = client.league
+        self.refresh_count: int = 0
+        self._registrations: dict[Hashable, _Registration] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._ready = threading.Condition(self._lock)
+        self._stopped = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _request_for(
+        self, category: RefreshCategory, league: Optional[str]
+    ) -> tuple[str, dict[str, Any]]:
+        endpoint = (
+            "currencyoverview" if isinstance(category, CurrencyType) else "itemoverview"
+        )
+        league = league or self.default_league
+        if not league:
+            raise ValueError("This refresher has no default league; pass one.")
+        return endpoint, {"league": league, "type": category.value}
+
+    def register(self, category: RefreshCategory, league: Optional[str] = None) -> None:
+        """Starts refreshing `category` of `league` (`default_league` if omitted)."""
+        endpoint, params = self._request_for(category, league)
+        key = make_cache_key(endpoint, params)
+        with self._lock:
+            if key not in self._registrations:
+                self._registrations[key] = _Registration(
+                    params["league"], category, endpoint, params, key
+                )
+        self._wake.set()
+
+    def unregister(self, category: RefreshCategory, league: Optional[str] = None) -> None:
+        endpoint, params = self._request_for(category, league)
+        with self._lock:
+            self._registrations.pop(make_cache_key(endpoint, params), None)
+
+    def _registration(
+        self, category: RefreshCategory, league: Optional[str]
+    ) -> Optional[_Registration]:
+        endpoint, params = self._request_for(category, league)
+        return self._registrations.get(make_cache_key(endpoint, params))
+
+    def get(self, category: RefreshCategory, league: Optional[str] = None) -> Any:
+        """Returns the last good overview for a registered category, or None."""
+        registration = self._registration(category, league)
+        return registration.value if registration is not None else None
+
+    def error(
+        self, category: RefreshCategory, league: Optional[str] = None
+    ) -> Optional[PoeNinjaError]:
+        """Returns the error of the latest refresh if it failed, else None."""
+        registration = self._registration(category, league)
+        return registration.error if registration is not None else None
+
+    def lookup(self, key: Hashable) -> Any:
+        """Returns the last good value for a cache key, or None if not registered."""
+        registration = self._registrations.get(key)
+        return registration.value if registration is not None else None
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every registered category has been fetched once."""
+        with self._ready:
+            return self._ready.wait_for(
+                lambda: all(
+                    r.value is not None for r in self._registrations.values()
+                ),
+                timeout,
+            )
+
+    # --- Scheduling ---
+    def _interval_for(self, endpoint: str) -> float:
+        if self.interval is not None:
+            return self.interval
+        if self.client.cache is not None:
+            ttl = self.client.cache.ttl_for(endpoint)
+        else:
+            ttl = DEFAULT_TTLS.get(endpoint, 300.0)
+        return max(1.0, ttl - self.refresh_ahead)
+
+    def start(self) -> "BackgroundRefresher":
+        if self._thread is None:
+            self._stopped.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="poe-ninja-refresh"
+            )
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._executor,),
+                name="poe-ninja-refresher",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops scheduling refreshes and waits for running ones to finish."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run(self, executor: ThreadPoolExecutor) -> None:
+        while not self._stopped.is_set():
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                due = [
+                    r
+                    for r in self._registrations.values()
+                    if not r.running and r.due <= now
+                ]
+                for registration in due:
+                    registration.running = True
+                next_due = min(
+                    (r.due for r in self._registrations.values() if not r.running),
+                    default=now + 60.0,
+                )
+            for registration in due:
+                executor.submit(self._refresh, registration)
+            self._wake.wait(max(0.0, next_due - now))
+
+    def _refresh(self, registration: _Registration) -> None:
+        client = self.client
+        endpoint, params, key = (
+            registration.endpoint,
+            registration.params,
+            registration.key,
+        )
+        try:
+            value = client.single_flight.do(
+                key,
+                lambda: client._fetch_uncached(endpoint, params, key, revalidate=True),
+            )
+        except PoeNinjaError as e:
+            with self._lock:
+                registration.error = e
+                registration.due = time.monotonic() + self.error_retry
+                registration.running = False
+            self._wake.set()
+            return
+        with self._ready:
+            old = registration.value
+            registration.value = value
+            registration.error = None
+            registration.refreshed_at = time.monotonic()
+            registration.due = registration.refreshed_at + self._interval_for(endpoint)
+            registration.running = False
+            self.refresh_count += 1
+            self._ready.notify_all()
+        self._wake.set()
+        # A 304 hands back the very same object, so identity settles most checks.
+        changed = old is not None and value is not old and value != old
+        if self.on_change is not None and changed:
+            try:
+                self.on_change(registration.league, registration.category, old, value)
+            except Exception:
+                logger.exception("on_change hook failed for %s", registration.category)
+
+    def __enter__(self) -> "BackgroundRefresher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
@@ -0,0 +1,108 @@
+# src/poe_ninja_client/snapshot.py
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Iterator, Optional, Sequence
+
+from .enums import CurrencyType, ItemType
+from .exceptions import PoeNinjaError
+from .models import (
+    CurrencyLine,
+    CurrencyOverviewResponse,
+    ItemLine,
+    ItemOverviewResponse,
+    _line_values,
+)
+
+type SnapshotLine = CurrencyLine | ItemLine
+type SnapshotCategory = CurrencyType | ItemType
+
+
+@dataclass(frozen=True)
+class LeagueSnapshot:
+    """
+    Every currency and item overview of a league, fetched in one sweep.
+
+    Categories that failed to download are listed in `currency_errors` /
+    `item_errors` instead of aborting the sweep. CurrencyType and ItemType share
+    some values (e.g. "Oil"), so the two kinds are kept in separate mappings.
+    The cross-category indexes are case-insensitive and built on first use; when a
+    name appears in several categories, currencies win over items and earlier
+    categories win over later ones.
+    """
+
+    league: str
+    currency: dict[CurrencyType, CurrencyOverviewResponse] = field(
+        default_factory=dict
+    )
+    items: dict[ItemType, ItemOverviewResponse] = field(default_factory=dict)
+    currency_errors: dict[CurrencyType, PoeNinjaError] = field(default_factory=dict)
+    item_errors: dict[ItemType, PoeNinjaError] = field(default_factory=dict)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.currency_errors or self.item_errors)
+
+    def iter_lines(self) -> Iterator[tuple[SnapshotCategory, SnapshotLine]]:
+        """Yields (category, line) for every line, currencies first."""
+        for currency_type, currency_overview in self.currency.items():
+            for currency_line in currency_overview.lines:
+                yield currency_type, currency_line
+        for item_type, item_overview in self.items.items():
+            for item_line in item_overview.lines:
+                yield item_type, item_line
+
+    def _iter_line_keys(
+        self, currency_attribute: str, item_attribute: str
+    ) -> Iterator[tuple[object, SnapshotCategory, Sequence[SnapshotLine], int]]:
+        # Reads keys through _line_values so lazily parsed lines stay unparsed.
+        for currency_type, currency_overview in self.currency.items():
+            for position, key in enumerate(
+                _line_values(currency_overview.lines, currency_attribute)
+            ):
+                yield key, currency_type, currency_overview.lines, position
+        for item_type, item_overview in self.items.items():
+            for position, key in enumerate(
+                _line_values(item_overview.lines, item_attribute)
+            ):
+                yield key, item_type, item_overview.lines, position
+
+    @cached_property
+    def _lines_by_name(
+        self,
+    ) -> dict[str, tuple[SnapshotCategory, Sequence[SnapshotLine], int]]:
+        index: dict[str, tuple[SnapshotCategory, Sequence[SnapshotLine], int]] = {}
+        for name, category, lines, position in self._iter_line_keys(
+            "currencyTypeName", "name"
+        ):
+            if isinstance(name, str):
+                index.setdefault(name.lower(), (category, lines, position))
+        return index
+
+    @cached_property
+    def _lines_by_details_id(
+        self,
+    ) -> dict[str, tuple[SnapshotCategory, Sequence[SnapshotLine], int]]:
+        index: dict[str, tuple[SnapshotCategory, Sequence[SnapshotLine], int]] = {}
+        for details_id, category, lines, position in self._iter_line_keys(
+            "detailsId", "detailsId"
+        ):
+            if isinstance(details_id, str) and details_id:
+                index.setdefault(details_id.lower(), (category, lines, position))
+        return index
+
+    def find(self, name: str) -> Optional[SnapshotLine]:
+        entry = self._lines_by_name.get(name.lower())
+        return entry[1][entry[2]] if entry is not None else None
+
+    def find_by_details_id(self, details_id: str) -> Optional[SnapshotLine]:
+        entry = self._lines_by_details_id.get(details_id.lower())
+        return entry[1][entry[2]] if entry is not None else None
+
+    def category_of(self, name: str) -> Optional[SnapshotCategory]:
+        entry = self._lines_by_name.get(name.lower())
+        return entry[0] if entry is not None else None
+
+    def __len__(self) -> int:
+        return sum(len(overview.lines) for overview in self.currency.values()) + sum(
+            len(overview.lines) for overview in self.items.values()
+        )
@@ -0,0 +1,129 @@
+# src/poe_ninja_client/streaming.py
+import codecs
+import json
+import re
+from typing import Any, Optional
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may follow a complete number ("" being the end of the body).
+_NUMBER_TERMINATORS: frozenset[str] = frozenset(
+    ("", " ", "\t", "\n", "\r", ",", "]", "}")
+)
+
+# Parser states.
+_START, _KEY, _COLON, _VALUE, _ARRAY, _ELEMENT, _DONE = range(7)
+
+
+class JsonArrayStream:
+    """
+    Incremental parser that extracts the elements of one array member of a
+    top-level JSON object, e.g. the "lines" of an itemoverview response.
+
+    Feed it the response body chunk by chunk; every call returns the elements that
+    were completed by that chunk. Only the unconsumed tail of the body (at most about
+    one element plus one chunk) is held in memory, so peak memory does not grow with
+    the size of the array. Other members of the object are parsed and discarded.
+    """
+
+    def __init__(self, key: str = "lines"):
+        self.key: str = key
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._state: int = _START
+        self._member: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Adds the next chunk of the body and returns the elements it completed."""
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Marks the end of the body and returns any remaining elements.
+        Raises ValueError if the body ended before the top-level object did.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        elements = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Response body ended in the middle of the JSON document.")
+        return elements
+
+    def _decode(self, position: int, final: bool) -> Optional[tuple[Any, int]]:
+        # Returns None when the value at `position` may continue in the next chunk.
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            # "1" or "1." at the end of a chunk may continue as "1.5" in the next.
+            following = self._buffer[end : end + 1]
+            if following not in _NUMBER_TERMINATORS:
+                if final:
+                    raise ValueError(f"Malformed number at character {position}.")
+                return None
+            if not following and not final:
+                return None
+        return value, end
+
+    def _parse(self, final: bool) -> list[Any]:
+        elements: list[Any] = []
+        buffer = self._buffer
+        position = 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position >= len(buffer):
+                break
+            character = buffer[position]
+            state = self._state
+            if state == _START:
+                if character != "{":
+                    raise ValueError("Expected a JSON object.")
+                position += 1
+                self._state = _KEY
+            elif state == _KEY:
+                if character == ",":
+                    position += 1
+                elif character == "}":
+                    position += 1
+                    self._state = _DONE
+                else:
+                    decoded = self._decode(position, final)
+                    if decoded is None:
+                        break
+                    self._member, position = decoded
+                    self._state = _COLON
+            elif state == _COLON:
+                if character != ":":
+                    raise ValueError("Expected ':' after an object key.")
+                position += 1
+                self._state = _ARRAY if self._member == self.key else _VALUE
+            elif state == _VALUE:
+                decoded = self._decode(position, final)
+                if decoded is None:
+                    break
+                position = decoded[1]
+                self._state = _KEY
+            elif state == _ARRAY:
+                if character != "[":
+                    raise ValueError(f"Expected {self.key!r} to be an array.")
+                position += 1
+                self._state = _ELEMENT
+            elif state == _ELEMENT:
+                if character == ",":
+                    position += 1
+                elif character == "]":
+                    position += 1
+                    self._state = _KEY
+                else:
+                    decoded = self._decode(position, final)
+                    if decoded is None:
+                        break
+                    element, position = decoded
+                    elements.append(element)
+            else:  # _DONE: ignore anything after the top-level object
+                position = len(buffer)
+        self._buffer = buffer[position:]
+        return elements
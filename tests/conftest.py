@@ -0,0 +1,35 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# The package itself, and the benchmark fixtures and local poe.ninja stand-in.
+for directory in ("src", "benchmarks"):
+    path = os.path.join(project_root, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import fixtures  # noqa: E402
+from local_server import LocalPoeNinja  # noqa: E402
+from poe_ninja_client import PoENinja  # noqa: E402
+
+# Example scripts that talk to the real poe.ninja, not tests.
+collect_ignore = ["test_client_example.py", "mirror.py", "plot_history_example.py"]
+
+
+@pytest.fixture(scope="session")
+def server():
+    """The local poe.ninja stand-in, serving the synthetic benchmark fixtures."""
+    with LocalPoeNinja(fixtures.synthetic_fixtures()) as local_server:
+        yield local_server
+
+
+@pytest.fixture
+def client(server):
+    """A client of league "Standard" pointed at `server`, with an empty cache."""
+    client = PoENinja("Standard")
+    client.BASE_URL = server.base_url
+    yield client
+    client.close()
@@ -0,0 +1,144 @@
+# tests/test_archive.py
+import math
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import fixtures
+from poe_ninja_client import archive
+from poe_ninja_client.archive import ArchiveRecord, SnapshotArchive
+from poe_ninja_client.enums import CurrencyType, ItemType
+from poe_ninja_client.models import (
+    parse_currency_overview_response,
+    parse_item_overview_response,
+)
+
+LEAGUE = "Settlers"
+DAY = date(2024, 8, 1)
+START = datetime(2024, 8, 1, 23, 0, tzinfo=timezone.utc)
+# Six polls that cross midnight, so they land in two day files.
+POLLS = [START + timedelta(minutes=20 * index) for index in range(6)]
+
+
+def _items(lazy: bool = False):
+    payload = fixtures.item_overview(40)
+    payload["lines"][0]["chaosValue"] = None
+    payload["lines"][1]["count"] = None
+    return parse_item_overview_response(payload, lazy=lazy)
+
+
+def _samples(archive_: SnapshotArchive, **kwargs) -> list[tuple]:
+    return sorted(
+        (record.timestamp, record.id, record.chaos_value, record.count)
+        for record in archive_.query(LEAGUE, ItemType.UNIQUE_ARMOUR, **kwargs)
+    )
+
+
+@pytest.fixture
+def filled(tmp_path) -> SnapshotArchive:
+    archive_ = SnapshotArchive(tmp_path)
+    for index, timestamp in enumerate(POLLS):
+        overview = _items(lazy=index % 2 == 1)
+        archive_.append(LEAGUE, ItemType.UNIQUE_ARMOUR, overview, timestamp)
+    return archive_
+
+
+def test_append_and_query_round_trip(filled):
+    overview = _items()
+    records = list(filled.query(LEAGUE, ItemType.UNIQUE_ARMOUR))
+    assert len(records) == len(POLLS) * len(overview.lines)
+    first = overview.lines[0]
+    assert ArchiveRecord(
+        int(POLLS[0].timestamp()), first.id, None, first.count, first.listingCount
+    ) in records
+    assert filled.days(LEAGUE, ItemType.UNIQUE_ARMOUR) == [DAY, DAY + timedelta(days=1)]
+
+
+def test_query_window_and_ids(filled):
+    line_id = _items().lines[2].id
+    window = _samples(filled, ids=line_id, start=POLLS[1], end=POLLS[4])
+    assert [sample[0] for sample in window] == [
+        int(timestamp.timestamp()) for timestamp in POLLS[1:4]
+    ]
+    assert {sample[1] for sample in window} == {line_id}
+
+
+def test_compaction_keeps_every_sample(filled):
+    before = _samples(filled)
+    assert filled.compact(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY) > 0
+    assert not os.path.exists(filled.day_path(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY))
+    assert _samples(filled) == before
+    # Appending to a compacted day and compacting again merges both.
+    filled.append(LEAGUE, ItemType.UNIQUE_ARMOUR, _items(), START - timedelta(hours=1))
+    filled.compact(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY)
+    assert len(_samples(filled)) == len(before) + len(_items().lines)
+
+
+def test_series_views(filled):
+    overview = _items()
+    line = overview.lines[1]
+    filled.compact(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY)
+    series = filled.series(LEAGUE, ItemType.UNIQUE_ARMOUR, line.id)
+    assert [(item.day, len(item)) for item in series] == [
+        (DAY, 3),
+        (DAY + timedelta(days=1), 3),
+    ]
+    compacted = series[0]
+    assert list(compacted.timestamps) == [
+        int(timestamp.timestamp()) for timestamp in POLLS[:3]
+    ]
+    assert list(compacted.counts) == [-1] * 3
+    assert math.isclose(compacted.chaos_values[0], line.chaosValue)
+    latest = filled.latest(LEAGUE, ItemType.UNIQUE_ARMOUR, line.id)
+    assert latest.timestamp == int(POLLS[-1].timestamp())
+
+
+def test_currency_lines_are_stored_by_detail_id(tmp_path):
+    archive_ = SnapshotArchive(tmp_path)
+    overview = parse_currency_overview_response(fixtures.currency_overview(20))
+    archive_.append(LEAGUE, CurrencyType.CURRENCY, overview, START)
+    records = list(archive_.query(LEAGUE, CurrencyType.CURRENCY))
+    line = overview.lines[0]
+    detail = overview.get_detail(line.currencyTypeName)
+    assert any(
+        record.id == detail.id and record.chaos_value == line.chaosEquivalent
+        for record in records
+    )
+
+
+def test_big_endian_round_trip(tmp_path, monkeypatch):
+    # Byteswapping on write and again on read must give the values back.
+    class BigEndian:
+        byteorder = "big"
+
+    monkeypatch.setattr(archive, "sys", BigEndian)
+    archive_ = SnapshotArchive(tmp_path)
+    for timestamp in POLLS[:3]:
+        archive_.append(LEAGUE, ItemType.UNIQUE_ARMOUR, _items(), timestamp)
+    before = _samples(archive_)
+    archive_.compact(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY)
+    assert _samples(archive_) == before
+
+
+def test_days_skip_stray_files(filled):
+    directory = os.path.dirname(filled.day_path(LEAGUE, ItemType.UNIQUE_ARMOUR, DAY))
+    for name in ("notes.bin", "2024-08-01.bak.col", "README"):
+        open(os.path.join(directory, name), "wb").close()
+    assert filled.days(LEAGUE, ItemType.UNIQUE_ARMOUR) == [DAY, DAY + timedelta(days=1)]
+
+
+def test_mapped_files_are_bounded(tmp_path):
+    archive_ = SnapshotArchive(tmp_path, max_mapped=3)
+    overview = _items()
+    for offset in range(6):
+        day_start = START + timedelta(days=offset, hours=-12)
+        archive_.append(LEAGUE, ItemType.UNIQUE_ARMOUR, overview, day_start)
+    archive_.compact(LEAGUE, ItemType.UNIQUE_ARMOUR)
+    series = archive_.series(LEAGUE, ItemType.UNIQUE_ARMOUR, overview.lines[0].id)
+    assert len(series) == 6
+    assert len(archive_._mapped) == 3
+    # Series of unmapped days keep their own mapping alive.
+    assert [len(item) for item in series] == [1] * 6
+    first_poll = START - timedelta(hours=12)
+    assert list(series[0].timestamps) == [int(first_poll.timestamp())]
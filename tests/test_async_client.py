@@ -0,0 +1,78 @@
+# tests/test_async_client.py
+import asyncio
+
+import pytest
+
+from poe_ninja_client import AsyncPoENinja, CurrencyType, ItemType
+from poe_ninja_client.exceptions import PoeNinjaRequestError
+
+
+def _run(server, work, **kwargs):
+    """Runs `work(client)` with an AsyncPoENinja pointed at `server`."""
+
+    async def main():
+        async with AsyncPoENinja("Standard", **kwargs) as client:
+            client.BASE_URL = server.base_url
+            return client, await work(client)
+
+    return asyncio.run(main())
+
+
+def test_overviews_match_the_sync_client(server, client):
+    async def work(async_client):
+        return await asyncio.gather(
+            async_client.get_currency_overview(CurrencyType.CURRENCY),
+            async_client.get_item_overview(ItemType.UNIQUE_ARMOUR),
+            async_client.get_currency_id_by_name("Divine Orb"),
+            async_client.find_item_line("Item 3", ItemType.UNIQUE_ARMOUR),
+        )
+
+    _, (currency, items, divine_id, item_line) = _run(server, work)
+    expected_currency = client.get_currency_overview(CurrencyType.CURRENCY)
+    assert currency.lines == expected_currency.lines
+    assert currency.currencyDetails == expected_currency.currencyDetails
+    assert items.lines == client.get_item_overview(ItemType.UNIQUE_ARMOUR).lines
+    assert divine_id == client.get_currency_id_by_name("Divine Orb") == 2
+    assert item_line == client.find_item_line("Item 3", ItemType.UNIQUE_ARMOUR)
+
+
+def test_concurrent_requests_share_one_session(server):
+    async def work(async_client):
+        hardcore = async_client.for_league("Hardcore")
+        overviews = await asyncio.gather(
+            *(async_client.get_item_overview(ItemType.UNIQUE_ARMOUR) for _ in range(6)),
+            *(hardcore.get_currency_overview(CurrencyType.FRAGMENT) for _ in range(6)),
+        )
+        assert hardcore.session is async_client.session
+        return overviews
+
+    client, overviews = _run(server, work, use_cache=False, max_concurrency=2)
+    assert all(len(overview.lines) == 1000 for overview in overviews[:6])
+    assert all(overview.lines for overview in overviews[6:])
+    # Without a cache every call is a request; the view counts its own.
+    assert client.transferred_count == 6
+
+
+def test_cached_overviews_are_reused(server):
+    async def work(async_client):
+        first = await async_client.get_item_overview(ItemType.UNIQUE_ARMOUR)
+        return first, await async_client.get_item_overview(ItemType.UNIQUE_ARMOUR)
+
+    client, (first, second) = _run(server, work)
+    assert second is first
+    assert client.transferred_count == 1
+
+
+def test_errors_carry_the_status_code(server):
+    async def work(async_client):
+        with pytest.raises(PoeNinjaRequestError) as raised:
+            await async_client.get_item_overview(ItemType.DIVINATION_CARD)
+        return raised.value
+
+    _, error = _run(server, work)
+    assert error.status_code == 404
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncPoENinja("Standard", max_concurrency=0)
@@ -0,0 +1,92 @@
+# tests/test_cache.py
+import time
+
+from poe_ninja_client import CurrencyType
+from poe_ninja_client.cache import DEFAULT_TTLS, ResponseCache, make_cache_key
+
+
+def _key(name: str):
+    return make_cache_key("itemoverview", {"league": "Standard", "type": name})
+
+
+def test_hit_and_miss_counters():
+    cache = ResponseCache()
+    assert cache.get(_key("a")) is None
+    cache.set("itemoverview", _key("a"), "value")
+    assert cache.get(_key("a")) == "value"
+    assert cache.get(_key("a")) == "value"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_keys_ignore_parameter_order():
+    assert make_cache_key("x", {"a": 1, "b": 2}) == make_cache_key(
+        "x", {"b": 2, "a": 1}
+    )
+    assert make_cache_key("x", {"a": 1}) != make_cache_key("y", {"a": 1})
+
+
+def test_entries_expire_after_their_endpoint_ttl():
+    cache = ResponseCache(ttls={"itemoverview": 0.05})
+    assert cache.ttl_for("currencyhistory") == DEFAULT_TTLS["currencyhistory"]
+    assert cache.ttl_for("unknown") == cache.default_ttl
+    cache.set("itemoverview", _key("a"), "value", etag='"v1"')
+    assert cache.get(_key("a")) == "value"
+    time.sleep(0.1)
+    assert cache.get(_key("a")) is None
+    # The expired entry is kept for revalidation.
+    entry = cache.get_entry(_key("a"))
+    assert entry is not None and not entry.fresh and entry.etag == '"v1"'
+
+
+def test_non_positive_ttl_disables_caching():
+    cache = ResponseCache(ttls={"itemoverview": 0, "currencyoverview": -1})
+    cache.set("itemoverview", _key("a"), "value")
+    cache.set("currencyoverview", _key("b"), "value")
+    assert len(cache) == 0
+    assert cache.get(_key("a")) is None
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("itemoverview", _key("a"), "a")
+    cache.set("itemoverview", _key("b"), "b")
+    assert cache.get(_key("a")) == "a"  # b is now the least recently used
+    cache.set("itemoverview", _key("c"), "c")
+    assert len(cache) == 2
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) == "a"
+    assert cache.get(_key("c")) == "c"
+
+
+def test_max_bytes_evicts_least_recently_used():
+    cache = ResponseCache(max_bytes=100)
+    cache.set("itemoverview", _key("a"), "a", size=40)
+    cache.set("itemoverview", _key("b"), "b", size=40)
+    cache.get(_key("a"))
+    cache.set("itemoverview", _key("c"), "c", size=40)
+    assert cache.total_bytes == 80
+    assert cache.get_entry(_key("b")) is None
+    assert cache.get(_key("a")) == "a"
+    # Bodies larger than the whole cache are not stored at all.
+    cache.set("itemoverview", _key("d"), "d", size=101)
+    assert cache.get_entry(_key("d")) is None
+    assert cache.total_bytes == 80
+
+
+def test_replacing_and_invalidating_entries_keeps_the_byte_count():
+    cache = ResponseCache()
+    cache.set("itemoverview", _key("a"), "a", size=10)
+    cache.set("itemoverview", _key("a"), "a2", size=30)
+    assert (len(cache), cache.total_bytes) == (1, 30)
+    cache.invalidate(_key("a"))
+    assert (len(cache), cache.total_bytes) == (0, 0)
+    cache.set("itemoverview", _key("b"), "b", size=5)
+    cache.clear()
+    assert (len(cache), cache.total_bytes) == (0, 0)
+
+
+def test_client_serves_repeated_overviews_from_the_cache(client):
+    first = client.get_currency_overview(CurrencyType.CURRENCY)
+    assert client.get_currency_overview(CurrencyType.CURRENCY) is first
+    assert client.transferred_count == 1
+    assert client.cache.hits == 1
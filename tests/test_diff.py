@@ -0,0 +1,98 @@
+# tests/test_diff.py
+import copy
+
+import pytest
+
+import fixtures
+from poe_ninja_client.diff import diff_snapshots
+from poe_ninja_client.models import (
+    parse_currency_overview_response,
+    parse_item_overview_response,
+)
+
+
+def _items(prices: dict[int, float | None]) -> dict:
+    """An item overview of lines 10000 + i, priced as given."""
+    payload = fixtures.item_overview(10)
+    lines = {line["id"]: line for line in payload["lines"]}
+    payload["lines"] = []
+    for item_id, price in prices.items():
+        line = copy.deepcopy(lines[10_000 + item_id])
+        line["chaosValue"] = price
+        payload["lines"].append(line)
+    return payload
+
+
+OLD = _items({0: 100.0, 1: 10.0, 2: 50.0, 3: 0.0, 4: 7.0})
+NEW = _items({1: 10.0, 0: 105.0, 2: 49.0, 3: 2.0, 5: 1.0})
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_added_removed_and_changed(lazy):
+    diff = diff_snapshots(
+        parse_item_overview_response(OLD, lazy=lazy),
+        parse_item_overview_response(NEW, lazy=lazy),
+    )
+    assert [line.id for line in diff.added] == [10_005]
+    assert [line.id for line in diff.removed] == [10_004]
+    # Changed lines keep the order of the newer overview; equal prices are left out.
+    assert [change.key for change in diff.changed] == [10_000, 10_002, 10_003]
+    first = diff.changed[0]
+    assert (first.old_value, first.new_value) == (100.0, 105.0)
+    assert first.abs_change == 5.0 and first.rel_change == pytest.approx(0.05)
+    assert first.old.chaosValue == 100.0 and first.new.chaosValue == 105.0
+    # A move away from 0 has no relative change and ranks first.
+    assert diff.changed[2].rel_change is None
+    assert diff.top_movers(1)[0].key == 10_003
+    assert diff
+
+
+def test_thresholds():
+    old = parse_item_overview_response(OLD)
+    new = parse_item_overview_response(NEW)
+    by_abs = diff_snapshots(old, new, min_abs_change=2.0)
+    assert [change.key for change in by_abs.changed] == [10_000, 10_003]
+    by_rel = diff_snapshots(old, new, min_rel_change=0.04)
+    assert [change.key for change in by_rel.changed] == [10_000, 10_003]
+    both = diff_snapshots(old, new, min_abs_change=3.0, min_rel_change=0.04)
+    assert [change.key for change in both.changed] == [10_000]
+    # Thresholds only filter changes, never additions or removals.
+    assert len(both.added) == len(both.removed) == 1
+
+
+def test_missing_prices_count_as_zero():
+    diff = diff_snapshots(
+        parse_item_overview_response(_items({0: None})),
+        parse_item_overview_response(_items({0: 4.0})),
+    )
+    (change,) = diff.changed
+    assert change.old_value is None and change.abs_change == 4.0
+    assert change.rel_change is None
+
+
+def test_identical_overviews_have_an_empty_diff():
+    overview = parse_item_overview_response(OLD)
+    assert not diff_snapshots(overview, parse_item_overview_response(OLD))
+
+
+def test_currencies_are_matched_on_details_id():
+    old_payload = fixtures.currency_overview(10)
+    new_payload = copy.deepcopy(old_payload)
+    new_payload["lines"][0]["chaosEquivalent"] = 210.0  # Divine Orb
+    removed = new_payload["lines"].pop()
+    diff = diff_snapshots(
+        parse_currency_overview_response(old_payload),
+        parse_currency_overview_response(new_payload),
+    )
+    assert [change.key for change in diff.changed] == ["divine-orb"]
+    assert diff.changed[0].abs_change == 10.0
+    assert [line.detailsId for line in diff.removed] == [removed["detailsId"]]
+    assert diff.added == []
+
+
+def test_overviews_of_different_kinds_cannot_be_diffed():
+    with pytest.raises(TypeError):
+        diff_snapshots(
+            parse_item_overview_response(OLD),
+            parse_currency_overview_response(fixtures.currency_overview(3)),
+        )
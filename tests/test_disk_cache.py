@@ -0,0 +1,94 @@
+# tests/test_disk_cache.py
+import sqlite3
+import threading
+
+import pytest
+
+from poe_ninja_client.disk_cache import DiskCache
+
+PARAMS = {"league": "Standard", "type": "Currency"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", pool_size=2)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_with_validators(cache):
+    assert cache.get("currencyoverview", PARAMS) is None
+    cache.put("currencyoverview", PARAMS, b'{"lines": []}', etag='"abc"')
+    entry = cache.get("currencyoverview", PARAMS)
+    assert entry.body == b'{"lines": []}'
+    assert entry.etag == '"abc"'
+    assert entry.last_modified is None
+    assert entry.fresh
+    assert cache.get("currencyoverview", {**PARAMS, "type": "Fragment"}) is None
+
+
+def test_stale_entries_are_returned_but_not_fresh(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", ttls={"itemhistory": 0.0})
+    cache.put("itemhistory", PARAMS, b"[]")
+    entry = cache.get("itemhistory", PARAMS)
+    assert entry.body == b"[]"
+    assert not entry.fresh
+    cache.close()
+
+
+def test_survives_reopening(tmp_path):
+    first = DiskCache(tmp_path / "cache.sqlite")
+    first.put("currencyoverview", PARAMS, b"body")
+    first.close()
+    second = DiskCache(tmp_path / "cache.sqlite")
+    assert second.get("currencyoverview", PARAMS).body == b"body"
+    second.close()
+
+
+def test_evicts_least_recently_read(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=25)
+    for name in ("a", "b"):
+        cache.put("itemoverview", {"type": name}, b"x" * 10)
+    cache.get("itemoverview", {"type": "a"})
+    cache.put("itemoverview", {"type": "c"}, b"x" * 10)
+    assert cache.get("itemoverview", {"type": "a"}) is not None
+    assert cache.get("itemoverview", {"type": "b"}) is None
+    assert cache.get("itemoverview", {"type": "c"}) is not None
+    # Bodies larger than the whole cache are not stored.
+    cache.put("itemoverview", {"type": "d"}, b"x" * 30)
+    assert cache.get("itemoverview", {"type": "d"}) is None
+    cache.close()
+
+
+def test_connections_are_bounded_by_the_pool(cache):
+    def work(index: int) -> None:
+        for _ in range(20):
+            cache.put("itemoverview", {"type": index}, b"body")
+            cache.get("itemoverview", {"type": index})
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert cache._open <= cache.pool_size
+    assert len(cache._idle) == cache._open
+
+
+def test_invalid_pool_size(tmp_path):
+    with pytest.raises(ValueError):
+        DiskCache(tmp_path / "cache.sqlite", pool_size=0)
+
+
+def test_closed_cache_stays_closed(cache):
+    cache.put("currencyoverview", PARAMS, b"body")
+    with cache._connection():
+        cache.close()
+    # The connection that was in use is closed when returned, not pooled.
+    assert cache._open == 0
+    assert cache._idle == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get("currencyoverview", PARAMS)
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.put("currencyoverview", PARAMS, b"body")
+    cache.close()
@@ -0,0 +1,71 @@
+# tests/test_histories.py
+import asyncio
+
+import pytest
+
+import fixtures
+from local_server import LocalPoeNinja
+from poe_ninja_client import AsyncPoENinja, CurrencyType, ItemType, PoENinja
+from poe_ninja_client.exceptions import PoeNinjaRequestError
+from poe_ninja_client.models import ItemHistoryResponse
+
+UNKNOWN_IDS = (13, 14)
+
+
+@pytest.fixture(scope="module")
+def history_server():
+    """A local poe.ninja that does not know the items and currencies UNKNOWN_IDS."""
+    with LocalPoeNinja(
+        fixtures.synthetic_fixtures(), unknown_ids=UNKNOWN_IDS
+    ) as local_server:
+        yield local_server
+
+
+@pytest.fixture
+def history_client(history_server):
+    client = PoENinja("Standard")
+    client.BASE_URL = history_server.base_url
+    yield client
+    client.close()
+
+
+def _check_errors(results, ids) -> None:
+    assert list(results) == list(dict.fromkeys(ids))
+    for history_id, result in results.items():
+        if history_id in UNKNOWN_IDS:
+            assert isinstance(result, PoeNinjaRequestError)
+            assert result.status_code == 404
+        else:
+            assert not isinstance(result, Exception)
+
+
+def test_failed_item_ids_are_reported_per_id(history_client):
+    ids = [10, 13, 11, 14, 10, 12]
+    results = history_client.get_item_histories(ItemType.BASE_TYPE, ids, max_workers=3)
+    _check_errors(results, ids)
+    assert isinstance(results[10], ItemHistoryResponse)
+    assert len(results[10].data_points) == 1000
+    assert results[11] == history_client.get_item_history(ItemType.BASE_TYPE, 11)
+
+
+def test_failed_currency_ids_are_reported_per_id(history_client):
+    ids = [2, 13, 3]
+    results = history_client.get_currency_histories(CurrencyType.CURRENCY, ids)
+    _check_errors(results, ids)
+    assert results[2].receive_currency_graph_data
+
+
+def test_async_failed_ids_are_reported_per_id(history_server):
+    ids = [14, 10, 13, 11, 10]
+
+    async def fetch():
+        async with AsyncPoENinja("Standard", max_concurrency=2) as client:
+            client.BASE_URL = history_server.base_url
+            return await asyncio.gather(
+                client.get_item_histories(ItemType.BASE_TYPE, ids),
+                client.get_currency_histories(CurrencyType.CURRENCY, ids),
+            )
+
+    items, currencies = asyncio.run(fetch())
+    _check_errors(items, ids)
+    _check_errors(currencies, ids)
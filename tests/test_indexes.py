@@ -0,0 +1,72 @@
+# tests/test_indexes.py
+import pytest
+
+import fixtures
+from poe_ninja_client.models import (
+    ColumnarItemLines,
+    ItemColumns,
+    ItemOverviewResponse,
+    parse_currency_overview_response,
+    parse_item_overview_response,
+)
+
+
+def _items(payload, form: str) -> ItemOverviewResponse:
+    if form == "columnar":
+        return ItemOverviewResponse(
+            lines=ColumnarItemLines(ItemColumns.from_raw(payload["lines"]))
+        )
+    return parse_item_overview_response(payload, lazy=form == "lazy")
+
+
+@pytest.fixture
+def item_payload():
+    # Lines 0-2 are named "Item 0" (variants None, None, "1 link"), lines 3-5
+    # "Item 1" (variants "5 links", "6 links", "20/20").
+    return fixtures.item_overview(12)
+
+
+@pytest.mark.parametrize("form", ["eager", "lazy", "columnar"])
+def test_item_lookups(item_payload, form):
+    overview = _items(item_payload, form)
+    assert overview.get_line("ITEM 0").id == 10_000  # First match wins
+    assert overview.get_line("nothing") is None
+    assert overview.get_line_by_id(10_004).name == "Item 1"
+    assert overview.get_line_by_id(1) is None
+    assert overview.get_line_by_details_id("Item-5").id == 10_005
+    assert overview.get_variant("item 0", "1 LINK").id == 10_002
+    assert overview.get_variant("Item 1", "6 links", links=6).id == 10_004
+    gem = overview.get_variant("Item 1", "20/20", gemLevel=20, gemQuality=20)
+    assert gem.id == 10_005
+    assert overview.get_variant("Item 1", "6 links") is None  # links must match too
+
+
+@pytest.mark.parametrize("form", ["eager", "lazy", "columnar"])
+def test_item_lines_with_null_keys_are_not_indexed(item_payload, form):
+    item_payload["lines"][0]["name"] = None
+    item_payload["lines"][1]["detailsId"] = None
+    item_payload["lines"][2]["id"] = None
+    overview = _items(item_payload, form)
+    assert overview.get_line("Item 0").id == 10_001
+    assert overview.get_line_by_details_id("item-1") is None
+    assert overview.get_line_by_details_id("item-2").id is None
+    assert overview.get_line_by_id(10_003).name == "Item 1"
+    assert overview.get_line_by_id(None) is None
+    assert overview.get_variant("Item 0").id == 10_001
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_currency_lookups(lazy):
+    payload = fixtures.currency_overview(10)
+    payload["lines"].append(dict(payload["lines"][0], chaosEquivalent=1.0))
+    payload["lines"][1]["currencyTypeName"] = None
+    payload["currencyDetails"][2]["name"] = None
+    overview = parse_currency_overview_response(payload, lazy=lazy)
+    assert overview.get_line("divine orb").chaosEquivalent == 200.0  # First wins
+    assert overview.get_line("Exalted Orb") is None
+    assert overview.get_line_by_details_id("MIRROR-OF-KALANDRA").chaosEquivalent == (
+        50000.0
+    )
+    assert overview.get_detail("chaos orb").tradeId == "chaos"
+    assert overview.get_detail("Exalted Orb") is None
+    assert overview.get_detail_by_id(2).name == "Divine Orb"
@@ -0,0 +1,27 @@
+# tests/test_leagues.py
+from poe_ninja_client import CurrencyType
+
+
+def test_views_share_the_parent_resources(client):
+    view = client.for_league("Hardcore")
+    assert view.league == "Hardcore"
+    assert view.session is client.session
+    assert view.cache is client.cache
+    assert view.rate_limiter is client.rate_limiter
+    view.close()
+    # Closing a view leaves the shared session usable.
+    assert client.get_currency_overview(CurrencyType.CURRENCY).lines
+
+
+def test_views_share_one_stats_hook(client):
+    view = client.for_league("Hardcore")
+    stats = view.enable_stats()
+    assert client.stats is stats
+    assert client.enable_stats() is stats
+    assert client.for_league("Ruthless").enable_stats() is stats
+    assert client.hooks == [stats]
+    view.get_currency_overview(CurrencyType.CURRENCY)
+    client.get_currency_overview(CurrencyType.FRAGMENT)
+    assert stats.endpoint("currencyoverview").calls == 2
+    client.remove_hook(stats)
+    assert view.stats is None
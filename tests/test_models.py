@@ -0,0 +1,158 @@
+# tests/test_models.py
+import math
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import fixtures
+from poe_ninja_client import ItemType, PoENinja
+from poe_ninja_client.models import (
+    ColumnarItemLines,
+    ItemColumns,
+    ItemSparkLine,
+    LazyLines,
+    parse_currency_overview_response,
+    parse_item_overview_response,
+)
+
+ITEMS = fixtures.item_overview(300)
+CURRENCY = fixtures.currency_overview(50)
+
+
+def test_lazy_item_lines_match_the_eager_parser():
+    eager = parse_item_overview_response(ITEMS)
+    lazy = parse_item_overview_response(ITEMS, lazy=True)
+    assert isinstance(lazy.lines, LazyLines)
+    assert len(lazy.lines) == len(eager.lines) == 300
+    # Indexing out of order, slicing and iterating all build the same lines.
+    assert lazy.lines[-1] == eager.lines[-1]
+    assert lazy.lines[10:20] == eager.lines[10:20]
+    assert lazy.lines == eager.lines
+    for lazy_line, eager_line in zip(lazy.lines, eager.lines):
+        assert lazy_line.sparkline.data.tolist() == eager_line.sparkline.data.tolist()
+    assert lazy.get_line("Item 7") == eager.get_line("Item 7")
+    assert lazy.get_line_by_id(10_042) == eager.get_line_by_id(10_042)
+
+
+def test_lazy_lines_are_built_once():
+    lazy = parse_item_overview_response(ITEMS, lazy=True)
+    assert lazy.lines[5] is lazy.lines[5]
+    assert list(lazy.lines)[5] is lazy.lines[5]
+
+
+def test_lazy_currency_lines_match_the_eager_parser():
+    eager = parse_currency_overview_response(CURRENCY)
+    lazy = parse_currency_overview_response(CURRENCY, lazy=True)
+    assert lazy.lines == eager.lines
+    assert lazy.get_line("Divine Orb") == eager.get_line("Divine Orb")
+    assert lazy.currencyDetails == eager.currencyDetails
+
+
+def test_lazy_parsing_skips_lines_that_are_not_objects():
+    payload = {"lines": [None, *ITEMS["lines"][:3], 7]}
+    lazy = parse_item_overview_response(payload, lazy=True)
+    assert lazy.lines == parse_item_overview_response(payload).lines
+    assert len(lazy.lines) == 3
+
+
+def test_columnar_rows_match_the_eager_parser():
+    eager = parse_item_overview_response(ITEMS)
+    columns = ItemColumns.from_raw(ITEMS["lines"])
+    lines = ColumnarItemLines(columns)
+    assert len(lines) == 300
+    assert lines[-1] == eager.lines[-1]
+    assert lines == eager.lines
+    assert columns.values("chaosValue") == [line.chaosValue for line in eager.lines]
+    assert columns.values("links") == [line.links for line in eager.lines]
+    assert columns.values("sparkline") == [line.sparkline for line in eager.lines]
+
+
+def test_columnar_rows_keep_nulls_and_defaults():
+    raw_lines = [
+        {"corrupted": None, "sparkline": {"data": [], "totalChange": 0.0}},
+        {"id": 3, "name": None, "chaosValue": None, "corrupted": False},
+        {"id": 4, "lowConfidenceSparkline": {"data": [1, None], "totalChange": None}},
+    ]
+    eager = parse_item_overview_response({"lines": raw_lines})
+    lines = ColumnarItemLines(ItemColumns.from_raw(raw_lines))
+    assert lines[0].id == 0 and lines[0].name == "Unknown Item"
+    assert lines[0].sparkline is ItemSparkLine.EMPTY
+    assert lines[1].name is None and lines[1].corrupted is False
+    assert lines[2].lowConfidenceSparkline.data.tolist() == [1.0, 0.0]
+    assert list(lines)[:2] == eager.lines[:2]
+
+
+def test_columnar_lines_pickle_as_columns():
+    lines = ColumnarItemLines(ItemColumns.from_raw(ITEMS["lines"]))
+    restored = pickle.loads(pickle.dumps(lines))
+    assert isinstance(restored, ColumnarItemLines)
+    assert restored == lines
+
+
+def test_process_pool_parsing_matches_the_eager_parser(server, client):
+    eager = client.get_item_overview(ItemType.UNIQUE_ARMOUR)
+    # Spawned, not forked: the test process runs the local server's threads.
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+        pooled = PoENinja("Standard", use_cache=False, parse_executor=executor)
+        pooled.BASE_URL = server.base_url
+        try:
+            overview = pooled.get_item_overview(ItemType.UNIQUE_ARMOUR)
+            history = pooled.get_item_history(ItemType.BASE_TYPE, 1)
+        finally:
+            pooled.close()
+    assert isinstance(overview.lines, ColumnarItemLines)
+    assert overview.lines == eager.lines
+    assert history == client.get_item_history(ItemType.BASE_TYPE, 1)
+
+
+def _points(raw, missing):
+    return [missing if value is None else float(value) for value in raw["data"]]
+
+
+def test_sparklines_are_views_of_one_shared_buffer():
+    overview = parse_item_overview_response(ITEMS)
+    first, last = overview.lines[0], overview.lines[-1]
+    assert first.sparkline._buffer is last.lowConfidenceSparkline._buffer
+    for line, raw in zip(overview.lines, ITEMS["lines"]):
+        # Null item points are stored as 0.0.
+        assert line.sparkline.data.tolist() == _points(raw["sparkline"], 0.0)
+        assert line.sparkline.totalChange == raw["sparkline"]["totalChange"]
+    with pytest.raises(TypeError):
+        first.sparkline.data[0] = 1.0  # Read-only: neighbours share the buffer
+
+
+def test_currency_sparklines_store_null_points_as_nan():
+    overview = parse_currency_overview_response(CURRENCY)
+    for line, raw in zip(overview.lines, CURRENCY["lines"]):
+        values = line.paySparkLine.data.tolist()
+        expected = _points(raw["paySparkLine"], math.nan)
+        assert [math.isnan(value) for value in values] == [
+            math.isnan(value) for value in expected
+        ]
+        assert [v for v in values if not math.isnan(v)] == [
+            v for v in expected if not math.isnan(v)
+        ]
+    assert overview.lines == parse_currency_overview_response(CURRENCY).lines
+
+
+def test_empty_sparklines_are_interned():
+    payload = {"lines": [{"sparkline": {"data": [], "totalChange": 0.0}}] * 3}
+    lines = parse_item_overview_response(payload).lines
+    assert all(line.sparkline is ItemSparkLine.EMPTY for line in lines)
+    assert pickle.loads(pickle.dumps(lines))[0].sparkline is ItemSparkLine.EMPTY
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pickled_sparklines_keep_their_points(lazy):
+    overview = parse_item_overview_response(ITEMS, lazy=lazy)
+    restored = pickle.loads(pickle.dumps(overview))
+    assert restored.lines == overview.lines
+    for original, copy in zip(overview.lines, restored.lines):
+        assert copy.sparkline.data.tolist() == original.sparkline.data.tolist()
+        assert copy.sparkline.totalChange == original.sparkline.totalChange
+    if not lazy:
+        # The sparklines of the response still share one copy of the buffer.
+        assert len({id(line.sparkline._buffer) for line in restored.lines}) == 1
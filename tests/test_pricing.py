@@ -0,0 +1,83 @@
+# tests/test_pricing.py
+import math
+
+import pytest
+
+import fixtures
+from poe_ninja_client import CurrencyType, ItemType, LeagueSnapshot, PriceBook
+from poe_ninja_client.models import (
+    parse_currency_overview_response,
+    parse_item_overview_response,
+)
+
+
+@pytest.fixture
+def book() -> PriceBook:
+    return PriceBook(
+        ["Chaos Orb", "Divine Orb", "Headhunter", "Worthless Orb", "Unpriced"],
+        [1.0, 200.0, 4000.0, 0.0, math.nan],
+        ["chaos-orb", "divine-orb", "headhunter", None, None],
+    )
+
+
+def test_single_lookups(book):
+    assert book.chaos_value("headhunter") == 4000.0
+    assert book.chaos_value("Unpriced") is None
+    assert book.chaos_value("nothing") is None
+    assert book.value("Headhunter", "Divine Orb") == 20.0
+    assert book.index_of("DIVINE-ORB") == 1
+    assert "Headhunter" in book and len(book) == 5
+
+
+def test_rate_and_convert(book):
+    assert book.rate("Divine Orb", "Chaos Orb") == 200.0
+    assert book.convert(400, "Chaos Orb", "Divine Orb") == 2.0
+    assert list(book.convert([200, 600])) == [1.0, 3.0]
+    with pytest.raises(KeyError):
+        book.rate("nothing", "Chaos Orb")
+    with pytest.raises(KeyError):
+        book.convert(1, "Chaos Orb", "Worthless Orb")
+
+
+def test_batch_values_through_anchor_and_plain_columns(book):
+    names = ["Headhunter", "nothing", "Unpriced", "headhunter"]
+    divine = book.values(names, to="Divine Orb")  # Anchor column
+    assert divine[0] == divine[3] == 20.0
+    assert math.isnan(divine[1]) and math.isnan(divine[2])
+    in_headhunters = book.values(["Divine Orb"], to="Headhunter")  # Not an anchor
+    assert in_headhunters[0] == 200.0 / 4000.0
+    assert book.total(names, "Divine Orb") == 40.0
+
+
+def test_zero_priced_target_currency(book):
+    # value() returns None for it; the batch methods raise like rate() does.
+    assert book.value("Headhunter", "Worthless Orb") is None
+    with pytest.raises(KeyError):
+        book.values(["Headhunter"], to="Worthless Orb")
+    with pytest.raises(KeyError):
+        book.total(["Headhunter"], to="Worthless Orb")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_from_snapshot_skips_nameless_lines_and_null_prices(lazy):
+    currency = fixtures.currency_overview(5)
+    currency["lines"][0]["chaosEquivalent"] = None
+    currency["lines"][1]["currencyTypeName"] = None
+    items = fixtures.item_overview(5)
+    for index, line in enumerate(items["lines"]):
+        line["name"] = f"Unique {index}"
+    items["lines"][0]["name"] = None
+    items["lines"][1]["chaosValue"] = None
+    snapshot = LeagueSnapshot(
+        "Standard",
+        currency={
+            CurrencyType.CURRENCY: parse_currency_overview_response(currency, lazy=lazy)
+        },
+        items={ItemType.UNIQUE_ARMOUR: parse_item_overview_response(items, lazy=lazy)},
+    )
+    book = PriceBook.from_snapshot(snapshot)
+    assert len(book) == 1 + 4 + 4
+    assert book.chaos_value("Chaos Orb") == 1.0
+    assert book.chaos_value(currency["lines"][0]["currencyTypeName"]) is None
+    assert book.chaos_value(items["lines"][1]["name"]) is None
+    assert book.chaos_value("Unique 2") == items["lines"][2]["chaosValue"]
@@ -0,0 +1,108 @@
+# tests/test_ratelimit.py
+import asyncio
+import socket
+import time
+
+import pytest
+
+from poe_ninja_client import AsyncPoENinja, ItemType
+from poe_ninja_client.exceptions import PoeNinjaRequestError
+from poe_ninja_client.ratelimit import RateLimiter, RetryPolicy, parse_retry_after
+
+
+def test_unthrottled_until_the_first_429():
+    limiter = RateLimiter()
+    started = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+        limiter.record_success()
+    assert time.monotonic() - started < 0.5
+    assert limiter.rate is None
+    assert limiter.throttled == 0
+
+
+def test_burst_then_rate():
+    limiter = RateLimiter(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    # Two from the burst, then four at 20 per second.
+    assert 0.15 <= time.monotonic() - started < 1.0
+    assert limiter.throttled > 0
+
+
+def test_penalize_backs_off_and_success_recovers_to_the_configured_rate():
+    limiter = RateLimiter(rate=10, min_rate=1)
+    limiter.penalize()
+    assert limiter.rate == 5
+    # 429s arriving together count as one signal.
+    limiter.penalize()
+    assert limiter.rate == 5
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.rate == 10
+
+
+def test_rate_learned_from_an_early_429_can_recover():
+    limiter = RateLimiter()
+    limiter.penalize()
+    assert limiter.rate == limiter.min_rate
+    assert limiter.max_rate is None
+    for _ in range(200):
+        limiter.record_success()
+    assert limiter.rate > 10
+
+
+def test_retry_after_pauses_callers():
+    limiter = RateLimiter(rate=100)
+    limiter.penalize(retry_after=0.2)
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.19
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)],
+)
+def test_parse_retry_after(header, expected):
+    assert parse_retry_after(header) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retry_policy():
+    policy = RetryPolicy(max_retries=2, backoff_base=1.0, backoff_max=1.5)
+    server_error = PoeNinjaRequestError("error", status_code=503)
+    assert 0 <= policy.delay_for(server_error, 0) <= 1.0
+    assert 0 <= policy.delay_for(server_error, 1) <= 1.5
+    assert policy.delay_for(server_error, 2) is None
+    assert policy.delay_for(PoeNinjaRequestError("error", status_code=404), 0) is None
+
+
+def test_async_stream_retries_connection_errors(server):
+    # A port nobody listens on: every attempt fails to connect.
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+
+    async def stream() -> AsyncPoENinja:
+        client = AsyncPoENinja(
+            "Standard", retry_policy=RetryPolicy(max_retries=2, backoff_base=0.01)
+        )
+        client.BASE_URL = f"http://127.0.0.1:{port}/api/data"
+        async with client:
+            with pytest.raises(PoeNinjaRequestError):
+                async for _ in client.iter_item_overview(ItemType.UNIQUE_ARMOUR):
+                    pass
+            # The slot taken by each failed attempt is given back.
+            client.BASE_URL = server.base_url
+            lines = [
+                line async for line in client.iter_item_overview(ItemType.UNIQUE_ARMOUR)
+            ]
+            assert len(lines) == 1000
+        return client
+
+    assert asyncio.run(stream()).retry_count == 2
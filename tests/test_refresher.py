@@ -0,0 +1,53 @@
+# tests/test_refresher.py
+import socket
+import time
+
+from poe_ninja_client import CurrencyType
+from poe_ninja_client.cache import make_cache_key
+from poe_ninja_client.ratelimit import RetryPolicy
+from poe_ninja_client.refresher import BackgroundRefresher
+
+KEY = make_cache_key("currencyoverview", {"league": "Standard", "type": "Currency"})
+
+
+def _unreachable_url() -> str:
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{unused.getsockname()[1]}/api/data"
+
+
+def test_expired_entries_are_served_from_the_refresher(client):
+    refresher = client.start_background_refresh([CurrencyType.CURRENCY], interval=60)
+    assert refresher.wait_until_ready(10)
+    first = refresher.get(CurrencyType.CURRENCY)
+    client.cache.get_entry(KEY).expires_at = 0.0
+    # The stale copy is handed out at once, without going to poe.ninja.
+    client.BASE_URL = _unreachable_url()
+    assert client.get_currency_overview(CurrencyType.CURRENCY) is first
+    assert client.transferred_count == 1
+
+
+def test_failed_refreshes_keep_the_last_good_overview(client):
+    client.retry_policy = RetryPolicy(max_retries=0)
+    changes = []
+    refresher = BackgroundRefresher(
+        client,
+        interval=0.05,
+        error_retry=0.05,
+        on_change=lambda *change: changes.append(change),
+    )
+    client.refresher = refresher
+    refresher.register(CurrencyType.CURRENCY)
+    with refresher:
+        assert refresher.wait_until_ready(10)
+        first = refresher.get(CurrencyType.CURRENCY)
+        client.BASE_URL = _unreachable_url()
+        deadline = time.monotonic() + 10
+        while refresher.error(CurrencyType.CURRENCY) is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert refresher.get(CurrencyType.CURRENCY) is first
+        client.cache.get_entry(KEY).expires_at = 0.0
+        assert client.get_currency_overview(CurrencyType.CURRENCY) is first
+    # Revalidations returned the same overview, so nothing changed.
+    assert changes == []
@@ -0,0 +1,39 @@
+# tests/test_revalidation.py
+import asyncio
+
+from poe_ninja_client import AsyncPoENinja, CurrencyType
+from poe_ninja_client.cache import make_cache_key
+
+PARAMS = {"league": "Standard", "type": "Currency"}
+
+
+def _expire(client) -> None:
+    entry = client.cache.get_entry(make_cache_key("currencyoverview", PARAMS))
+    assert entry.etag is not None
+    entry.expires_at = 0.0
+
+
+def test_304_serves_the_cached_entry_and_refreshes_its_ttl(client):
+    first = client.get_currency_overview(CurrencyType.CURRENCY)
+    _expire(client)
+    assert client.get_currency_overview(CurrencyType.CURRENCY) is first
+    assert (client.transferred_count, client.revalidated_count) == (1, 1)
+    assert client.cache.get_entry(make_cache_key("currencyoverview", PARAMS)).fresh
+    # Fresh again: served from memory without a request.
+    assert client.get_currency_overview(CurrencyType.CURRENCY) is first
+    assert client.revalidated_count == 1
+
+
+def test_async_304_serves_the_cached_entry_and_refreshes_its_ttl(server):
+    async def fetch_twice() -> AsyncPoENinja:
+        async with AsyncPoENinja("Standard") as client:
+            client.BASE_URL = server.base_url
+            first = await client.get_currency_overview(CurrencyType.CURRENCY)
+            _expire(client)
+            assert await client.get_currency_overview(CurrencyType.CURRENCY) is first
+            key = make_cache_key("currencyoverview", PARAMS)
+            assert client.cache.get_entry(key).fresh
+        return client
+
+    client = asyncio.run(fetch_twice())
+    assert (client.transferred_count, client.revalidated_count) == (1, 1)
@@ -0,0 +1,85 @@
+# tests/test_singleflight.py
+import threading
+import time
+
+import pytest
+
+from poe_ninja_client.singleflight import SingleFlight
+
+
+def _wait_for(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _run_waiters(
+    flight: SingleFlight, count: int, fn
+) -> tuple[list, list, list[threading.Thread]]:
+    """Starts a leader running `fn`, then `count` callers that join it."""
+    results: list = []
+    errors: list = []
+
+    def call() -> None:
+        try:
+            results.append(flight.do("key", fn))
+        except Exception as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    _wait_for(lambda: flight.in_flight)
+    followers = [threading.Thread(target=call) for _ in range(count)]
+    for thread in followers:
+        thread.start()
+    return results, errors, [leader, *followers]
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn() -> object:
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results, errors, threads = _run_waiters(flight, 8, fn)
+    _wait_for(lambda: flight.coalesced == 8)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert calls == [1]
+    assert results == ["result"] * 9
+    assert not errors
+    assert flight.in_flight == 0
+
+
+def test_waiters_receive_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+    error = RuntimeError("boom")
+
+    def fn() -> object:
+        release.wait(5)
+        raise error
+
+    results, errors, threads = _run_waiters(flight, 3, fn)
+    _wait_for(lambda: flight.coalesced == 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert not results
+    assert errors == [error] * 4
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    values = iter(range(3))
+    assert [flight.do("key", lambda: next(values)) for _ in range(3)] == [0, 1, 2]
+    assert flight.coalesced == 0
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: int("x"))
+    assert flight.in_flight == 0
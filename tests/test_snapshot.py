@@ -0,0 +1,56 @@
+# tests/test_snapshot.py
+import asyncio
+
+from poe_ninja_client import AsyncPoENinja, CurrencyType, ItemType
+
+# The categories the local server has fixtures for; all others answer 404.
+SERVED_CURRENCY = {CurrencyType.CURRENCY, CurrencyType.FRAGMENT}
+SERVED_ITEMS = {ItemType.UNIQUE_ARMOUR, ItemType.BASE_TYPE}
+
+
+def _check_sweep(snapshot) -> None:
+    assert snapshot.league == "Standard"
+    assert set(snapshot.currency) == SERVED_CURRENCY
+    assert set(snapshot.items) == SERVED_ITEMS
+    # Failed categories are recorded, not raised.
+    assert snapshot.has_errors
+    assert set(snapshot.currency_errors) == set(CurrencyType) - SERVED_CURRENCY
+    assert set(snapshot.item_errors) == set(ItemType) - SERVED_ITEMS
+    assert all(e.status_code == 404 for e in snapshot.item_errors.values())
+    assert len(snapshot.items[ItemType.BASE_TYPE].lines) == 20_000
+
+
+def test_full_league_sweep(client):
+    snapshot = client.get_league_snapshot()
+    _check_sweep(snapshot)
+    assert len(snapshot) == sum(1 for _ in snapshot.iter_lines())
+    # Currencies win over items of the same name.
+    assert snapshot.category_of("divine orb") is CurrencyType.CURRENCY
+    assert snapshot.find("Divine Orb").chaosEquivalent == 200.0
+    assert snapshot.find_by_details_id("ITEM-3").name == "Item 1"
+    assert snapshot.find("No Such Item") is None
+
+
+def test_selected_categories(client):
+    snapshot = client.get_league_snapshot(
+        currency_types=[CurrencyType.CURRENCY], item_types=[ItemType.UNIQUE_ARMOUR]
+    )
+    assert not snapshot.has_errors
+    assert list(snapshot.currency) == [CurrencyType.CURRENCY]
+    assert list(snapshot.items) == [ItemType.UNIQUE_ARMOUR]
+    assert snapshot.items[ItemType.UNIQUE_ARMOUR] is client.get_item_overview(
+        ItemType.UNIQUE_ARMOUR
+    )
+
+
+def test_async_full_league_sweep(server, client):
+    async def sweep():
+        async with AsyncPoENinja("Standard", max_concurrency=4) as async_client:
+            async_client.BASE_URL = server.base_url
+            return await async_client.get_league_snapshot()
+
+    snapshot = asyncio.run(sweep())
+    _check_sweep(snapshot)
+    assert snapshot.items[ItemType.UNIQUE_ARMOUR].lines == client.get_item_overview(
+        ItemType.UNIQUE_ARMOUR
+    ).lines
@@ -0,0 +1,56 @@
+# tests/test_stats.py
+import pytest
+
+from poe_ninja_client import CurrencyType, ItemType, PoENinja
+from poe_ninja_client.exceptions import PoeNinjaRequestError
+
+
+def test_calls_are_counted_by_source(client):
+    events = []
+    client.add_hook(events.append)
+    stats = client.enable_stats()
+    overview = client.get_currency_overview(CurrencyType.CURRENCY)  # network
+    client.get_currency_overview(CurrencyType.CURRENCY)  # cache
+    lines = list(client.iter_item_overview(ItemType.UNIQUE_ARMOUR))  # stream
+    with pytest.raises(PoeNinjaRequestError):
+        client.get_item_overview(ItemType.DIVINATION_CARD)  # 404: not served
+    assert [event.source for event in events] == [
+        "network",
+        "cache",
+        "stream",
+        "network",
+    ]
+    currency = stats.endpoint("currencyoverview")
+    assert (currency.calls, currency.transferred, currency.cache_hits) == (2, 1, 1)
+    assert currency.cache_misses == 1
+    assert currency.cache_hit_ratio == 0.5
+    assert currency.bytes > 0 and currency.lines == len(overview.lines)
+    items = stats.endpoint("itemoverview")
+    assert (items.calls, items.transferred, items.errors) == (2, 1, 1)
+    assert items.lines == len(lines) == 1000
+    assert stats.total().calls == 4
+
+
+def test_disk_and_revalidated_sources(server, tmp_path):
+    def fresh_client() -> PoENinja:
+        client = PoENinja("Standard", cache_path=tmp_path / "cache.sqlite")
+        client.BASE_URL = server.base_url
+        return client
+
+    with fresh_client() as first:
+        first.get_currency_overview(CurrencyType.CURRENCY)
+    with fresh_client() as second:
+        stats = second.enable_stats()
+        second.get_currency_overview(CurrencyType.CURRENCY)  # disk
+        assert stats.endpoint("currencyoverview").disk_hits == 1
+    with fresh_client() as third:
+        third.disk_cache.ttls["currencyoverview"] = 0.0  # The disk copy is stale
+        stats = third.enable_stats()
+        third.get_currency_overview(CurrencyType.CURRENCY)  # revalidated
+        currency = stats.endpoint("currencyoverview")
+        assert (currency.revalidated, currency.disk_hits, currency.transferred) == (
+            1,
+            0,
+            0,
+        )
+        assert third.revalidated_count == 1
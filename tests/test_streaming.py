@@ -0,0 +1,99 @@
+# tests/test_streaming.py
+import asyncio
+import json
+import random
+
+import pytest
+
+import fixtures
+from fixtures import Fixture
+from local_server import LocalPoeNinja
+from poe_ninja_client import AsyncPoENinja, ItemType, PoENinja
+from poe_ninja_client.models import parse_item_overview_response
+from poe_ninja_client.streaming import JsonArrayStream
+
+DOCUMENT = {
+    "language": {"name": "en", "nested": [1, 2, {"lines": 5}]},
+    "lines": [
+        {"id": index, "text": 'é"]}' * (index % 3), "value": index + 0.5}
+        for index in range(50)
+    ]
+    + [1.5, 12345, None, "x", True],
+    "tail": 123,
+}
+BODY = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+
+def _stream(chunks) -> list:
+    stream = JsonArrayStream("lines")
+    elements = []
+    for chunk in chunks:
+        elements += stream.feed(chunk)
+    return elements + stream.close()
+
+
+def test_whole_body():
+    assert _stream([BODY]) == DOCUMENT["lines"]
+
+
+def test_one_byte_chunks():
+    # Splits every string, number, escape and multi-byte character.
+    assert _stream(BODY[i : i + 1] for i in range(len(BODY))) == DOCUMENT["lines"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_chunk_boundaries(seed):
+    rng = random.Random(seed)
+    chunks = []
+    position = 0
+    while position < len(BODY):
+        size = rng.randint(1, 40)
+        chunks.append(BODY[position : position + size])
+        position += size
+    assert _stream(chunks) == DOCUMENT["lines"]
+
+
+def test_number_at_a_chunk_boundary():
+    assert _stream([b'{"lines": [12', b"34.5, 6", b"]}"]) == [1234.5, 6]
+
+
+def test_truncated_body():
+    stream = JsonArrayStream("lines")
+    stream.feed(BODY[:-10])
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_not_an_object():
+    with pytest.raises(ValueError):
+        JsonArrayStream("lines").feed(b"[1, 2]")
+
+
+def test_iter_item_overview_matches_the_eager_parser():
+    payload = fixtures.item_overview(300)
+    payload["lines"][5:5] = [None, 7, "not a line"]
+    body = fixtures.encode(payload)
+    served = [Fixture("items", "itemoverview", {"type": "UniqueArmour"}, body)]
+    with LocalPoeNinja(served) as server:
+        client = PoENinja("Standard", use_cache=False)
+        client.BASE_URL = server.base_url
+        try:
+            streamed = list(client.iter_item_overview(ItemType.UNIQUE_ARMOUR))
+        finally:
+            client.close()
+    assert streamed == list(parse_item_overview_response(json.loads(body)).lines)
+
+
+def test_async_iter_item_overview_matches_the_eager_parser(server, client):
+    async def stream() -> list:
+        async with AsyncPoENinja("Standard", use_cache=False) as async_client:
+            async_client.BASE_URL = server.base_url
+            return [
+                line
+                async for line in async_client.iter_item_overview(
+                    ItemType.UNIQUE_ARMOUR
+                )
+            ]
+
+    eager = client.get_item_overview(ItemType.UNIQUE_ARMOUR)
+    assert asyncio.run(stream()) == list(eager.lines)
@@ -0,0 +1,72 @@
+# tests/test_string_table.py
+import threading
+
+import fixtures
+from poe_ninja_client.models import StringTable, parse_item_overview_response
+
+
+def _copy(value: str) -> str:
+    """An equal string that is a different object."""
+    return "".join(list(value))
+
+
+def test_equal_strings_share_one_copy():
+    table = StringTable()
+    first = _copy("Headhunter")
+    assert table.intern(first) is first
+    assert table.intern(_copy("Headhunter")) is first
+    assert "Headhunter" in table
+    assert len(table) == 1
+
+
+def test_non_strings_are_returned_as_is():
+    table = StringTable()
+    modifiers = [{"text": "x"}]
+    assert table.intern(None) is None
+    assert table.intern(5) == 5
+    assert table.intern(modifiers) is modifiers
+    assert len(table) == 0
+
+
+def test_full_table_drops_its_oldest_strings():
+    table = StringTable(max_size=8)
+    for index in range(20):
+        table.intern(f"s{index}")
+    assert len(table) < 8
+    assert "s19" in table
+    assert "s0" not in table
+    table.clear()
+    assert len(table) == 0
+    assert table.intern(None) is None
+
+
+def test_concurrent_interning_with_eviction():
+    table = StringTable(max_size=1000)
+    errors = []
+
+    def work(thread: int) -> None:
+        try:
+            for index in range(20_000):
+                value = f"{thread}-{index % 3000}"
+                assert table.intern(value) == value
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+    assert not errors
+    assert len(table) <= 1000
+
+
+def test_parsed_polls_share_strings():
+    table = StringTable()
+    first = parse_item_overview_response(fixtures.item_overview(50), strings=table)
+    second = parse_item_overview_response(fixtures.item_overview(50), strings=table)
+    for old, new in zip(first.lines, second.lines):
+        assert old == new
+        for name in StringTable.INTERNED_FIELDS:
+            if isinstance(getattr(old, name), str):
+                assert getattr(old, name) is getattr(new, name)